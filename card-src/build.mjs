@@ -1,10 +1,39 @@
 import { build, context } from "esbuild";
-import { readFileSync } from "node:fs";
+import { readFileSync, writeFileSync } from "node:fs";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
 
 const watch = process.argv.includes("--watch");
 const packageJson = JSON.parse(readFileSync(new URL("./package.json", import.meta.url)));
 const cardVersion = packageJson.version;
 
+const outfile = "../custom_components/webastoconnect/card/webasto-connect-card.js";
+
+// Home Assistant serves these to clients accepting gzip or brotli.
+function writeCompressedVariants() {
+  const content = readFileSync(outfile);
+  writeFileSync(`${outfile}.gz`, gzipSync(content, { level: 9 }));
+  writeFileSync(
+    `${outfile}.br`,
+    brotliCompressSync(content, {
+      params: {
+        [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+        [constants.BROTLI_PARAM_SIZE_HINT]: content.length,
+      },
+    }),
+  );
+}
+
+const compressPlugin = {
+  name: "compress",
+  setup(build) {
+    build.onEnd((result) => {
+      if (result.errors.length === 0) {
+        writeCompressedVariants();
+      }
+    });
+  },
+};
+
 const buildOptions = {
   entryPoints: ["webasto-connect-card.js"],
   bundle: true,
@@ -12,11 +41,12 @@ const buildOptions = {
   target: ["es2020"],
   minify: true,
   sourcemap: false,
-  outfile: "../custom_components/webastoconnect/card/webasto-connect-card.js",
+  outfile,
   logLevel: "info",
   loader: {
     ".json": "json",
   },
+  plugins: [compressPlugin],
   banner: {
     js: `globalThis.__WEBASTO_CONNECT_CARD_VERSION__ = "${cardVersion}";`,
   },
@@ -1,19 +1,13 @@
 """Add Webasto ThermoConnect support to Home Assistant."""
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from datetime import datetime
 import logging
 from pathlib import Path
-from typing import Any, TypeAlias
+from typing import Any
 
-from homeassistant.components.lovelace.const import (
-    CONF_RESOURCE_TYPE_WS,
-    LOVELACE_DATA,
-    MODE_STORAGE,
-)
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import CONF_EMAIL, CONF_TYPE, CONF_URL
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -22,7 +16,9 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import issue_registry as ir
-from homeassistant.loader import async_get_integration
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.loader import Integration, async_get_integration
 from homeassistant.util import slugify as util_slugify
 from pywebasto.enums import Request
 from pywebasto.exceptions import InvalidRequestException, UnauthorizedException
@@ -38,36 +34,45 @@ except ImportError:
     InvalidResponseException = InvalidRequestException
     TooManyRequestsException = InvalidRequestException
 
-from .api import WebastoConnectUpdateCoordinator
-from .base import webasto_device_name
-from .card_install import ensure_card_installed
-from .const import CARD_FILENAME, CARD_WWW_SUBDIR, DOMAIN, PLATFORMS, STARTUP
-from .services import async_register_services, async_unregister_services
+from .api import (
+    WebastoConfigEntry,
+    WebastoConnectUpdateCoordinator,
+    WebastoRuntimeData,
+    _credential_store_path,
+    webasto_device_name,
+)
+from .const import (
+    CARD_FILENAME,
+    CARD_SOURCE_DIR,
+    CARD_URL_PATH,
+    CARD_WWW_SUBDIR,
+    DOMAIN,
+    PLATFORMS,
+    STARTUP,
+)
+from .credentials import async_remove_credential_store
+from .device_index import async_get_device_index
+from .retry import classify_failure
+from .snapshot import DeviceSnapshotStore
 
 LOGGER = logging.getLogger(__name__)
 PENDING_APPROVAL_ISSUE_ID = "pending_approval"
-
-
-@dataclass(slots=True)
-class WebastoRuntimeData:
-    """Runtime data for the Webasto config entry."""
-
-    coordinator: WebastoConnectUpdateCoordinator
-    update_listener: Callable[[], None]
-
-
-WebastoConfigEntry: TypeAlias = ConfigEntry[WebastoRuntimeData]
+DATA_CARD_VIEW = f"{DOMAIN}_card_view"
+DATA_LEGACY_CARD_REMOVED = f"{DOMAIN}_legacy_card_removed"
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: WebastoConfigEntry) -> bool:
     """Set up cloud API connector from a config entry."""
     coordinator = await _async_setup(hass, entry)
-    async_register_services(hass)
+    # Imported on first setup, keeping the package import cheap for config flows.
+    services = await async_import_module(hass, f"{__name__}.services")
+    services.async_register_services(hass)
     update_listener = entry.add_update_listener(async_reload_entry)
     entry.runtime_data = WebastoRuntimeData(
         coordinator=coordinator,
         update_listener=update_listener,
     )
+    async_get_device_index(hass).async_add(entry.entry_id, coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -89,6 +94,10 @@ async def _async_migrate_unique_ids(
         entity_unique_id = entity_entry.unique_id
         entity_name = entity_entry.original_name
 
+        if entity_unique_id.startswith(f"{entry.entry_id}_"):
+            # Account entities are not tied to a heater.
+            return None
+
         if heater_name.lower() not in str(entity_entry.suggested_object_id):
             LOGGER.debug(
                 "Skipping entity '%s' during migration, heater name '%s' not found in '%s'",
@@ -194,57 +203,110 @@ async def _async_setup(
         STARTUP,
         integration.version,
     )
-    LOGGER.debug(
-        "Checking Webasto Connect Card installation status for /local/webastoconnect/%s",
-        CARD_FILENAME,
-    )
-    installed, card_version, card_hash = await hass.async_add_executor_job(
-        ensure_card_installed,
-        Path(integration.file_path),
-        Path(hass.config.path("www")),
-    )
-    if installed:
-        LOGGER.info(
-            "Installed Webasto Connect Card v%s at /local/webastoconnect/%s",
-            card_version,
-            CARD_FILENAME,
+    await _async_register_card(hass, integration)
+
+    coordinator = WebastoConnectUpdateCoordinator(hass, entry, integration.version)
+    if (
+        not coordinator.cloud_session.connected
+        and (
+            device_names := await coordinator.snapshot_store.async_restore(
+                coordinator.cloud
+            )
         )
-    elif card_version is None:
+        is not None
+    ):
+        # Create entities from the last good data, the cloud catches up later.
+        LOGGER.debug("Setting up Webasto devices from the stored snapshot")
+        coordinator.device_names = device_names
+        _async_connect_in_background(hass, entry, coordinator)
+        return coordinator
+
+    await _async_connect(entry, coordinator)
+    await _async_finish_setup(hass, entry, coordinator)
+    return coordinator
+
+
+async def _async_register_card(hass: HomeAssistant, integration: Integration) -> None:
+    """Serve the Webasto Connect card and register its Lovelace resource."""
+    card_install = await async_import_module(hass, f"{__name__}.card_install")
+    card_path = Path(integration.file_path) / CARD_SOURCE_DIR / CARD_FILENAME
+    card_version, card_hash = await hass.async_add_executor_job(
+        card_install.read_card_info, card_path
+    )
+    if card_hash is None:
         LOGGER.warning(
-            "Webasto Connect Card assets not found in integration package; skipping install"
+            "Webasto Connect Card assets not found in integration package; skipping"
         )
-    else:
+        return
+
+    if DATA_CARD_VIEW not in hass.data:
+        hass.http.register_view(card_install.WebastoCardView(card_path, card_hash))
+        hass.data[DATA_CARD_VIEW] = True
         LOGGER.debug(
-            "Webasto Connect Card already up to date (v%s) at /local/webastoconnect/%s",
+            "Serving Webasto Connect Card v%s at %s",
             card_version,
-            CARD_FILENAME,
+            card_install.card_url(card_hash),
         )
-    await _async_ensure_lovelace_card_resource(hass, card_hash)
+    if (
+        await _async_ensure_lovelace_card_resource(hass, card_hash)
+        and DATA_LEGACY_CARD_REMOVED not in hass.data
+    ):
+        # Dashboards load the served card now. YAML mode resources may still
+        # point at the old copy, so it is only removed after the stored resource
+        # was moved.
+        hass.data[DATA_LEGACY_CARD_REMOVED] = True
+        www_path = Path(hass.config.path("www"))
+        if await hass.async_add_executor_job(card_install.remove_legacy_card, www_path):
+            LOGGER.info(
+                "Removed the Webasto Connect Card copy of older releases from %s",
+                www_path / CARD_WWW_SUBDIR,
+            )
 
-    coordinator = WebastoConnectUpdateCoordinator(hass, entry, integration.version)
+
+def _is_card_resource_url(url: str) -> bool:
+    """Return True for a Lovelace resource pointing at the Webasto Connect card."""
+    path = url.split("?", 1)[0]
+    return path == f"/local/{CARD_WWW_SUBDIR}/{CARD_FILENAME}" or (
+        path.startswith(f"{CARD_URL_PATH}/") and path.endswith(f"/{CARD_FILENAME}")
+    )
+
+
+async def _async_connect(
+    entry: WebastoConfigEntry, coordinator: WebastoConnectUpdateCoordinator
+) -> None:
+    """Connect to the Webasto cloud, mapping failures to setup errors."""
     try:
-        await coordinator.cloud.connect()
+        await coordinator.async_connect_cloud()
         LOGGER.debug(
             "Connected to Webasto API for %s",
             entry.options.get(CONF_EMAIL, entry.data.get(CONF_EMAIL)),
         )
     except UnauthorizedException:
-        await coordinator.cloud.close()
+        await coordinator.async_close_cloud()
         raise ConfigEntryAuthFailed("Invalid email or password specified") from None
     except (InvalidRequestException, ForbiddenException) as err:
-        await coordinator.cloud.close()
+        await coordinator.async_close_cloud()
         raise ConfigEntryError(f"Webasto API rejected setup request: {err}") from err
     except InvalidResponseException as err:
-        await coordinator.cloud.close()
+        await coordinator.async_close_cloud()
         raise ConfigEntryNotReady(
             f"Error connecting to the API - try again later: {err}"
         ) from err
     except TooManyRequestsException as err:
-        await coordinator.cloud.close()
+        await coordinator.async_close_cloud()
         raise ConfigEntryError(
             f"Rate limited - reload the integration later: {err}"
         ) from err
 
+
+async def _async_finish_setup(
+    hass: HomeAssistant,
+    entry: WebastoConfigEntry,
+    coordinator: WebastoConnectUpdateCoordinator,
+    *,
+    background: bool = False,
+) -> None:
+    """Check the connected devices and publish their data."""
     webapi_device_names = await _async_webapi_device_names(coordinator)
     coordinator.device_names = webapi_device_names
 
@@ -272,7 +334,7 @@ async def _async_setup(
             translation_key="pending_approval",
             translation_placeholders={"devices": devices},
         )
-        await coordinator.cloud.close()
+        await coordinator.async_close_cloud()
         raise ConfigEntryError(
             "Webasto device association is pending approval in the ThermoConnect app"
         )
@@ -282,6 +344,8 @@ async def _async_setup(
     if coordinator.cloud.devices:
         # connect() already hydrated device state, avoid an immediate duplicate update call.
         coordinator.async_set_updated_data(None)
+    elif background:
+        await coordinator.async_refresh()
     else:
         await coordinator.async_config_entry_first_refresh()
 
@@ -292,23 +356,87 @@ async def _async_setup(
         # Migrate unique IDs
         await _async_migrate_unique_ids(hass, id, device_name, entry)
 
-    return coordinator
+
+@callback
+def _async_connect_in_background(
+    hass: HomeAssistant,
+    entry: WebastoConfigEntry,
+    coordinator: WebastoConnectUpdateCoordinator,
+) -> None:
+    """Connect and refresh restored devices without holding up setup."""
+    # Replaced by every retry, unloading the entry cancels the pending one.
+    cancel_retry: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_cancel_retry() -> None:
+        nonlocal cancel_retry
+        if cancel_retry is not None:
+            cancel_retry()
+            cancel_retry = None
+
+    @callback
+    def _async_retry(_now: datetime) -> None:
+        nonlocal cancel_retry
+        cancel_retry = None
+        _async_start()
+
+    async def _async_connect_and_refresh() -> None:
+        nonlocal cancel_retry
+        try:
+            await _async_connect(entry, coordinator)
+            await _async_finish_setup(hass, entry, coordinator, background=True)
+        except ConfigEntryAuthFailed as err:
+            coordinator.async_set_update_error(err)
+            entry.async_start_reauth(hass)
+        except (ConfigEntryError, ConfigEntryNotReady) as err:
+            retry_after = coordinator.retry_policy.record_failure(
+                classify_failure(err.__cause__ or err), err
+            )
+            LOGGER.warning(
+                "Could not connect to Webasto API, retrying in %s seconds: %s",
+                retry_after,
+                err,
+            )
+            coordinator.async_set_update_error(err)
+            cancel_retry = async_call_later(hass, retry_after, _async_retry)
+        else:
+            coordinator.retry_policy.record_success()
+
+    @callback
+    def _async_start() -> None:
+        entry.async_create_background_task(
+            hass,
+            _async_connect_and_refresh(),
+            f"{DOMAIN}_connect_{entry.entry_id}",
+        )
+
+    entry.async_on_unload(_async_cancel_retry)
+    _async_start()
 
 
 async def _async_ensure_lovelace_card_resource(
-    hass: HomeAssistant, card_hash: str | None
-) -> None:
-    """Ensure the Webasto Connect card resource exists in Lovelace storage mode."""
-    resource_base_url = f"/local/{CARD_WWW_SUBDIR}/{CARD_FILENAME}"
-    resource_url = (
-        f"{resource_base_url}?v={card_hash}" if card_hash else resource_base_url
+    hass: HomeAssistant, card_hash: str
+) -> bool:
+    """Ensure the Webasto Connect card resource exists in Lovelace storage mode.
+
+    Return True when the stored resources point at the served card.
+    """
+    # Lovelace is set up before this integration, the import is a lookup.
+    from homeassistant.components.lovelace.const import (
+        CONF_RESOURCE_TYPE_WS,
+        LOVELACE_DATA,
+        MODE_STORAGE,
     )
 
+    from .card_install import card_url
+
+    resource_url = card_url(card_hash)
+
     if (lovelace_data := hass.data.get(LOVELACE_DATA)) is None:
         LOGGER.debug(
             "Lovelace not loaded yet; cannot auto-register resource %s", resource_url
         )
-        return
+        return False
 
     if lovelace_data.resource_mode != MODE_STORAGE:
         LOGGER.debug(
@@ -316,13 +444,11 @@ async def _async_ensure_lovelace_card_resource(
             lovelace_data.resource_mode,
             resource_url,
         )
-        return
+        return False
 
     resources = lovelace_data.resources
     for resource in resources.async_items() or []:
-        existing_url = resource.get(CONF_URL) or ""
-        existing_base_url = existing_url.split("?", 1)[0]
-        if existing_base_url != resource_base_url:
+        if not _is_card_resource_url(resource.get(CONF_URL) or ""):
             continue
 
         update_data: dict[str, str] = {}
@@ -336,12 +462,13 @@ async def _async_ensure_lovelace_card_resource(
             LOGGER.info("Updated Lovelace resource to %s", resource_url)
         else:
             LOGGER.debug("Lovelace resource already present for %s", resource_url)
-        return
+        return True
 
     await resources.async_create_item(
         {CONF_URL: resource_url, CONF_RESOURCE_TYPE_WS: "module"}
     )
     LOGGER.info("Created Lovelace resource for %s", resource_url)
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: WebastoConfigEntry) -> bool:
@@ -349,7 +476,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: WebastoConfigEntry) ->
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        await entry.runtime_data.coordinator.cloud.close()
+        async_get_device_index(hass).async_remove(entry.entry_id)
+        await entry.runtime_data.coordinator.async_close_cloud()
         entry.runtime_data.update_listener()
         loaded_entries = [
             config_entry
@@ -358,10 +486,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: WebastoConfigEntry) ->
             and config_entry.entry_id != entry.entry_id
         ]
         if not loaded_entries:
+            # Imported by setup already.
+            from .services import async_unregister_services
+
             async_unregister_services(hass)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: WebastoConfigEntry) -> None:
+    """Remove the stored data of a deleted config entry."""
+    await DeviceSnapshotStore(hass, entry.entry_id).async_remove()
+    await async_remove_credential_store(
+        hass, entry.entry_id, Path(_credential_store_path(hass, entry))
+    )
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: WebastoConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
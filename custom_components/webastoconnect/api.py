@@ -1,66 +1,128 @@
 """API connector class."""
 
-import asyncio
 from collections.abc import Awaitable, Callable
-import json
+from dataclasses import dataclass
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, TypeAlias, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from pywebasto import WebastoConnect
-from pywebasto.exceptions import InvalidRequestException, UnauthorizedException
-
-try:
-    from pywebasto.exceptions import (
-        ForbiddenException,
-        InvalidResponseException,
-        TooManyRequestsException,
-    )
-except ImportError:
-    ForbiddenException = InvalidRequestException
-    InvalidResponseException = InvalidRequestException
-    TooManyRequestsException = InvalidRequestException
+from pywebasto import WebastoConnect, WebastoDevice
+from pywebasto.exceptions import UnauthorizedException
 
+from .budget import (
+    COMMAND_REQUEST_COST,
+    POLL_REQUEST_COST,
+    RequestBudget,
+    async_get_request_budget,
+)
 from .const import DOMAIN
+from .credentials import async_get_credential_store
+from .location import LocationTrail
+from .payload import OUTPUT_DATA_KEYS, DevicePayload, normalize_payload
+from .retry import FailureClass, RetryPolicy, classify_failure
+from .session import async_get_cloud_session
+from .snapshot import DeviceSnapshotStore
+from .timers import _next_timer_run_utc
 
 SCAN_INTERVAL = timedelta(seconds=60)
+ACTIVE_SCAN_INTERVAL = timedelta(seconds=15)
+IDLE_SCAN_INTERVAL = timedelta(minutes=5)
+TIMER_LEAD_TIME = timedelta(minutes=10)
+# Devices need a few seconds before a command shows up in the cloud payload.
+CONFIRMATION_REFRESH_DELAY = timedelta(seconds=5)
+DEVICE_DATA_SECTIONS = ("last_data", "settings", "dev_data")
+# Payload fields the name and device info of a device are derived from.
+DEVICE_CONTEXT_DATA_KEYS = frozenset(
+    {"settings", "dev_data.name", "dev_data.alias", "last_data.name", "last_data.alias"}
+)
 LOGGER = logging.getLogger(__name__)
 _T = TypeVar("_T")
+_MISSING = object()
 
+_FAILURE_MESSAGES = {
+    FailureClass.RATE_LIMITED: "Webasto API rate limited: {err}",
+    FailureClass.TEMPORARY: "Webasto API temporary failure: {err}",
+    FailureClass.NETWORK: "Webasto API network failure ({err_type}): {err}",
+    FailureClass.REQUEST: "Webasto API request failed: {err}",
+    FailureClass.UNEXPECTED: "Unexpected update failure ({err_type}): {err}",
+}
 
-def _credential_store_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
-    """Return the pywebasto app credential store path for a config entry."""
-    return hass.config.path(".storage", f"webasto_{entry.entry_id}.json")
 
+def webasto_device_name(device: WebastoDevice, fallback_name: str | None = None) -> str:
+    """Return the configured device name."""
+    for data in (getattr(device, "dev_data", None), getattr(device, "app_data", None)):
+        if not isinstance(data, dict):
+            continue
+        if name := data.get("name") or data.get("alias"):
+            return str(name)
+
+    if fallback_name:
+        return fallback_name
+
+    return device.name
 
-def _load_credentials(path: Path) -> dict[str, str] | None:
-    """Load pywebasto app credentials."""
-    if not path.exists():
-        return None
 
-    with path.open(encoding="utf-8") as credential_file:
-        return json.load(credential_file)
-
-
-def _save_credentials(path: Path, credentials: Any) -> None:
-    """Save pywebasto app credentials."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as credential_file:
-        json.dump(
-            {
-                "client_id": credentials.client_id,
-                "client_secret": credentials.client_secret,
-            },
-            credential_file,
-            indent=2,
+@dataclass(slots=True)
+class WebastoDeviceContext:
+    """Name and device info of a device, shared by all of its entities.
+
+    The coordinator refreshes it in place when names or settings change.
+    """
+
+    device_id: Any
+    name: str
+    unique_id_prefix: str
+    device_info: DeviceInfo
+
+    @classmethod
+    def from_device(
+        cls, device_id: Any, device: WebastoDevice, fallback_name: str | None
+    ) -> "WebastoDeviceContext":
+        """Build the context of a device."""
+        context = cls(device_id, "", "", DeviceInfo())
+        context.refresh(device, fallback_name)
+        return context
+
+    def refresh(self, device: WebastoDevice, fallback_name: str | None) -> bool:
+        """Derive name and device info from the device data.
+
+        Returns True when a field kept in the device registry changed.
+        """
+        registry_fields = self.registry_fields()
+        settings = device.settings or {}
+        self.name = webasto_device_name(device, fallback_name)
+        self.unique_id_prefix = f"{device.device_id}_"
+        self.device_info.update(
+            identifiers={(DOMAIN, str(self.device_id))},
+            name=self.name,
+            model="ThermoConnect",
+            manufacturer="Webasto",
+            hw_version=settings.get("hw_version", "Unknown"),
+            sw_version=settings.get("sw_version", "Unknown"),
+            configuration_url="https://my.webastoconnect.com",
         )
-        credential_file.write("\n")
+        return self.registry_fields() != registry_fields
+
+    def registry_fields(self) -> dict[str, Any]:
+        """Return the device info fields that can change after setup."""
+        return {
+            field: self.device_info.get(field)
+            for field in ("name", "hw_version", "sw_version")
+        }
+
+
+def _credential_store_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the pywebasto app credential store path for a config entry."""
+    return hass.config.path(".storage", f"webasto_{entry.entry_id}.json")
 
 
 def _credential_callbacks(
@@ -68,16 +130,114 @@ def _credential_callbacks(
 ) -> tuple[
     Callable[[], Awaitable[dict[str, str] | None]], Callable[[Any], Awaitable[None]]
 ]:
-    """Return pywebasto credential callbacks."""
-    path = Path(_credential_store_path(hass, entry))
+    """Return pywebasto credential callbacks backed by the shared entry store."""
+    store = async_get_credential_store(
+        hass, entry.entry_id, Path(_credential_store_path(hass, entry))
+    )
+    return store.async_load, store.async_save
+
+
+@dataclass(frozen=True, slots=True)
+class WebastoListenerContext:
+    """Coordinator listener context describing which device data an entity uses.
+
+    ``data_keys`` holds section names (``settings``) or section fields
+    (``last_data.outputs``); ``None`` means any change on the device.
+    """
+
+    device_id: Any
+    data_keys: frozenset[str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WebastoBudgetListenerContext:
+    """Coordinator listener context of entities showing the request budget.
 
-    async def credential_load() -> dict[str, str] | None:
-        return await hass.async_add_executor_job(_load_credentials, path)
+    These listeners are notified only when the budget values of the entry change.
+    """
 
-    async def credential_save(credentials: Any) -> None:
-        await hass.async_add_executor_job(_save_credentials, path, credentials)
 
-    return credential_load, credential_save
+def _device_sections(device: Any) -> dict[str, Any]:
+    """Return the raw payload sections of a device."""
+    return {section: getattr(device, section, None) for section in DEVICE_DATA_SECTIONS}
+
+
+def _changed_data_keys(
+    previous: dict[str, Any] | None, current: dict[str, Any]
+) -> frozenset[str] | None:
+    """Return changed fields and their sections, or None when all data is new.
+
+    pywebasto replaces the section dicts on every poll, unchanged sections are
+    mostly the same object and changed ones are compared field by field.
+    """
+    if previous is None:
+        return None
+
+    changed: set[str] = set()
+    for section, data in current.items():
+        old = previous.get(section)
+        if old is data:
+            continue
+        old_fields = old if isinstance(old, dict) else {}
+        fields = data if isinstance(data, dict) else {}
+        if old_fields is not old or fields is not data:
+            if old == data:
+                continue
+            changed.add(section)
+        for key in old_fields.keys() | fields.keys():
+            if old_fields.get(key, _MISSING) != fields.get(key, _MISSING):
+                changed.add(f"{section}.{key}")
+                changed.add(section)
+    return frozenset(changed)
+
+
+def _context_changed(
+    context: WebastoListenerContext,
+    changed_devices: dict[Any, frozenset[str] | None],
+) -> bool:
+    """Return True when data used by a listener context has changed."""
+    if context.device_id not in changed_devices:
+        return False
+
+    changed = changed_devices[context.device_id]
+    if changed is None or context.data_keys is None:
+        return True
+    return not context.data_keys.isdisjoint(changed)
+
+
+def _device_is_active(device: Any) -> bool:
+    """Return True when any output on the device is currently switched on."""
+    return any(
+        getattr(device, attribute, False) is True
+        for attribute in ("output_main", "output_aux1", "output_aux2")
+    )
+
+
+def _adaptive_update_interval(
+    devices: dict[Any, Any],
+    now_utc: datetime,
+    device_payload: Callable[[Any], DevicePayload] | None = None,
+) -> timedelta:
+    """Return the polling interval matching current device and timer activity."""
+    if not devices:
+        return SCAN_INTERVAL
+
+    interval = IDLE_SCAN_INTERVAL
+    for device_id, device in devices.items():
+        if _device_is_active(device):
+            return ACTIVE_SCAN_INTERVAL
+
+        payload = device_payload(device_id) if device_payload is not None else None
+        if (next_run := _next_timer_run_utc(device, now_utc, payload)) is None:
+            continue
+
+        # Wake up early enough to be polling quickly when the timer fires.
+        until_lead_time = next_run - TIMER_LEAD_TIME - now_utc
+        if until_lead_time <= timedelta(0):
+            return ACTIVE_SCAN_INTERVAL
+        interval = min(interval, until_lead_time)
+
+    return max(interval, ACTIVE_SCAN_INTERVAL)
 
 
 class WebastoConnectUpdateCoordinator(DataUpdateCoordinator[None]):
@@ -98,15 +258,212 @@ class WebastoConnectUpdateCoordinator(DataUpdateCoordinator[None]):
         self.hass = hass
         self.config_entry = entry
         credential_load, credential_save = _credential_callbacks(hass, entry)
-        self.cloud: WebastoConnect = WebastoConnect(
-            username=entry.options.get(CONF_EMAIL, entry.data.get(CONF_EMAIL)),
-            password=entry.options.get(CONF_PASSWORD, entry.data.get(CONF_PASSWORD)),
-            credential_load=credential_load,
-            credential_save=credential_save,
-            client_info=f"HomeAssistant-Webasto {version} {int(datetime.now().timestamp())}",
+        username = entry.options.get(CONF_EMAIL, entry.data.get(CONF_EMAIL))
+        self.request_budget: RequestBudget = async_get_request_budget(
+            hass, username or entry.entry_id
+        )
+        password = entry.options.get(CONF_PASSWORD, entry.data.get(CONF_PASSWORD))
+        self.cloud_session = async_get_cloud_session(
+            hass,
+            username or entry.entry_id,
+            password,
+            lambda: WebastoConnect(
+                username=username,
+                password=password,
+                credential_load=credential_load,
+                credential_save=credential_save,
+                client_info=f"HomeAssistant-Webasto {version} {int(datetime.now().timestamp())}",
+            ),
         )
-        self._cloud_operation_lock = asyncio.Lock()
+        self.cloud: WebastoConnect = self.cloud_session.cloud
+        self._cloud_locks = self.cloud_session.locks
+        self.timer_cache = self.cloud_session.timer_cache
+        # Raw payload sections of each device at the last notification.
+        self._device_sections: dict[Any, dict[str, Any]] = {}
+        self._last_notified_success: bool | None = None
+        self._confirmation_callbacks: dict[CALLBACK_TYPE, None] = {}
+        self._unsub_confirmation: CALLBACK_TYPE | None = None
+        self._force_next_update = False
+        self.retry_policy = RetryPolicy()
         self.device_names: dict[str, str] = {}
+        # Built when the first entity of a device asks for it.
+        self._device_contexts: dict[Any, WebastoDeviceContext] = {}
+        self._context_device_names = self.device_names
+        # Normalized payloads with the raw payload each was built from.
+        self._device_payloads: dict[Any, tuple[Any, DevicePayload]] = {}
+        self.snapshot_store = DeviceSnapshotStore(hass, entry.entry_id)
+        # Budget values last notified to the request budget sensors.
+        self._budget_state: tuple[int, int] | None = None
+        # Recorded by the device trackers, served by the get_location_trail service.
+        self._location_trails: dict[Any, LocationTrail] = {}
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose device data changed since the last notification."""
+        changed_devices: dict[Any, frozenset[str] | None] = {}
+        device_sections: dict[Any, dict[str, Any]] = {}
+        for device_id, device in self.cloud.devices.items():
+            device_sections[device_id] = _device_sections(device)
+            changed = _changed_data_keys(
+                self._device_sections.get(device_id), device_sections[device_id]
+            )
+            if changed is None or changed:
+                changed_devices[device_id] = changed
+        self._device_sections = device_sections
+        self._async_refresh_device_contexts(changed_devices)
+        self._async_drop_device_payloads(changed_devices)
+
+        if (
+            changed_devices
+            and self.last_update_success
+            and self.cloud_session.connected
+        ):
+            self.snapshot_store.async_schedule_save(self.cloud, self.device_names)
+
+        # Availability follows last_update_success, so every entity needs to know.
+        notify_all = self.last_update_success != self._last_notified_success
+        self._last_notified_success = self.last_update_success
+
+        budget_changed: bool | None = None
+        for update_callback, context in list(self._listeners.values()):
+            if isinstance(context, WebastoBudgetListenerContext):
+                if budget_changed is None:
+                    budget_changed = self._async_budget_changed()
+                if notify_all or budget_changed:
+                    update_callback()
+            elif (
+                notify_all
+                or not isinstance(context, WebastoListenerContext)
+                or _context_changed(context, changed_devices)
+            ):
+                update_callback()
+
+    @callback
+    def async_mark_device_edited(self, device_id: Any) -> None:
+        """Treat all data of a device as new after its payload was edited in place."""
+        self._device_sections.pop(device_id, None)
+
+    @callback
+    def _async_budget_changed(self) -> bool:
+        """Return True when the budget values shown for the entry changed."""
+        budget_state = (
+            self.request_budget.remaining_percent,
+            self.request_budget.entry_requests.get(self.config_entry.entry_id, 0),
+        )
+        changed = budget_state != self._budget_state
+        self._budget_state = budget_state
+        return changed
+
+    @callback
+    def device_context(self, device_id: Any) -> WebastoDeviceContext:
+        """Return the context shared by the entities of a device."""
+        if (context := self._device_contexts.get(device_id)) is None:
+            context = self._device_contexts[device_id] = (
+                WebastoDeviceContext.from_device(
+                    device_id,
+                    self.cloud.devices[device_id],
+                    self.device_names.get(str(device_id)),
+                )
+            )
+        return context
+
+    @callback
+    def location_trail(
+        self, device_id: Any, length: int | None = None
+    ) -> LocationTrail | None:
+        """Return the location trail of a device, creating it when a length is given."""
+        if (trail := self._location_trails.get(device_id)) is None and length:
+            trail = self._location_trails[device_id] = LocationTrail(length)
+        return trail
+
+    @callback
+    def device_payload(self, device_id: Any) -> DevicePayload:
+        """Return the normalized payload of a device, built once per payload."""
+        last_data = getattr(self.cloud.devices[device_id], "last_data", None)
+        cached = self._device_payloads.get(device_id)
+        if cached is None or cached[0] is not last_data:
+            cached = self._device_payloads[device_id] = (
+                last_data,
+                normalize_payload(last_data),
+            )
+        return cached[1]
+
+    @callback
+    def _async_drop_device_payloads(
+        self, changed_devices: dict[Any, frozenset[str] | None]
+    ) -> None:
+        """Drop normalized payloads whose outputs changed in place or are gone."""
+        if not self._device_payloads:
+            return
+
+        for device_id in list(self._device_payloads):
+            changed = changed_devices.get(device_id, frozenset())
+            if device_id not in self.cloud.devices or (
+                changed is None or not changed.isdisjoint(OUTPUT_DATA_KEYS)
+            ):
+                del self._device_payloads[device_id]
+
+    @callback
+    def _async_refresh_device_contexts(
+        self, changed_devices: dict[Any, frozenset[str] | None]
+    ) -> None:
+        """Refresh the contexts of devices whose names or settings changed."""
+        names_changed = self.device_names is not self._context_device_names
+        self._context_device_names = self.device_names
+        if not self._device_contexts:
+            return
+
+        for device_id, context in self._device_contexts.items():
+            if not names_changed and (
+                device_id not in changed_devices
+                or (
+                    (changed := changed_devices[device_id]) is not None
+                    and DEVICE_CONTEXT_DATA_KEYS.isdisjoint(changed)
+                )
+            ):
+                continue
+            if (device := self.cloud.devices.get(device_id)) is not None and (
+                context.refresh(device, self.device_names.get(str(device_id)))
+            ):
+                self._async_update_device_registry(context)
+
+    @callback
+    def _async_update_device_registry(self, context: WebastoDeviceContext) -> None:
+        """Push a changed name or firmware to the device registry.
+
+        The registry reads device_info only when an entity is added.
+        """
+        device_registry = dr.async_get(self.hass)
+        device_entry = device_registry.async_get_device(
+            identifiers={(DOMAIN, str(context.device_id))}
+        )
+        if device_entry is None:
+            return
+        device_registry.async_update_device(
+            device_entry.id, **context.registry_fields()
+        )
+
+    async def async_connect_cloud(self) -> None:
+        """Connect the shared cloud session and join its poll loop."""
+        # A failed earlier attempt closed the session, connect retries reopen it.
+        self.cloud_session.async_register()
+        await self.cloud_session.async_connect()
+        self.cloud_session.async_join(self)
+        if not self.cloud_session.is_leader(self):
+            # The session leader polls the account for every entry using it.
+            LOGGER.debug("Sharing the Webasto poll loop of another config entry")
+            self.update_interval = None
+
+    async def async_close_cloud(self) -> None:
+        """Leave the shared cloud session, closing it once no entry uses it."""
+        await self.cloud_session.async_leave(self)
+
+    @callback
+    def async_take_over_polling(self) -> None:
+        """Start polling after the previous session leader went away."""
+        self.update_interval = SCAN_INTERVAL
+        self._async_adapt_update_interval()
+        self._schedule_refresh()
 
     async def async_execute_cloud_call(
         self,
@@ -114,35 +471,158 @@ class WebastoConnectUpdateCoordinator(DataUpdateCoordinator[None]):
         *args: Any,
         **kwargs: Any,
     ) -> _T:
-        """Serialize cloud operations to avoid device context races."""
-        async with self._cloud_operation_lock:
-            return await cloud_call(*args, **kwargs)
+        """Run a cloud operation that uses shared session or device context."""
+        self.request_budget.consume(
+            self.config_entry.entry_id, COMMAND_REQUEST_COST, command=True
+        )
+        async with self._cloud_locks.session():
+            result = await cloud_call(*args, **kwargs)
+        self._async_adapt_update_interval()
+        return result
+
+    async def async_execute_device_call(
+        self,
+        device_id: Any,
+        cloud_call: Callable[..., Awaitable[_T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> _T:
+        """Run a cloud operation scoped to a single device.
+
+        Operations on other devices run concurrently.
+        """
+        self.request_budget.consume(
+            self.config_entry.entry_id, COMMAND_REQUEST_COST, command=True
+        )
+        async with self._cloud_locks.device(device_id):
+            result = await cloud_call(*args, **kwargs)
+        self._async_adapt_update_interval()
+        return result
+
+    @callback
+    def async_request_confirmation_refresh(self, reconcile: CALLBACK_TYPE) -> None:
+        """Refresh shortly after a command, then let the entity reconcile.
+
+        Requests arriving before the refresh runs share one forced refresh.
+        """
+        self._confirmation_callbacks[reconcile] = None
+        if self._unsub_confirmation is not None:
+            self._unsub_confirmation()
+        self._unsub_confirmation = async_call_later(
+            self.hass,
+            CONFIRMATION_REFRESH_DELAY,
+            self._async_confirm_commands,
+        )
+
+    async def _async_confirm_commands(self, _now: datetime) -> None:
+        """Fetch fresh device data and reconcile optimistic entity states."""
+        self._unsub_confirmation = None
+        callbacks = list(self._confirmation_callbacks)
+        self._confirmation_callbacks.clear()
+
+        self._force_next_update = True
+        await self.async_refresh()
+        for reconcile in callbacks:
+            reconcile()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending confirmation refreshes on shutdown."""
+        if self._unsub_confirmation is not None:
+            self._unsub_confirmation()
+            self._unsub_confirmation = None
+        self._confirmation_callbacks.clear()
+        await super().async_shutdown()
+
+    @callback
+    def _async_adapt_update_interval(self) -> None:
+        """Poll fast while outputs are on or timers are due, slowly otherwise."""
+        if not self.cloud_session.is_leader(self):
+            return
+
+        interval = max(
+            _adaptive_update_interval(
+                self.cloud.devices, datetime.now(UTC), self.device_payload
+            ),
+            self.request_budget.poll_interval_floor(),
+        )
+        current = self.update_interval
+        if interval == current:
+            return
+
+        LOGGER.debug(
+            "Changing Webasto polling interval from %s to %s", current, interval
+        )
+        self.update_interval = interval
+        # Outside a refresh cycle the next poll is already scheduled with the old
+        # interval, pull it in when the device just became active.
+        if (
+            current is not None
+            and interval < current
+            and self._unsub_refresh is not None
+        ):
+            self._schedule_refresh()
 
     async def _async_update_data(self) -> datetime | None:
         """Handle data update request from the coordinator."""
         LOGGER.debug("Data update called")
+        if not self.cloud_session.connected:
+            # Setup restored a snapshot and is still logging in in the background.
+            LOGGER.debug("Skipping Webasto poll until the cloud session is connected")
+            return None
+
+        # pywebasto reuses data younger than SCAN_INTERVAL unless forced.
+        confirming = self._force_next_update
+        self._force_next_update = False
+        force = confirming or (
+            self.update_interval is not None and self.update_interval < SCAN_INTERVAL
+        )
+        # Command confirmations are user initiated and may use the command reserve.
+        if not self.request_budget.consume(
+            self.config_entry.entry_id, POLL_REQUEST_COST, command=confirming
+        ):
+            LOGGER.debug("Skipping Webasto poll to stay within the request budget")
+            self._async_adapt_update_interval()
+            return None
+
         try:
-            await self.async_execute_cloud_call(self.cloud.update)
+            async with self._cloud_locks.session():
+                await self.cloud.update(force=force)
+            self.timer_cache.feed_devices(self.cloud.devices)
+            self._async_adapt_update_interval()
+            for follower in self.cloud_session.followers(self):
+                follower.async_set_updated_data(None)
         except UnauthorizedException as err:
             raise ConfigEntryAuthFailed("Authentication with Webasto failed") from err
-        except InvalidRequestException as err:
-            raise UpdateFailed(f"Webasto API request failed: {err}") from err
-        except (ForbiddenException, InvalidResponseException) as err:
-            raise UpdateFailed(
-                f"Webasto API temporary failure: {err}",
-                retry_after=300,
-            ) from err
-        except TooManyRequestsException as err:
-            raise UpdateFailed(
-                f"Webasto API rate limited: {err}",
-                retry_after=300,
-            ) from err
         except Exception as err:
-            LOGGER.exception(
-                "Unexpected error during Webasto update (%s)",
-                type(err).__name__,
+            failure_class = classify_failure(err)
+            retry_after = self.retry_policy.record_failure(failure_class, err)
+            if failure_class is FailureClass.UNEXPECTED:
+                LOGGER.exception(
+                    "Unexpected error during Webasto update (%s)",
+                    type(err).__name__,
+                )
+            elif failure_class is FailureClass.REQUEST:
+                LOGGER.debug("Webasto update request failed: %s", err)
+            else:
+                LOGGER.debug(
+                    "Webasto update failed (%s), retrying in %s seconds",
+                    failure_class,
+                    retry_after,
+                )
+            message = _FAILURE_MESSAGES[failure_class].format(
+                err=err, err_type=type(err).__name__
             )
-            raise UpdateFailed(
-                f"Unexpected update failure ({type(err).__name__}): {err}",
-                retry_after=300,
-            ) from err
+            raise UpdateFailed(message, retry_after=retry_after) from err
+
+        self.retry_policy.record_success()
+
+
+@dataclass(slots=True)
+class WebastoRuntimeData:
+    """Runtime data for the Webasto config entry."""
+
+    coordinator: WebastoConnectUpdateCoordinator
+    update_listener: Callable[[], None]
+
+
+WebastoConfigEntry: TypeAlias = ConfigEntry[WebastoRuntimeData]
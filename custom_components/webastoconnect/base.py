@@ -1,13 +1,16 @@
 """Base definitions."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from datetime import timedelta
+import logging
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntityDescription
 from homeassistant.components.number import NumberEntityDescription
 from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.components.switch import SwitchEntityDescription
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -16,22 +19,14 @@ from homeassistant.helpers.update_coordinator import (
 from homeassistant.util import slugify as util_slugify
 from pywebasto import WebastoConnect, WebastoDevice
 
-from .api import WebastoConnectUpdateCoordinator
-from .const import DOMAIN
+from .api import WebastoConnectUpdateCoordinator, WebastoListenerContext
+from .command_queue import CoalescingCommandQueue
+from .payload import DevicePayload
 
+LOGGER = logging.getLogger(__name__)
 
-def webasto_device_name(device: WebastoDevice, fallback_name: str | None = None) -> str:
-    """Return the configured device name."""
-    for data in (getattr(device, "dev_data", None), getattr(device, "app_data", None)):
-        if not isinstance(data, dict):
-            continue
-        if name := data.get("name") or data.get("alias"):
-            return str(name)
-
-    if fallback_name:
-        return fallback_name
-
-    return device.name
+# Raw payload fields (see api.DEVICE_DATA_SECTIONS) that entities depend on.
+CONNECTION_DATA_KEYS = ("last_data.connection_lost", "dev_data.connection_lost")
 
 
 @dataclass(frozen=True)
@@ -49,6 +44,7 @@ class WebastoConnectBinarySensorEntityDescription(
 
     icon_on: str | None = None
     icon_off: str | None = None
+    data_keys: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -56,8 +52,29 @@ class WebastoConnectSensorEntityDescription(SensorEntityDescription):
     """Describes a Webasto sensor."""
 
     value_fn: Callable[[Any], Any | None] | None = None
+    # Like value_fn, also given the normalized payload of the device.
+    payload_fn: Callable[[Any, DevicePayload], Any | None] | None = None
     unit_fn: Callable[[Any], Any] | None = None
     name_fn: Callable[[Any], str | bool] | None = None
+    data_keys: tuple[str, ...] | None = None
+    # Smaller numeric changes are written once min_interval has passed.
+    deadband: float | None = None
+    min_interval: timedelta | None = None
+    # Changes crossing this device value are always written at once.
+    threshold_fn: Callable[[Any], Any] | None = None
+    # Option keys overriding deadband and min_interval, in minutes.
+    deadband_option: str | None = None
+    min_interval_option: str | None = None
+
+
+@dataclass(frozen=True)
+class WebastoConnectTrackerEntityDescription(EntityDescription):
+    """Describes a Webasto device tracker."""
+
+    data_keys: tuple[str, ...] | None = None
+    # Position changes shorter than this many meters are not written.
+    min_movement: float | None = None
+    trail_length: int | None = None
 
 
 @dataclass(frozen=True)
@@ -70,6 +87,7 @@ class WebastoConnectSwitchEntityDescription(
     command_fn: Callable[..., Any] | None = None
     type_fn: Callable[[WebastoConnect], None] | None = None
     name_fn: Callable[["WebastoDevice"], str | bool] | None = None
+    data_keys: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -81,6 +99,7 @@ class WebastoConnectNumberEntityDescription(
     value_fn: Callable[[Any], Any]
     set_fn: Callable[[Any, Any], Any] | None = None
     unit_fn: Callable[["WebastoDevice"], Any] | None = None
+    data_keys: tuple[str, ...] | None = None
 
 
 class WebastoBaseEntity(CoordinatorEntity[DataUpdateCoordinator[None]]):
@@ -98,17 +117,26 @@ class WebastoBaseEntity(CoordinatorEntity[DataUpdateCoordinator[None]]):
             | WebastoConnectSensorEntityDescription
             | WebastoConnectSwitchEntityDescription
             | WebastoConnectNumberEntityDescription
+            | WebastoConnectTrackerEntityDescription
             | EntityDescription
         ),
     ) -> None:
         """Initialize a Webasto Connect Entity."""
-        super().__init__(coordinator)
+        data_keys = getattr(description, "data_keys", None)
+        super().__init__(
+            coordinator,
+            context=WebastoListenerContext(
+                device_id,
+                frozenset(data_keys) if data_keys is not None else None,
+            ),
+        )
 
         self.entity_description = description
         self._config = coordinator.config_entry
         self._hass = coordinator.hass
         self._device_id = device_id
         self._cloud: WebastoConnect = coordinator.cloud
+        self._device_context = coordinator.device_context(device_id)
 
         if hasattr(self.entity_description, "name_fn") and not isinstance(
             self.entity_description.name_fn, type(None)
@@ -120,34 +148,92 @@ class WebastoBaseEntity(CoordinatorEntity[DataUpdateCoordinator[None]]):
             self._attr_name = self.entity_description.name  # type: ignore
 
         self._attr_unique_id = util_slugify(
-            f"{self._cloud.devices[self._device_id].device_id}_{self._attr_name}"
+            f"{self._device_context.unique_id_prefix}{self._attr_name}"
         )
-
-        settings = self._cloud.devices[self._device_id].settings or {}
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, str(self._device_id))},
-            "name": self._device_name,
-            "model": "ThermoConnect",
-            "manufacturer": "Webasto",
-            "hw_version": settings.get("hw_version", "Unknown"),
-            "sw_version": settings.get("sw_version", "Unknown"),
-            "configuration_url": "https://my.webastoconnect.com",
-        }
+        # Shared by the entities of the device. The coordinator keeps it current
+        # and pushes changes to the device registry.
+        self._attr_device_info = self._device_context.device_info
 
     @property
     def _device(self) -> WebastoDevice:
         """Return the current device model for this entity."""
         return self._cloud.devices[self._device_id]
 
+    @property
+    def _payload(self) -> DevicePayload:
+        """Return the normalized payload of the device."""
+        return self.coordinator.device_payload(self._device_id)
+
     @property
     def _device_name(self) -> str:
         """Return the configured device name."""
-        coordinator = getattr(self, "coordinator", None)
-        device_names = getattr(coordinator, "device_names", {})
-        return webasto_device_name(self._device, device_names.get(str(self._device_id)))
+        return self._device_context.name
 
     @property
     def _is_device_connected(self) -> bool:
         """Return False only when the device is explicitly disconnected."""
         return getattr(self._device, "is_connected", True) is not False
+
+
+class WebastoOptimisticEntity(WebastoBaseEntity):
+    """Entity showing commanded values until the device confirms them."""
+
+    _optimistic_value: Any = None
+    _command_queue: CoalescingCommandQueue[Any] | None = None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag commanded values that are not confirmed by the device yet."""
+        if self._optimistic_value is None:
+            return None
+        return {"pending": True}
+
+    async def _async_command_with_confirmation(
+        self, value: Any, send_fn: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        """Show a value right away, send it and confirm it after a short delay."""
+        self._optimistic_value = value
+        self._async_write_optimistic_state()
+        try:
+            await send_fn(value)
+        except Exception:
+            if self._optimistic_value == value:
+                self._optimistic_value = None
+                self._async_write_optimistic_state()
+            raise
+
+        self.coordinator.async_update_listeners()
+        self.coordinator.async_request_confirmation_refresh(
+            self._async_reconcile_optimistic_value
+        )
+
+    @callback
+    def _async_write_optimistic_state(self) -> None:
+        """Write the optimistic state when the entity is added to hass."""
+        if self.hass is not None:
+            self._handle_coordinator_update()
+
+    @callback
+    def _async_reconcile_optimistic_value(self) -> None:
+        """Replace the optimistic value with the value reported by the device."""
+        if self._optimistic_value is None:
+            return
+
+        optimistic = self._optimistic_value
+        self._optimistic_value = None
+        reported = self.entity_description.value_fn(self._device)  # type: ignore
+        if reported != optimistic:
+            LOGGER.debug(
+                "%s reported %s instead of commanded %s, rolling back",
+                self.entity_id,
+                reported,
+                optimistic,
+            )
+        self._async_write_optimistic_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop pending confirmations and writes when the entity is removed."""
+        self._optimistic_value = None
+        if self._command_queue is not None:
+            await self._command_queue.async_cancel()
+        await super().async_will_remove_from_hass()
@@ -12,9 +12,12 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import callback
 from homeassistant.util import slugify as util_slugify
 
-from . import WebastoConfigEntry
-from .api import WebastoConnectUpdateCoordinator
-from .base import WebastoBaseEntity, WebastoConnectBinarySensorEntityDescription
+from .api import WebastoConfigEntry, WebastoConnectUpdateCoordinator
+from .base import (
+    CONNECTION_DATA_KEYS,
+    WebastoBaseEntity,
+    WebastoConnectBinarySensorEntityDescription,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +30,7 @@ BINARY_SENSORS = [
         value_fn=lambda webasto: cast(bool | None, webasto.is_connected),
         icon_on="mdi:wifi",
         icon_off="mdi:wifi-off",
+        data_keys=CONNECTION_DATA_KEYS,
     ),
     WebastoConnectBinarySensorEntityDescription(
         key="allow_location",
@@ -36,6 +40,7 @@ BINARY_SENSORS = [
         icon_on="mdi:map-marker",
         icon_off="mdi:map-marker-off",
         entity_registry_enabled_default=False,
+        data_keys=("settings",),
     ),
 ]
 
@@ -0,0 +1,112 @@
+"""Cloud request budget shared by all config entries of a Webasto account."""
+
+from collections.abc import Callable
+from datetime import timedelta
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+DATA_REQUEST_BUDGETS = f"{DOMAIN}_request_budgets"
+
+REQUEST_BUDGET_CAPACITY = 30
+REQUEST_BUDGET_REFILL_INTERVAL = timedelta(seconds=10)
+# Tokens background polls must leave untouched, so user commands still go through.
+REQUEST_BUDGET_COMMAND_RESERVE = 10
+
+POLL_REQUEST_COST = 1
+# Commands are followed by a forced refresh in pywebasto.
+COMMAND_REQUEST_COST = 2
+
+
+class RequestBudget:
+    """Token bucket counting Webasto cloud requests of one account.
+
+    Every request takes tokens from the bucket, which refills at a steady rate.
+    Polls are refused once they would dip into the command reserve, while user
+    commands are always let through and may take the bucket into debt.
+    """
+
+    def __init__(
+        self,
+        capacity: int = REQUEST_BUDGET_CAPACITY,
+        refill_interval: timedelta = REQUEST_BUDGET_REFILL_INTERVAL,
+        command_reserve: int = REQUEST_BUDGET_COMMAND_RESERVE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket."""
+        self.capacity = capacity
+        self.refill_interval = refill_interval
+        self.command_reserve = command_reserve
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self.entry_requests: dict[str, int] = {}
+        self.entry_throttled_polls: dict[str, int] = {}
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = self._clock()
+        earned = (now - self._updated) / self.refill_interval.total_seconds()
+        self._tokens = min(float(self.capacity), self._tokens + earned)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Return the currently available tokens."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def remaining_percent(self) -> int:
+        """Return the available budget as a percentage of the capacity."""
+        return max(0, round(100 * self.tokens / self.capacity))
+
+    def consume(self, entry_id: str, cost: int, *, command: bool) -> bool:
+        """Take tokens for a request, return False when a poll must be skipped."""
+        self._refill()
+        if not command and self._tokens - cost < self.command_reserve:
+            self.entry_throttled_polls[entry_id] = (
+                self.entry_throttled_polls.get(entry_id, 0) + 1
+            )
+            return False
+
+        self._tokens = max(-float(self.capacity), self._tokens - cost)
+        self.entry_requests[entry_id] = self.entry_requests.get(entry_id, 0) + cost
+        return True
+
+    def poll_interval_floor(self) -> timedelta:
+        """Return the shortest poll interval the budget can sustain right now."""
+        tokens = self.tokens
+        deficit = self.command_reserve + POLL_REQUEST_COST - tokens
+        if deficit > 0:
+            return self.refill_interval * deficit
+
+        # Past half the budget, entries share the refill rate between them.
+        if tokens < self.capacity / 2:
+            return self.refill_interval * max(1, len(self.entry_requests))
+
+        return timedelta(0)
+
+    def as_dict(self, entry_id: str) -> dict[str, Any]:
+        """Return budget usage for diagnostics."""
+        return {
+            "capacity": self.capacity,
+            "tokens": round(self.tokens, 1),
+            "remaining_percent": self.remaining_percent,
+            "entry_requests": self.entry_requests.get(entry_id, 0),
+            "entry_throttled_polls": self.entry_throttled_polls.get(entry_id, 0),
+            "account_requests": sum(self.entry_requests.values()),
+        }
+
+
+@callback
+def async_get_request_budget(hass: HomeAssistant, account: str) -> RequestBudget:
+    """Return the request budget shared by all entries of an account."""
+    budgets: dict[str, RequestBudget] = hass.data.setdefault(DATA_REQUEST_BUDGETS, {})
+    key = account.strip().lower()
+    if (budget := budgets.get(key)) is None:
+        budget = budgets[key] = RequestBudget()
+    return budget
@@ -1,87 +1,123 @@
-"""Helpers for installing/updating the bundled Webasto Connect Lovelace card."""
+"""Helpers for serving the bundled Webasto Connect Lovelace card."""
 
+from contextlib import suppress
 from hashlib import sha256
 from pathlib import Path
 import re
-import shutil
 
-from .const import (
-    CARD_FILENAME,
-    CARD_SOURCE_DIR,
-    CARD_WWW_SUBDIR,
-)
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView
+
+from .const import CARD_FILENAME, CARD_URL_PATH, CARD_WWW_SUBDIR, DOMAIN
 
 CARD_VERSION_PATTERN = re.compile(
     r"__WEBASTO_CONNECT_CARD_VERSION__\s*=\s*['\"]([^'\"]+)['\"]"
 )
+# The URL changes with the content hash, so browsers never need to revalidate.
+CARD_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
+# Written to <config>/www/webastoconnect by releases that copied the card there.
+LEGACY_CARD_FILENAMES = (CARD_FILENAME, f".{CARD_FILENAME}.json")
 
-def read_card_version(path: Path) -> str | None:
-    """Read card version marker directly from the JavaScript bundle."""
-    try:
-        content = path.read_text(encoding="utf-8")
-    except OSError:
-        return None
+CardInfo = tuple[str | None, str | None]
 
+# Version and hash per card path, with the stat data they were read at.
+_card_info: dict[Path, tuple[tuple[int, int], CardInfo]] = {}
+
+
+def _card_version(content: str) -> str | None:
+    """Return the version marker of a JavaScript bundle."""
     if match := CARD_VERSION_PATTERN.search(content):
         return match.group(1)
 
     return None
 
 
-def read_card_hash(path: Path) -> str | None:
-    """Read a short content hash for cache-busting."""
-    try:
-        return sha256(path.read_bytes()).hexdigest()[:12]
-    except OSError:
-        return None
-
-
-def should_install_card(
-    source_version: str | None,
-    installed_version: str | None,
-    source_entry_file: Path,
-    installed_entry_file: Path,
-) -> bool:
-    """Determine whether bundled card assets should be installed/updated."""
-    if source_version is None:
-        return False
-    if not installed_entry_file.exists():
-        return True
-    if installed_version != source_version:
-        return True
-
-    # Reinstall when bundle content changed but version marker was not bumped.
-    try:
-        return source_entry_file.read_bytes() != installed_entry_file.read_bytes()
-    except OSError:
-        return True
-
-
-def ensure_card_installed(
-    integration_path: Path, www_path: Path
-) -> tuple[bool, str | None, str | None]:
-    """Copy bundled card assets into Home Assistant www directory when needed."""
-    source_dir = integration_path / CARD_SOURCE_DIR
-    source_entry = source_dir / CARD_FILENAME
+def _content_hash(content: bytes) -> str:
+    """Return a short content hash for cache-busting."""
+    return sha256(content).hexdigest()[:12]
 
-    source_version = read_card_version(source_entry)
-    if source_version is None or not source_entry.exists():
-        return False, None, None
 
-    target_dir = www_path / CARD_WWW_SUBDIR
-    target_entry = target_dir / CARD_FILENAME
-    installed_version = read_card_version(target_entry)
+def read_card_info(path: Path) -> CardInfo:
+    """Return version and content hash of the card bundle.
 
-    if not should_install_card(
-        source_version,
-        installed_version,
-        source_entry,
-        target_entry,
-    ):
-        return False, source_version, read_card_hash(target_entry)
+    The bundle is read once per process and again only when it changes on disk.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None, None
 
-    target_dir.mkdir(parents=True, exist_ok=True)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    if (cached := _card_info.get(path)) is not None and cached[0] == signature:
+        return cached[1]
 
-    shutil.copy2(source_entry, target_entry)
-    return True, source_version, read_card_hash(target_entry)
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None, None
+
+    if (version := _card_version(content.decode("utf-8", errors="replace"))) is None:
+        info: CardInfo = (None, None)
+    else:
+        info = (version, _content_hash(content))
+    _card_info[path] = (signature, info)
+    return info
+
+
+def remove_legacy_card(www_path: Path) -> bool:
+    """Remove the card copy older releases installed into the www directory.
+
+    Only the files those releases wrote are removed, and the directory only
+    when nothing else is left in it.
+    """
+    legacy_dir = www_path / CARD_WWW_SUBDIR
+    removed = False
+    for filename in LEGACY_CARD_FILENAMES:
+        try:
+            (legacy_dir / filename).unlink()
+        except OSError:
+            continue
+        removed = True
+
+    if removed:
+        with suppress(OSError):
+            legacy_dir.rmdir()
+    return removed
+
+
+def card_url(card_hash: str) -> str:
+    """Return the URL the card is served at for a content hash."""
+    return f"{CARD_URL_PATH}/{card_hash}/{CARD_FILENAME}"
+
+
+class WebastoCardView(HomeAssistantView):
+    """Serve the card bundle straight from the integration package.
+
+    Precompressed ``.br`` and ``.gz`` variants next to the bundle are picked
+    by aiohttp from the Accept-Encoding header of the request.
+    """
+
+    url = f"{CARD_URL_PATH}/{{card_hash}}/{{filename}}"
+    name = f"{DOMAIN}:card"
+    requires_auth = False
+
+    def __init__(self, card_path: Path, card_hash: str) -> None:
+        """Initialize the view."""
+        self._card_path = card_path
+        self._card_hash = card_hash
+
+    async def get(
+        self, request: web.Request, card_hash: str, filename: str
+    ) -> web.FileResponse:
+        """Return the card bundle."""
+        if filename != self._card_path.name:
+            raise web.HTTPNotFound
+
+        # Stale hashes come from dashboards loaded before an update.
+        cache_control = (
+            CARD_CACHE_CONTROL if card_hash == self._card_hash else "no-cache"
+        )
+        return web.FileResponse(
+            self._card_path, headers={hdrs.CACHE_CONTROL: cache_control}
+        )
@@ -0,0 +1,95 @@
+"""Coalescing write queue for Webasto Connect entities."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+import logging
+from typing import Generic, TypeVar
+
+from homeassistant.exceptions import HomeAssistantError
+
+LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
+
+
+class CoalescingCommandQueue(Generic[_T]):
+    """Send only the latest value of a burst of writes for one entity.
+
+    Values submitted while a write is waiting for its debounce window or is
+    already being sent are collapsed into one follow-up write carrying the
+    latest value. Every caller waits for the write that carries its value and
+    gets that write's result or exception.
+    """
+
+    def __init__(
+        self, send_fn: Callable[[_T], Awaitable[None]], delay: float = 0.0
+    ) -> None:
+        """Initialize the queue."""
+        self._send_fn = send_fn
+        self._delay = delay
+        self._pending_value: _T | None = None
+        self._pending_future: asyncio.Future[None] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    async def async_submit(self, value: _T) -> None:
+        """Queue a value and wait until the write carrying it has completed."""
+        loop = asyncio.get_running_loop()
+        if self._pending_future is None:
+            self._pending_future = loop.create_future()
+        elif self._pending_value != value:
+            LOGGER.debug(
+                "Coalescing write of %s into newer value %s", self._pending_value, value
+            )
+        self._pending_value = value
+        future = self._pending_future
+
+        if self._worker is None:
+            self._worker = loop.create_task(self._async_run())
+
+        # Cancelling one caller must not abort a write shared with other callers.
+        await asyncio.shield(future)
+
+    async def async_cancel(self) -> None:
+        """Stop the worker and fail the writes still waiting for it."""
+        if (worker := self._worker) is None:
+            return
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+
+    async def _async_run(self) -> None:
+        """Send pending values until the queue is drained."""
+        sent: tuple[_T] | None = None
+        future: asyncio.Future[None] | None = None
+        try:
+            while self._pending_future is not None:
+                if self._delay:
+                    await asyncio.sleep(self._delay)
+
+                value = self._pending_value
+                future = self._pending_future
+                self._pending_value = None
+                self._pending_future = None
+
+                # A burst ending on the value just written needs no second write.
+                if sent is not None and sent[0] == value:
+                    future.set_result(None)
+                    continue
+
+                sent = None
+                try:
+                    await self._send_fn(value)  # type: ignore[arg-type]
+                except Exception as err:  # noqa: BLE001
+                    future.set_exception(err)
+                else:
+                    sent = (value,)  # type: ignore[assignment]
+                    future.set_result(None)
+        except asyncio.CancelledError:
+            for waiting in (future, self._pending_future):
+                if waiting is not None and not waiting.done():
+                    waiting.set_exception(HomeAssistantError("Write was cancelled"))
+            self._pending_value = None
+            self._pending_future = None
+            raise
+        finally:
+            self._worker = None
@@ -24,7 +24,20 @@ except ImportError:
     TooManyRequestsException = InvalidRequestException
 
 from .api import _credential_callbacks
-from .const import DOMAIN
+from .const import (
+    CONF_MEASUREMENT_INTERVAL,
+    CONF_MIN_MOVEMENT,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TRAIL_LENGTH,
+    CONF_VOLTAGE_DEADBAND,
+    DEFAULT_MEASUREMENT_INTERVAL,
+    DEFAULT_MIN_MOVEMENT,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TRAIL_LENGTH,
+    DEFAULT_VOLTAGE_DEADBAND,
+    DOMAIN,
+)
+from .session import async_validate_credentials
 
 LOGGER = logging.getLogger(__name__)
 
@@ -62,13 +75,17 @@ class WebastoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ):
                 return self.async_abort(reason="already_configured")
 
-            webasto = WebastoConnect(
-                username=user_input[CONF_EMAIL],
-                password=user_input[CONF_PASSWORD],
-                client_info=f"HomeAssistant-Webasto {integration.version} {int(datetime.now().timestamp())}",
-            )
             try:
-                await webasto.connect()
+                await async_validate_credentials(
+                    self.hass,
+                    user_input[CONF_EMAIL],
+                    user_input[CONF_PASSWORD],
+                    lambda: WebastoConnect(
+                        username=user_input[CONF_EMAIL],
+                        password=user_input[CONF_PASSWORD],
+                        client_info=f"HomeAssistant-Webasto {integration.version} {int(datetime.now().timestamp())}",
+                    ),
+                )
                 LOGGER.debug("Authorization OK")
             except UnauthorizedException:
                 LOGGER.debug("Authorization ERROR")
@@ -83,8 +100,6 @@ class WebastoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except TooManyRequestsException:
                 LOGGER.debug("Connection validation failed")
                 errors["base"] = "ratelimit"
-            finally:
-                await webasto.close()
 
             if "base" not in errors:
                 await self.async_set_unique_id(f"{user_input[CONF_EMAIL]}")
@@ -118,15 +133,19 @@ class WebastoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             credential_load, credential_save = _credential_callbacks(
                 self.hass, reauth_entry
             )
-            webasto = WebastoConnect(
-                username=user_input[CONF_EMAIL],
-                password=user_input[CONF_PASSWORD],
-                credential_load=credential_load,
-                credential_save=credential_save,
-                client_info=f"HomeAssistant-Webasto {integration.version} {int(datetime.now().timestamp())}",
-            )
             try:
-                await webasto.connect()
+                await async_validate_credentials(
+                    self.hass,
+                    user_input[CONF_EMAIL],
+                    user_input[CONF_PASSWORD],
+                    lambda: WebastoConnect(
+                        username=user_input[CONF_EMAIL],
+                        password=user_input[CONF_PASSWORD],
+                        credential_load=credential_load,
+                        credential_save=credential_save,
+                        client_info=f"HomeAssistant-Webasto {integration.version} {int(datetime.now().timestamp())}",
+                    ),
+                )
                 LOGGER.debug("Re-authorization OK")
             except UnauthorizedException:
                 LOGGER.debug("Re-authorization ERROR")
@@ -141,15 +160,13 @@ class WebastoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except TooManyRequestsException:
                 LOGGER.debug("Re-authorization rate limited")
                 errors["base"] = "ratelimit"
-            finally:
-                await webasto.close()
 
             if "base" not in errors:
                 self._async_abort_entries_match({CONF_EMAIL: user_input[CONF_EMAIL]})
                 return self.async_update_reload_and_abort(
                     reauth_entry,
                     data_updates={},
-                    options=user_input,
+                    options={**reauth_entry.options, **user_input},
                 )
 
         return self.async_show_form(
@@ -183,15 +200,19 @@ class WebastoConnectOptionsFlow(config_entries.OptionsFlow):
             credential_load, credential_save = _credential_callbacks(
                 self.hass, self.config_entry
             )
-            webasto = WebastoConnect(
-                username=user_input[CONF_EMAIL],
-                password=user_input[CONF_PASSWORD],
-                credential_load=credential_load,
-                credential_save=credential_save,
-                client_info=f"HomeAssistant-Webasto {integration.version} {int(datetime.now().timestamp())}",
-            )
             try:
-                await webasto.connect()
+                await async_validate_credentials(
+                    self.hass,
+                    user_input[CONF_EMAIL],
+                    user_input[CONF_PASSWORD],
+                    lambda: WebastoConnect(
+                        username=user_input[CONF_EMAIL],
+                        password=user_input[CONF_PASSWORD],
+                        credential_load=credential_load,
+                        credential_save=credential_save,
+                        client_info=f"HomeAssistant-Webasto {integration.version} {int(datetime.now().timestamp())}",
+                    ),
+                )
                 LOGGER.debug("Authorization OK")
             except UnauthorizedException:
                 LOGGER.debug("Authorization ERROR")
@@ -206,8 +227,6 @@ class WebastoConnectOptionsFlow(config_entries.OptionsFlow):
             except TooManyRequestsException:
                 LOGGER.debug("Connection validation rate limited")
                 errors["base"] = "ratelimit"
-            finally:
-                await webasto.close()
 
             if "base" not in errors:
                 return self.async_create_entry(
@@ -228,6 +247,36 @@ class WebastoConnectOptionsFlow(config_entries.OptionsFlow):
                         CONF_PASSWORD, self.config_entry.data.get(CONF_PASSWORD)
                     ),
                 ): str,
+                vol.Optional(
+                    CONF_TEMPERATURE_DEADBAND,
+                    default=self.config_entry.options.get(
+                        CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_VOLTAGE_DEADBAND,
+                    default=self.config_entry.options.get(
+                        CONF_VOLTAGE_DEADBAND, DEFAULT_VOLTAGE_DEADBAND
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_MEASUREMENT_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_MEASUREMENT_INTERVAL, DEFAULT_MEASUREMENT_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_MIN_MOVEMENT,
+                    default=self.config_entry.options.get(
+                        CONF_MIN_MOVEMENT, DEFAULT_MIN_MOVEMENT
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_TRAIL_LENGTH,
+                    default=self.config_entry.options.get(
+                        CONF_TRAIL_LENGTH, DEFAULT_TRAIL_LENGTH
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
             }
         )
         return self.async_show_form(
@@ -19,7 +19,26 @@ NEW_DATA = "webasto_signal"
 
 CARD_FILENAME = "webasto-connect-card.js"
 CARD_SOURCE_DIR = "card"
+CARD_URL_PATH = f"/{DOMAIN}/card"
+# Folder below www/ the card was copied to by earlier versions.
 CARD_WWW_SUBDIR = "webastoconnect"
 SERVICE_CREATE_TIMER = "create_timer"
 SERVICE_UPDATE_TIMER = "update_timer"
 SERVICE_DELETE_TIMER = "delete_timer"
+SERVICE_APPLY_TIMERS = "apply_timers"
+SERVICE_GET_TIMERS = "get_timers"
+SERVICE_GET_LOCATION_TRAIL = "get_location_trail"
+
+# Options of the measurement sensor filter, the interval is in minutes.
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_VOLTAGE_DEADBAND = "voltage_deadband"
+CONF_MEASUREMENT_INTERVAL = "measurement_interval"
+DEFAULT_TEMPERATURE_DEADBAND = 1.0
+DEFAULT_VOLTAGE_DEADBAND = 0.2
+DEFAULT_MEASUREMENT_INTERVAL = 15
+
+# Options of the device tracker, the movement is in meters.
+CONF_MIN_MOVEMENT = "min_movement"
+CONF_TRAIL_LENGTH = "trail_length"
+DEFAULT_MIN_MOVEMENT = 25.0
+DEFAULT_TRAIL_LENGTH = 48
@@ -0,0 +1,133 @@
+"""pywebasto app credentials cached in memory and kept in HA storage."""
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+DATA_CREDENTIAL_STORES = f"{DOMAIN}_credential_stores"
+CREDENTIAL_STORAGE_VERSION = 1
+CREDENTIAL_SAVE_DELAY = 10
+LOGGER = logging.getLogger(__name__)
+
+
+def _load_legacy_credentials(path: Path) -> dict[str, str] | None:
+    """Load credentials from the plain JSON file of earlier versions."""
+    if not path.exists():
+        return None
+
+    with path.open(encoding="utf-8") as credential_file:
+        return json.load(credential_file)
+
+
+class WebastoCredentialStore:
+    """App client credentials of a config entry.
+
+    Credentials are read from disk once and served from memory afterwards.
+    Saves are batched and written atomically, so a crash never leaves a
+    truncated file behind.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, legacy_path: Path | None = None
+    ) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self._store: Store[dict[str, str]] = Store(
+            hass,
+            CREDENTIAL_STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.credentials",
+            private=True,
+            atomic_writes=True,
+        )
+        self._legacy_path = legacy_path
+        self._credentials: dict[str, str] | None = None
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> dict[str, str] | None:
+        """Return the stored credentials, reading them from disk only once."""
+        if not self._loaded:
+            async with self._load_lock:
+                if not self._loaded:
+                    self._credentials = (
+                        await self._store.async_load()
+                        or await self._async_migrate_legacy_file()
+                    )
+                    self._loaded = True
+
+        return dict(self._credentials) if self._credentials else None
+
+    async def async_save(self, credentials: Any) -> None:
+        """Remember new credentials and schedule writing them."""
+        data = {
+            "client_id": credentials.client_id,
+            "client_secret": credentials.client_secret,
+        }
+        self._loaded = True
+        if data == self._credentials:
+            return
+
+        self._credentials = data
+        self._store.async_delay_save(lambda: data, CREDENTIAL_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored credentials."""
+        self._credentials = None
+        await self._store.async_remove()
+        if self._legacy_path is not None:
+            await self._hass.async_add_executor_job(self._legacy_path.unlink, True)
+
+    async def _async_migrate_legacy_file(self) -> dict[str, str] | None:
+        """Move credentials of the old plain JSON file into HA storage."""
+        if self._legacy_path is None:
+            return None
+
+        try:
+            credentials = await self._hass.async_add_executor_job(
+                _load_legacy_credentials, self._legacy_path
+            )
+        except (OSError, ValueError) as err:
+            LOGGER.warning("Could not read Webasto credential file: %s", err)
+            return None
+
+        if not credentials:
+            return None
+
+        # Written right away, the old file is removed once the new one exists.
+        await self._store.async_save(credentials)
+        await self._hass.async_add_executor_job(self._legacy_path.unlink, True)
+        LOGGER.debug("Moved Webasto credentials to %s", self._store.path)
+        return credentials
+
+
+@callback
+def async_get_credential_store(
+    hass: HomeAssistant, entry_id: str, legacy_path: Path | None = None
+) -> WebastoCredentialStore:
+    """Return the credential store shared by the coordinator and flows of an entry."""
+    stores: dict[str, WebastoCredentialStore] = hass.data.setdefault(
+        DATA_CREDENTIAL_STORES, {}
+    )
+    if (store := stores.get(entry_id)) is None:
+        store = stores[entry_id] = WebastoCredentialStore(hass, entry_id, legacy_path)
+    return store
+
+
+async def async_remove_credential_store(
+    hass: HomeAssistant, entry_id: str, legacy_path: Path | None = None
+) -> None:
+    """Delete the credentials of a removed config entry."""
+    stores: dict[str, WebastoCredentialStore] = hass.data.get(
+        DATA_CREDENTIAL_STORES, {}
+    )
+    store = stores.pop(entry_id, None) or WebastoCredentialStore(
+        hass, entry_id, legacy_path
+    )
+    await store.async_remove()
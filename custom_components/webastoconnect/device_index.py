@@ -0,0 +1,86 @@
+"""Index resolving service call device ids to their coordinator and device."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+
+DATA_DEVICE_INDEX = f"{DOMAIN}_device_index"
+
+
+class DeviceIndex:
+    """Coordinators of the loaded config entries, keyed by their Webasto devices.
+
+    The index is rebuilt lazily after an entry is added or removed, and when
+    a lookup misses because the cloud device list of an entry changed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._coordinators: dict[str, Any] = {}
+        self._devices: dict[str, tuple[Any, Any]] | None = None
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: Any) -> None:
+        """Index the devices of a set up config entry."""
+        self._coordinators[entry_id] = coordinator
+        self._devices = None
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Drop the devices of an unloaded config entry."""
+        if self._coordinators.pop(entry_id, None) is not None:
+            self._devices = None
+
+    def _rebuild(self) -> dict[str, tuple[Any, Any]]:
+        """Map every Webasto device id to its coordinator and device key."""
+        self._devices = {
+            str(device_id): (coordinator, device_id)
+            for coordinator in self._coordinators.values()
+            for device_id in coordinator.cloud.devices
+        }
+        return self._devices
+
+    @staticmethod
+    def _lookup(
+        devices: dict[str, tuple[Any, Any]], webasto_ids: list[str]
+    ) -> tuple[Any, Any] | None:
+        """Return coordinator and device of the first indexed id still present."""
+        for webasto_id in webasto_ids:
+            if (indexed := devices.get(webasto_id)) is None:
+                continue
+            coordinator, device_id = indexed
+            if (device := coordinator.cloud.devices.get(device_id)) is not None:
+                return coordinator, device
+        return None
+
+    @callback
+    def async_resolve(self, device_id: str) -> tuple[Any, Any] | None:
+        """Return coordinator and device of an HA device or Webasto device id."""
+        webasto_ids = [str(device_id)]
+        # Device selector values are HA device registry ids.
+        if (
+            ha_device := dr.async_get(self._hass).async_get(str(device_id))
+        ) is not None:
+            webasto_ids.extend(
+                identifier
+                for domain, identifier in ha_device.identifiers
+                if domain == DOMAIN
+            )
+
+        if self._devices is not None:
+            if (found := self._lookup(self._devices, webasto_ids)) is not None:
+                return found
+        # Devices may have been added or removed by a later update.
+        return self._lookup(self._rebuild(), webasto_ids)
+
+
+@callback
+def async_get_device_index(hass: HomeAssistant) -> DeviceIndex:
+    """Return the device index shared by all config entries."""
+    if (index := hass.data.get(DATA_DEVICE_INDEX)) is None:
+        index = hass.data[DATA_DEVICE_INDEX] = DeviceIndex(hass)
+    return index
@@ -1,26 +1,44 @@
 """Device tracker for Webasto Connect."""
 
+from dataclasses import replace
 import logging
 
 from homeassistant.components import device_tracker
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.components.device_tracker.const import SourceType
 from homeassistant.core import callback
-from homeassistant.helpers.entity import EntityDescription
 from homeassistant.util import slugify as util_slugify
 
-from . import WebastoConfigEntry
-from custom_components.webastoconnect.base import WebastoBaseEntity
+from custom_components.webastoconnect.base import (
+    CONNECTION_DATA_KEYS,
+    WebastoBaseEntity,
+    WebastoConnectTrackerEntityDescription,
+)
 
-from .api import WebastoConnectUpdateCoordinator
+from .api import WebastoConfigEntry, WebastoConnectUpdateCoordinator
+from .const import (
+    CONF_MIN_MOVEMENT,
+    CONF_TRAIL_LENGTH,
+    DEFAULT_MIN_MOVEMENT,
+    DEFAULT_TRAIL_LENGTH,
+)
+from .location import (
+    LocationSnapshot,
+    LocationTrail,
+    haversine_distance,
+    location_snapshot,
+)
 
 LOGGER = logging.getLogger(__name__)
 
-TRACKER = EntityDescription(
+TRACKER = WebastoConnectTrackerEntityDescription(
     key="devicetracker",
     name="Location",
     entity_registry_enabled_default=True,
     icon="mdi:car",
+    data_keys=("last_data.location",) + CONNECTION_DATA_KEYS,
+    min_movement=DEFAULT_MIN_MOVEMENT,
+    trail_length=DEFAULT_TRAIL_LENGTH,
 )
 
 
@@ -28,10 +46,15 @@ async def async_setup_entry(hass, entry: WebastoConfigEntry, async_add_devices):
     """Set up device tracker."""
     coordinator = entry.runtime_data.coordinator
     trackers = []
+    description = replace(
+        TRACKER,
+        min_movement=float(entry.options.get(CONF_MIN_MOVEMENT, TRACKER.min_movement)),
+        trail_length=int(entry.options.get(CONF_TRAIL_LENGTH, TRACKER.trail_length)),
+    )
 
     for id, device in coordinator.cloud.devices.items():
         LOGGER.debug("Setting up device tracker for device: %s", device.name)
-        entity = WebastoConnectDeviceTracker(id, TRACKER, coordinator)
+        entity = WebastoConnectDeviceTracker(id, description, coordinator)
         LOGGER.debug("Adding device tracker with entity_id '%s'", entity.entity_id)
         trackers.append(entity)
 
@@ -41,10 +64,14 @@ async def async_setup_entry(hass, entry: WebastoConfigEntry, async_add_devices):
 class WebastoConnectDeviceTracker(WebastoBaseEntity, TrackerEntity):
     """A device tracker for Webasto Connect."""
 
+    _location: LocationSnapshot | None = None
+    _min_movement: float | None = None
+    _trail: LocationTrail | None = None
+
     def __init__(
         self,
         device_id: int,
-        description: EntityDescription,
+        description: WebastoConnectTrackerEntityDescription,
         coordinator: WebastoConnectUpdateCoordinator,
     ) -> None:
         """Initialize a Webasto Connect device tracker."""
@@ -54,22 +81,16 @@ class WebastoConnectDeviceTracker(WebastoBaseEntity, TrackerEntity):
             util_slugify(f"{self._device_name} {self._attr_name}")
         )
 
-        location = self._location_data
-        self._prev_lat = location["lat"] if location else None
-        self._prev_lon = location["lon"] if location else None
+        self._location = location_snapshot(self._cloud.devices[device_id].location)
+        self._prev_lat = self._location.latitude if self._location else None
+        self._prev_lon = self._location.longitude if self._location else None
+        self._min_movement = description.min_movement
+        self._trail = coordinator.location_trail(device_id, description.trail_length)
+        if self._trail is not None and self._location is not None:
+            self._trail.add(self._location)
 
         self._attributes = {}
 
-    @property
-    def _location_data(self) -> dict | None:
-        """Return validated location data when available."""
-        location = self._cloud.devices[self._device_id].location
-        if not isinstance(location, dict):
-            return None
-        if "lat" not in location or "lon" not in location:
-            return None
-        return location
-
     @property
     def extra_state_attributes(self):
         """Return device specific attributes."""
@@ -77,29 +98,53 @@ class WebastoConnectDeviceTracker(WebastoBaseEntity, TrackerEntity):
 
     @property
     def available(self) -> bool:
-        """Handle the location states."""
-        is_available = self._location_data is not None
+        """Handle the location and connection states."""
+        is_available = self._location is not None and self._is_device_connected
         self._attr_available = is_available
         return is_available
 
+    def _moved(self, location: LocationSnapshot) -> bool:
+        """Return True when a position is far enough from the written one."""
+        if self._prev_lat is None or self._prev_lon is None:
+            return True
+        if not self._min_movement:
+            return (location.latitude, location.longitude) != (
+                self._prev_lat,
+                self._prev_lon,
+            )
+        return (
+            haversine_distance(
+                self._prev_lat, self._prev_lon, location.latitude, location.longitude
+            )
+            >= self._min_movement
+        )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        location = self._location_data
-        lat = location["lat"] if location else None
-        lon = location["lon"] if location else None
-
-        if lat != self._prev_lat or lon != self._prev_lon:
-            self._prev_lat = lat
-            self._prev_lon = lon
-            self._attributes = {}
+        location = location_snapshot(self._cloud.devices[self._device_id].location)
+        available = location is not None and self._is_device_connected
+        if available == self._attr_available:
+            if location is None:
+                if self._prev_lat is None and self._prev_lon is None:
+                    return
+            elif not self._moved(location):
+                # GPS noise of a parked vehicle, keep the written position.
+                return
+
+        self._location = location
+        self._prev_lat = location.latitude if location else None
+        self._prev_lon = location.longitude if location else None
+        self._attributes = {}
+        if self._trail is not None and location is not None:
+            self._trail.add(location)
 
-            self.async_write_ha_state()
+        self.async_write_ha_state()
 
     @property
     def source_type(self) -> SourceType | str | None:
         """Return the source type, eg gps or router, of the device."""
-        if self._location_data is None:
+        if self._location is None:
             return None
 
         return SourceType.GPS
@@ -107,17 +152,9 @@ class WebastoConnectDeviceTracker(WebastoBaseEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        location = self._location_data
-        if location is None:
-            return None
-
-        return float(location["lat"])
+        return self._location.latitude if self._location else None
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        location = self._location_data
-        if location is None:
-            return None
-
-        return float(location["lon"])
+        return self._location.longitude if self._location else None
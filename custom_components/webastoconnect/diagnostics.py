@@ -8,8 +8,8 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_EMAIL, CONF_LATITUDE, CONF_LONGITUDE, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 
-from . import WebastoConfigEntry
-from .api import WebastoConnectUpdateCoordinator
+from .api import WebastoConfigEntry, WebastoConnectUpdateCoordinator
+from .payload import DevicePayload, normalize_payload
 
 TO_REDACT = {
     CONF_PASSWORD,
@@ -25,6 +25,28 @@ TO_REDACT = {
 }
 
 
+def _payload_diagnostics(payload: DevicePayload) -> dict[str, Any]:
+    """Return how the integration reads the outputs and timers of a payload."""
+    timer_counts: dict[str, int] = {}
+    for timer in payload.timers:
+        timer_counts[timer["line"]] = timer_counts.get(timer["line"], 0) + 1
+
+    return {
+        "outputs": {
+            line: {
+                "state": output.state,
+                "disabled": output.disabled,
+                "end_time": output.end_time.isoformat() if output.end_time else None,
+            }
+            for line, output in payload.outputs.items()
+        },
+        "simple_timers": timer_counts,
+        "main_end_time": (
+            payload.main_end_time.isoformat() if payload.main_end_time else None
+        ),
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: WebastoConfigEntry
 ) -> dict[str, Any]:
@@ -46,6 +68,9 @@ async def async_get_config_entry_diagnostics(
                 "settings": getattr(device, "settings", None),
                 "dev_data": getattr(device, "dev_data", None),
             },
+            "normalized_payload": _payload_diagnostics(
+                normalize_payload(getattr(device, "last_data", None))
+            ),
             "state": {
                 "temperature": getattr(device, "temperature", None),
                 "voltage": getattr(device, "voltage", None),
@@ -57,4 +82,9 @@ async def async_get_config_entry_diagnostics(
             },
         }
 
+    if (request_budget := getattr(api, "request_budget", None)) is not None:
+        data_dict["request_budget"] = request_budget.as_dict(entry.entry_id)
+    if (retry_policy := getattr(api, "retry_policy", None)) is not None:
+        data_dict["update_failures"] = retry_policy.as_dict()
+
     return async_redact_data(data_dict, TO_REDACT)
@@ -0,0 +1,82 @@
+"""Location snapshots, movement distance and the location trail of a device."""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from math import asin, cos, radians, sin, sqrt
+from typing import Any
+
+from .const import DEFAULT_TRAIL_LENGTH
+
+EARTH_RADIUS_METERS = 6_371_000
+TRAIL_LENGTH = DEFAULT_TRAIL_LENGTH
+# Positions closer together in time are merged into the latest one.
+TRAIL_SPACING = timedelta(minutes=5)
+# Five decimals are about one meter, finer than the GPS of the device.
+TRAIL_PRECISION = 5
+
+
+@dataclass(frozen=True, slots=True)
+class LocationSnapshot:
+    """Validated position of a device payload."""
+
+    latitude: float
+    longitude: float
+
+
+def location_snapshot(location: Any) -> LocationSnapshot | None:
+    """Return the position of a raw location payload, if it has one."""
+    if not isinstance(location, dict):
+        return None
+    if "lat" not in location or "lon" not in location:
+        return None
+    try:
+        return LocationSnapshot(float(location["lat"]), float(location["lon"]))
+    except (TypeError, ValueError):
+        return None
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great circle distance between two positions in meters."""
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_METERS * asin(sqrt(a))
+
+
+class LocationTrail:
+    """Bounded list of recent positions, at most one per spacing interval."""
+
+    def __init__(
+        self, length: int = TRAIL_LENGTH, spacing: timedelta = TRAIL_SPACING
+    ) -> None:
+        """Initialize an empty trail."""
+        self._spacing = spacing.total_seconds()
+        self._points: deque[tuple[float, float, float]] = deque(maxlen=length)
+
+    def add(self, location: LocationSnapshot, now: datetime | None = None) -> None:
+        """Record a position, replacing the last one when it is too recent."""
+        timestamp = (now or datetime.now(UTC)).timestamp()
+        point = (
+            timestamp,
+            round(location.latitude, TRAIL_PRECISION),
+            round(location.longitude, TRAIL_PRECISION),
+        )
+        if self._points and timestamp - self._points[-1][0] < self._spacing:
+            self._points[-1] = point
+        else:
+            self._points.append(point)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the positions, oldest first."""
+        return [
+            {
+                "time": datetime.fromtimestamp(timestamp, UTC).isoformat(),
+                "latitude": latitude,
+                "longitude": longitude,
+            }
+            for timestamp, latitude, longitude in self._points
+        ]
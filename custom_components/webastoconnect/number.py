@@ -8,12 +8,19 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.const import EntityCategory
 from homeassistant.util import slugify as util_slugify
 
-from . import WebastoConfigEntry
-from .api import WebastoConnectUpdateCoordinator
-from .base import WebastoBaseEntity, WebastoConnectNumberEntityDescription
+from .api import WebastoConfigEntry, WebastoConnectUpdateCoordinator
+from .base import (
+    CONNECTION_DATA_KEYS,
+    WebastoConnectNumberEntityDescription,
+    WebastoOptimisticEntity,
+)
+from .command_queue import CoalescingCommandQueue
 
 LOGGER = logging.getLogger(__name__)
 
+# Slider drags and automations can write many values in a row.
+NUMBER_WRITE_DEBOUNCE = 1.0
+
 NUMBERS = [
     WebastoConnectNumberEntityDescription(
         key="low_voltage_cutoff",
@@ -27,6 +34,7 @@ NUMBERS = [
         native_unit_of_measurement="V",
         entity_registry_enabled_default=False,
         icon="mdi:battery-off",
+        data_keys=("settings",) + CONNECTION_DATA_KEYS,
     ),
     WebastoConnectNumberEntityDescription(
         key="ext_temp_comp",
@@ -40,6 +48,7 @@ NUMBERS = [
         unit_fn=lambda webasto: webasto.temperature_unit,
         entity_registry_enabled_default=False,
         icon="mdi:thermometer-alert",
+        data_keys=("settings", "last_data.temperature") + CONNECTION_DATA_KEYS,
     ),
 ]
 
@@ -62,9 +71,11 @@ async def async_setup_entry(hass, entry: WebastoConfigEntry, async_add_devices):
     async_add_devices(numbers_list)
 
 
-class WebastoConnectNumber(WebastoBaseEntity, NumberEntity):
+class WebastoConnectNumber(WebastoOptimisticEntity, NumberEntity):
     """Representation of a Webasto Connect number."""
 
+    _command_queue: CoalescingCommandQueue[float] | None = None
+
     def __init__(
         self,
         device_id: int,
@@ -86,6 +97,8 @@ class WebastoConnectNumber(WebastoBaseEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Get the native value."""
+        if self._optimistic_value is not None:
+            return cast(float, self._optimistic_value)
         return cast(
             float,
             self.entity_description.value_fn(self._device),  # type: ignore
@@ -100,9 +113,19 @@ class WebastoConnectNumber(WebastoBaseEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
         LOGGER.debug("Setting '%s' to '%s'", self.entity_id, value)
+        if self._command_queue is None:
+            self._command_queue = CoalescingCommandQueue(
+                self._async_send_value, NUMBER_WRITE_DEBOUNCE
+            )
+        await self._async_command_with_confirmation(
+            value, self._command_queue.async_submit
+        )
+
+    async def _async_send_value(self, value: float) -> None:
+        """Send the debounced value to the device."""
+        # Settings are written through the shared webapi active-device context.
         await self.coordinator.async_execute_cloud_call(
             self.entity_description.set_fn,  # type: ignore[arg-type]
             self._device,
             value,
         )
-        self.coordinator.async_update_listeners()
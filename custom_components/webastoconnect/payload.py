@@ -0,0 +1,96 @@
+"""Normalized outputs and timers of a device payload, built in one pass."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import json
+from typing import Any
+
+MAIN_OUTPUT_LINES = frozenset({"OUTH", "OUTV"})
+TIMER_LINES = MAIN_OUTPUT_LINES
+OUTPUT_SECTIONS = ("outputs", "disabled_outputs")
+# Raw payload fields (see api.DEVICE_DATA_SECTIONS) the normalized payload uses.
+OUTPUT_DATA_KEYS = ("last_data.outputs", "last_data.disabled_outputs")
+
+
+@dataclass(frozen=True, slots=True)
+class OutputState:
+    """One output line of a device payload."""
+
+    line: str
+    state: str | None
+    disabled: bool
+    end_time: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class DevicePayload:
+    """Outputs by line, simple timers and main output end time of a payload.
+
+    ``timers`` keeps the payload order across lines and adds the ``line`` of
+    each timer. The timer dicts are shared, readers must not modify them.
+    """
+
+    outputs: Mapping[str, OutputState]
+    timers: tuple[dict[str, Any], ...]
+    timers_hash: int
+    main_end_time: datetime | None
+
+    def line_timers(self, lines: Iterable[str]) -> list[dict[str, Any]]:
+        """Return copies of the simple timers of the given lines."""
+        lines = frozenset(lines)
+        return [dict(timer) for timer in self.timers if timer["line"] in lines]
+
+
+def _end_time(output: dict[str, Any]) -> datetime | None:
+    """Return when a switched on output stops."""
+    if output.get("state") != "ON":
+        return None
+
+    ontime = output.get("ontime")
+    if isinstance(ontime, int | float) and ontime > 0:
+        return datetime.fromtimestamp(ontime, UTC)
+    return None
+
+
+def normalize_payload(last_data: Any) -> DevicePayload:
+    """Index the outputs and simple timers of a raw device payload."""
+    outputs: dict[str, OutputState] = {}
+    timers: list[dict[str, Any]] = []
+    main_end_time: datetime | None = None
+
+    if isinstance(last_data, dict):
+        for section in OUTPUT_SECTIONS:
+            section_outputs = last_data.get(section)
+            if not isinstance(section_outputs, list):
+                continue
+            disabled = section == "disabled_outputs"
+            for output in section_outputs:
+                if not isinstance(output, dict):
+                    continue
+                line = output.get("line")
+                if not isinstance(line, str):
+                    continue
+
+                state = OutputState(
+                    line, output.get("state"), disabled, _end_time(output)
+                )
+                outputs.setdefault(line, state)
+                if main_end_time is None and not disabled and line in MAIN_OUTPUT_LINES:
+                    main_end_time = state.end_time
+
+                output_timers = output.get("timers")
+                if line not in TIMER_LINES or not isinstance(output_timers, list):
+                    continue
+                timers.extend(
+                    {**timer, "line": line}
+                    for timer in output_timers
+                    if isinstance(timer, dict) and timer.get("type") == "simple"
+                )
+
+    return DevicePayload(
+        outputs=outputs,
+        timers=tuple(timers),
+        timers_hash=hash(json.dumps(timers, sort_keys=True, default=str)),
+        main_end_time=main_end_time,
+    )
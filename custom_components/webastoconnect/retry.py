@@ -0,0 +1,122 @@
+"""Retry policy for failed Webasto cloud updates."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+import random
+from typing import Any
+
+import aiohttp
+from pywebasto.exceptions import InvalidRequestException
+
+try:
+    from pywebasto.exceptions import (
+        ForbiddenException,
+        InvalidResponseException,
+        TooManyRequestsException,
+    )
+except ImportError:
+    ForbiddenException = InvalidRequestException
+    InvalidResponseException = InvalidRequestException
+    TooManyRequestsException = InvalidRequestException
+
+
+class FailureClass(StrEnum):
+    """Kinds of update failures with their own backoff."""
+
+    RATE_LIMITED = "rate_limited"
+    TEMPORARY = "temporary"
+    NETWORK = "network"
+    REQUEST = "request"
+    UNEXPECTED = "unexpected"
+
+
+# Base delay and cap in seconds for each failure class.
+BACKOFF_SECONDS: dict[FailureClass, tuple[float, float]] = {
+    FailureClass.RATE_LIMITED: (300, 3600),
+    FailureClass.TEMPORARY: (60, 1800),
+    FailureClass.NETWORK: (30, 900),
+    FailureClass.REQUEST: (60, 900),
+    FailureClass.UNEXPECTED: (60, 1800),
+}
+
+
+def classify_failure(err: BaseException) -> FailureClass:
+    """Return the failure class of an update exception."""
+    # Check the specific exceptions first, they may alias InvalidRequestException.
+    if isinstance(err, TooManyRequestsException) and (
+        TooManyRequestsException is not InvalidRequestException
+    ):
+        return FailureClass.RATE_LIMITED
+    if isinstance(err, (ForbiddenException, InvalidResponseException)) and (
+        ForbiddenException is not InvalidRequestException
+    ):
+        return FailureClass.TEMPORARY
+    if isinstance(err, InvalidRequestException):
+        return FailureClass.REQUEST
+    if isinstance(err, (TimeoutError, aiohttp.ClientError, OSError)):
+        return FailureClass.NETWORK
+    return FailureClass.UNEXPECTED
+
+
+@dataclass(slots=True)
+class FailureStats:
+    """Statistics of one failure class."""
+
+    count: int = 0
+    last_failure: datetime | None = None
+    last_error: str | None = None
+    last_retry_after: float | None = None
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for coordinator updates.
+
+    The delay doubles with every consecutive failure, starting from the base
+    delay of the failure class and capped per class. A random extra of up to
+    the delay spreads out retries of installations failing at the same moment,
+    and the next successful update resets the backoff.
+    """
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        """Initialize the policy."""
+        self._rng = rng or random.Random()
+        self.consecutive_failures = 0
+        self.stats: dict[FailureClass, FailureStats] = {}
+
+    def record_failure(self, failure_class: FailureClass, err: BaseException) -> float:
+        """Register a failed update and return the seconds until the retry."""
+        self.consecutive_failures += 1
+        base, cap = BACKOFF_SECONDS[failure_class]
+        delay = min(cap, base * 2 ** (self.consecutive_failures - 1))
+        # Never retry before the delay, so a first rate limit still waits the
+        # 300 seconds the integration always waited.
+        retry_after = round(delay + self._rng.uniform(0, delay), 1)
+
+        stats = self.stats.setdefault(failure_class, FailureStats())
+        stats.count += 1
+        stats.last_failure = datetime.now(UTC)
+        stats.last_error = f"{type(err).__name__}: {err}"
+        stats.last_retry_after = retry_after
+        return retry_after
+
+    def record_success(self) -> None:
+        """Reset the backoff after a successful update."""
+        self.consecutive_failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return retry statistics for diagnostics."""
+        return {
+            "consecutive_failures": self.consecutive_failures,
+            "failures": {
+                str(failure_class): {
+                    "count": stats.count,
+                    "last_failure": (
+                        stats.last_failure.isoformat() if stats.last_failure else None
+                    ),
+                    "last_error": stats.last_error,
+                    "last_retry_after": stats.last_retry_after,
+                }
+                for failure_class, stats in self.stats.items()
+            },
+        }
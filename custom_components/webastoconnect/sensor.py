@@ -1,7 +1,10 @@
 """Sensors for Webasto Connect."""
 
+from collections.abc import Mapping
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.components import sensor
@@ -10,47 +13,53 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory
-from homeassistant.core import callback
+from homeassistant.const import PERCENTAGE, EntityCategory
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify as util_slugify
 
-from . import WebastoConfigEntry
-from .api import WebastoConnectUpdateCoordinator
-from .base import WebastoBaseEntity, WebastoConnectSensorEntityDescription
+from .api import (
+    WebastoBudgetListenerContext,
+    WebastoConfigEntry,
+    WebastoConnectUpdateCoordinator,
+)
+from .base import (
+    WebastoBaseEntity,
+    WebastoConnectSensorEntityDescription,
+)
+from .const import (
+    CONF_MEASUREMENT_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_VOLTAGE_DEADBAND,
+    DEFAULT_MEASUREMENT_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_VOLTAGE_DEADBAND,
+    DOMAIN,
+)
+from .payload import OUTPUT_DATA_KEYS, DevicePayload, normalize_payload
+from .timers import _next_timer_sensor_payload
 
 LOGGER = logging.getLogger(__name__)
-MAIN_OUTPUT_LINES = {"OUTH", "OUTV"}
-TIMER_LINES = {"OUTH", "OUTV"}
-WEEKDAY_BITMASK = [1, 2, 4, 8, 16, 32, 64]  # Monday..Sunday
+# Payload values jitter between polls, only real changes are worth a state write.
+MEASUREMENT_MIN_INTERVAL = timedelta(minutes=DEFAULT_MEASUREMENT_INTERVAL)
 
 
-def _main_output_end_time(webasto) -> datetime | None:
+def _main_output_end_time(
+    webasto, payload: DevicePayload | None = None
+) -> datetime | None:
     """Return the UTC end timestamp for the active main output."""
     end_time = getattr(webasto, "output_main_end_time", None)
     if isinstance(end_time, datetime):
         return end_time if end_time.tzinfo is not None else end_time.replace(tzinfo=UTC)
 
-    last_data = getattr(webasto, "last_data", None)
-    if not isinstance(last_data, dict):
-        return None
-
-    outputs = last_data.get("outputs")
-    if not isinstance(outputs, list):
-        return None
-
-    for output in outputs:
-        if not isinstance(output, dict):
-            continue
-        if output.get("line") not in MAIN_OUTPUT_LINES:
-            continue
-        if output.get("state") != "ON":
-            continue
-
-        ontime = output.get("ontime")
-        if isinstance(ontime, int | float) and ontime > 0:
-            return datetime.fromtimestamp(ontime, UTC)
-
-    return None
+    if payload is None:
+        payload = normalize_payload(getattr(webasto, "last_data", None))
+    return payload.main_end_time
 
 
 def _main_output_end_name(webasto) -> str:
@@ -61,155 +70,42 @@ def _main_output_end_name(webasto) -> str:
     return "Output ends"
 
 
-def _extract_simple_timers(webasto: Any) -> list[dict[str, Any]]:
-    """Extract `simple` timers (heater + ventilation) from latest API payload."""
-    last_data = getattr(webasto, "last_data", None)
-    if not isinstance(last_data, dict):
-        return []
-
-    timers: list[dict[str, Any]] = []
-    for section in ("outputs", "disabled_outputs"):
-        outputs = last_data.get(section)
-        if not isinstance(outputs, list):
-            continue
-        for output in outputs:
-            if not isinstance(output, dict):
-                continue
-            line = output.get("line")
-            if line not in TIMER_LINES:
-                continue
-            output_timers = output.get("timers")
-            if not isinstance(output_timers, list):
-                continue
-            for timer in output_timers:
-                if isinstance(timer, dict) and timer.get("type") == "simple":
-                    timers.append(
-                        {
-                            **timer,
-                            "line": line,
-                        }
-                    )
-    return timers
-
-
-def _next_timer_occurrence_utc(
-    *,
-    start: int,
-    repeat: int,
-    now_utc: datetime,
-) -> datetime | None:
-    """Calculate next UTC occurrence for a timer."""
-    if start <= 0 or start >= 24 * 60:
-        return None
-
-    hour = start // 60
-    minute = start % 60
-
-    if repeat == 0:
-        candidate = now_utc.replace(
-            hour=hour,
-            minute=minute,
-            second=0,
-            microsecond=0,
-        )
-        if candidate <= now_utc:
-            candidate += timedelta(days=1)
-        return candidate
-
-    for day_offset in range(0, 8):
-        candidate_date = now_utc.date() + timedelta(days=day_offset)
-        weekday = candidate_date.weekday()
-        if repeat & WEEKDAY_BITMASK[weekday] == 0:
-            continue
-
-        candidate = datetime(
-            candidate_date.year,
-            candidate_date.month,
-            candidate_date.day,
-            hour,
-            minute,
-            tzinfo=UTC,
-        )
-        if candidate > now_utc:
-            return candidate
-
-    return None
-
-
-def _timer_start_hhmm(start: int) -> str:
-    """Format timer start (minutes after midnight) as HH:MM."""
-    hour = start // 60
-    minute = start % 60
-    return f"{hour:02d}:{minute:02d}"
-
-
-def _line_label(line: str | None) -> str | None:
-    """Return user-friendly timer line label."""
-    if line == "OUTH":
-        return "Heater"
-    if line == "OUTV":
-        return "Ventilation"
-    return line
-
-
-def _next_timer_sensor_payload(
-    webasto: Any,
-    *,
-    now_utc: datetime | None = None,
-) -> tuple[datetime | None, dict[str, Any]]:
-    """Build state + attributes for next-enabled-timer sensor."""
-    now = now_utc or datetime.now(UTC)
-    timers = _extract_simple_timers(webasto)
-
-    timer_items: list[dict[str, Any]] = []
-    next_index: int | None = None
-    next_occurrence: datetime | None = None
-    next_timer: dict[str, Any] | None = None
-
-    for index, timer in enumerate(timers):
-        start = int(timer.get("start", 0))
-        repeat = int(timer.get("repeat", 0))
-        enabled = bool(timer.get("enabled", False))
-        duration = int(timer.get("duration", 0))
-        location = timer.get("location")
-        latitude = location.get("lat") if isinstance(location, dict) else None
-        longitude = location.get("lon") if isinstance(location, dict) else None
-
-        occurrence = None
-        if enabled and start > 0:
-            occurrence = _next_timer_occurrence_utc(
-                start=start,
-                repeat=repeat,
-                now_utc=now,
-            )
+class _NextTimerPayloadCache:
+    """Memoize the next-timer payload of one device.
+
+    The payload is reused until the timer section of ``last_data`` changes or
+    the computed next run has passed.
+    """
+
+    __slots__ = ("_payload", "_timers_hash")
 
-        item = {
-            "index": index,
-            "line": _line_label(timer.get("line")),
-            "line_code": timer.get("line"),
-            "start": start,
-            "start_hhmm_utc": _timer_start_hhmm(start) if start > 0 else None,
-            "duration": duration,
-            "repeat": repeat,
-            "enabled": enabled,
-            "latitude": latitude,
-            "longitude": longitude,
-            "next_run_utc": occurrence.isoformat() if occurrence else None,
-        }
-        timer_items.append(item)
-
-        if not enabled or occurrence is None:
-            continue
-        if next_occurrence is None or occurrence < next_occurrence:
-            next_occurrence = occurrence
-            next_index = index
-            next_timer = item
-
-    return next_occurrence, {
-        "next_timer_index": next_index,
-        "next_timer": next_timer,
-        "timers": timer_items,
-    }
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._timers_hash: int | None = None
+        self._payload: tuple[datetime | None, dict[str, Any]] | None = None
+
+    def payload(
+        self,
+        webasto: Any,
+        *,
+        now_utc: datetime | None = None,
+        payload: DevicePayload | None = None,
+    ) -> tuple[datetime | None, dict[str, Any]]:
+        """Return state + attributes, recomputing only when they can differ."""
+        now = now_utc or datetime.now(UTC)
+        if payload is None:
+            payload = normalize_payload(getattr(webasto, "last_data", None))
+        timers_hash = payload.timers_hash
+        if self._payload is not None and timers_hash == self._timers_hash:
+            next_run = self._payload[0]
+            if next_run is None or now < next_run:
+                return self._payload
+
+        self._timers_hash = timers_hash
+        self._payload = _next_timer_sensor_payload(
+            webasto, now_utc=now, payload=payload
+        )
+        return self._payload
 
 
 SENSORS = [
@@ -223,6 +119,11 @@ SENSORS = [
         icon="mdi:thermometer",
         unit_fn=lambda webasto: webasto.temperature_unit,
         suggested_display_precision=0,
+        data_keys=("last_data.temperature",),
+        deadband=DEFAULT_TEMPERATURE_DEADBAND,
+        min_interval=MEASUREMENT_MIN_INTERVAL,
+        deadband_option=CONF_TEMPERATURE_DEADBAND,
+        min_interval_option=CONF_MEASUREMENT_INTERVAL,
     ),
     WebastoConnectSensorEntityDescription(
         key="battery_voltage",
@@ -234,6 +135,12 @@ SENSORS = [
         value_fn=lambda webasto: webasto.voltage,
         icon="mdi:car-battery",
         suggested_display_precision=1,
+        data_keys=("last_data.voltage",),
+        deadband=DEFAULT_VOLTAGE_DEADBAND,
+        min_interval=MEASUREMENT_MIN_INTERVAL,
+        threshold_fn=lambda webasto: webasto.low_voltage_cutoff,
+        deadband_option=CONF_VOLTAGE_DEADBAND,
+        min_interval_option=CONF_MEASUREMENT_INTERVAL,
     ),
     WebastoConnectSensorEntityDescription(
         key="subscription_expiration",
@@ -244,6 +151,7 @@ SENSORS = [
         entity_registry_enabled_default=False,
         value_fn=lambda webasto: webasto.subscription_expiration.strftime("%d-%m-%Y"),
         icon="mdi:calendar-end",
+        data_keys=("dev_data.subscription",),
     ),
     WebastoConnectSensorEntityDescription(
         key="main_output_end_time",
@@ -252,9 +160,10 @@ SENSORS = [
         state_class=None,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_registry_enabled_default=False,
-        value_fn=_main_output_end_time,
+        payload_fn=_main_output_end_time,
         name_fn=_main_output_end_name,
         icon="mdi:timer-outline",
+        data_keys=OUTPUT_DATA_KEYS,
     ),
     WebastoConnectSensorEntityDescription(
         key="next_enabled_timer",
@@ -263,33 +172,87 @@ SENSORS = [
         state_class=None,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_registry_enabled_default=False,
-        value_fn=lambda webasto: _next_timer_sensor_payload(webasto)[0],
         icon="mdi:calendar-clock",
+        data_keys=OUTPUT_DATA_KEYS,
     ),
 ]
 
+# Request budget sensors read the coordinator instead of the device payload,
+# they are set up once per entry on the account device.
+ACCOUNT_DEVICE_NAME = "Webasto Connect"
+REQUEST_BUDGET_SENSORS = [
+    WebastoConnectSensorEntityDescription(
+        key="request_budget_remaining",
+        name="Cloud request budget",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=None,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.request_budget.remaining_percent,
+        icon="mdi:gauge",
+    ),
+    WebastoConnectSensorEntityDescription(
+        key="request_budget_requests",
+        name="Cloud requests",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=None,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.request_budget.entry_requests.get(
+            coordinator.config_entry.entry_id, 0
+        ),
+        icon="mdi:counter",
+    ),
+]
+
+
+def _configured_description(
+    description: WebastoConnectSensorEntityDescription, options: Mapping[str, Any]
+) -> WebastoConnectSensorEntityDescription:
+    """Return the description with the filter options of the entry applied."""
+    changes: dict[str, Any] = {}
+    if description.deadband_option in options:
+        changes["deadband"] = float(options[description.deadband_option])
+    if description.min_interval_option in options:
+        changes["min_interval"] = timedelta(
+            minutes=float(options[description.min_interval_option])
+        )
+    return replace(description, **changes) if changes else description
+
 
 async def async_setup_entry(hass, entry: WebastoConfigEntry, async_add_devices):
     """Set up sensors."""
     sensors = []
 
     coordinator = entry.runtime_data.coordinator
+    descriptions = [_configured_description(s, entry.options) for s in SENSORS]
 
     for id, device in coordinator.cloud.devices.items():
         LOGGER.debug("Setting up sensors for device: %s", device.name)
-        for s in SENSORS:
+        for s in descriptions:
             entity = WebastoConnectSensor(id, s, coordinator)
             LOGGER.debug(
                 "Adding sensor '%s' with entity_id '%s'", s.name, entity.entity_id
             )
             sensors.append(entity)
 
+    for s in REQUEST_BUDGET_SENSORS:
+        sensors.append(WebastoRequestBudgetSensor(s, coordinator))
+
     async_add_devices(sensors)
 
 
 class WebastoConnectSensor(WebastoBaseEntity, SensorEntity):
     """Representation of a Webasto Connect Sensor."""
 
+    # The timer list is rewritten on every timer change, get_timers serves it.
+    _unrecorded_attributes = frozenset({"timers", "next_timer"})
+    _next_timer_cache: _NextTimerPayloadCache | None = None
+    _unsub_next_timer_refresh: CALLBACK_TYPE | None = None
+    _unsub_held_back_write: CALLBACK_TYPE | None = None
+    _value_written_at = 0.0
+
     def __init__(
         self,
         device_id: int,
@@ -300,14 +263,16 @@ class WebastoConnectSensor(WebastoBaseEntity, SensorEntity):
         super().__init__(device_id, coordinator, description)
 
         self._attr_icon = self.entity_description.icon
-        self._attr_native_value = self.entity_description.value_fn(  # type: ignore
-            self._cloud.devices[self._device_id]
-        )
         if self.entity_description.key == "next_enabled_timer":
-            _, attributes = _next_timer_sensor_payload(
-                self._cloud.devices[self._device_id]
+            self._next_timer_cache = _NextTimerPayloadCache()
+            self._attr_native_value, self._attr_extra_state_attributes = (
+                self._next_timer_cache.payload(
+                    self._cloud.devices[self._device_id], payload=self._payload
+                )
             )
-            self._attr_extra_state_attributes = attributes
+        else:
+            self._attr_native_value = self._value()
+            self._value_written_at = time.monotonic()
 
         if not isinstance(description.unit_fn, type(None)):
             self._attr_native_unit_of_measurement = description.unit_fn(
@@ -318,6 +283,117 @@ class WebastoConnectSensor(WebastoBaseEntity, SensorEntity):
             util_slugify(f"{self._device_name} {self._attr_name}")
         )
 
+    def _is_significant(self, value: Any) -> bool:
+        """Return True when a new value passes the deadband or min interval."""
+        description = self.entity_description
+        deadband = description.deadband  # type: ignore[attr-defined]
+        min_interval = description.min_interval  # type: ignore[attr-defined]
+        current = self._attr_native_value
+        if (
+            (deadband is None and min_interval is None)
+            or not isinstance(value, int | float)
+            or not isinstance(current, int | float)
+        ):
+            return True
+
+        if deadband is not None and abs(value - current) >= deadband:
+            return True
+        if description.threshold_fn is not None:  # type: ignore[attr-defined]
+            threshold = description.threshold_fn(  # type: ignore[attr-defined]
+                self._cloud.devices[self._device_id]
+            )
+            if isinstance(threshold, int | float) and (value < threshold) != (
+                current < threshold
+            ):
+                return True
+        return (
+            min_interval is not None
+            and time.monotonic() - self._value_written_at
+            >= min_interval.total_seconds()
+        )
+
+    async def async_update(self) -> None:
+        """Refresh and show the latest value, even one held back by the deadband."""
+        await super().async_update()
+        if self._next_timer_cache is None:
+            self._async_cancel_held_back_write()
+            self._attr_native_value = self._value()
+            self._value_written_at = time.monotonic()
+
+    def _value(self) -> Any:
+        """Return the sensor value of the current device data."""
+        device = self._cloud.devices[self._device_id]
+        if self.entity_description.payload_fn is not None:  # type: ignore
+            return self.entity_description.payload_fn(device, self._payload)  # type: ignore
+        return self.entity_description.value_fn(device)  # type: ignore
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the next-timer refresh once the entity is added."""
+        await super().async_added_to_hass()
+        if self._next_timer_cache is not None:
+            self.async_on_remove(self._async_cancel_next_timer_refresh)
+            self._async_schedule_next_timer_refresh()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending held back value when the entity is removed."""
+        self._async_cancel_held_back_write()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _async_cancel_held_back_write(self) -> None:
+        """Cancel a scheduled write of a held back value."""
+        if self._unsub_held_back_write is not None:
+            self._unsub_held_back_write()
+            self._unsub_held_back_write = None
+
+    @callback
+    def _async_schedule_held_back_write(self) -> None:
+        """Write a held back value once the min interval has passed."""
+        min_interval = self.entity_description.min_interval  # type: ignore[attr-defined]
+        if (
+            self._unsub_held_back_write is not None
+            or self.hass is None
+            or min_interval is None
+        ):
+            return
+
+        delay = min_interval.total_seconds() - (
+            time.monotonic() - self._value_written_at
+        )
+        self._unsub_held_back_write = async_call_later(
+            self.hass, max(delay, 0), self._async_handle_held_back_write_due
+        )
+
+    @callback
+    def _async_handle_held_back_write_due(self, _now: datetime) -> None:
+        """Write the latest value after it was held back for the min interval."""
+        self._unsub_held_back_write = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_next_timer_refresh(self) -> None:
+        """Cancel a scheduled next-timer refresh."""
+        if self._unsub_next_timer_refresh is not None:
+            self._unsub_next_timer_refresh()
+            self._unsub_next_timer_refresh = None
+
+    @callback
+    def _async_schedule_next_timer_refresh(self) -> None:
+        """Refresh the next-timer state when the current next run is reached."""
+        self._async_cancel_next_timer_refresh()
+        if self.hass is None or not isinstance(self._attr_native_value, datetime):
+            return
+
+        self._unsub_next_timer_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_handle_next_timer_due, self._attr_native_value
+        )
+
+    @callback
+    def _async_handle_next_timer_due(self, _now: datetime) -> None:
+        """Move the next-timer state on once its run time has passed."""
+        self._unsub_next_timer_refresh = None
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -326,22 +402,81 @@ class WebastoConnectSensor(WebastoBaseEntity, SensorEntity):
             new_name = self.entity_description.name_fn(  # type: ignore
                 self._cloud.devices[self._device_id]
             )
-        new_value = self.entity_description.value_fn(  # type: ignore
-            self._cloud.devices[self._device_id]
-        )
         current_attributes = getattr(self, "_attr_extra_state_attributes", None)
         new_attributes = current_attributes
-        if self.entity_description.key == "next_enabled_timer":
-            _, new_attributes = _next_timer_sensor_payload(
-                self._cloud.devices[self._device_id]
+        if self._next_timer_cache is not None:
+            new_value, new_attributes = self._next_timer_cache.payload(
+                self._cloud.devices[self._device_id], payload=self._payload
             )
+        else:
+            new_value = self._value()
+            if new_value != self._attr_native_value and not self._is_significant(
+                new_value
+            ):
+                # Shown once the min interval has passed, unless it settles back.
+                self._async_schedule_held_back_write()
+                new_value = self._attr_native_value
 
         if (
             new_name != self._attr_name
             or new_value != self._attr_native_value
-            or new_attributes != current_attributes
+            or new_attributes is not current_attributes
         ):
+            value_changed = new_value != self._attr_native_value
             self._attr_name = new_name
             self._attr_native_value = new_value
             self._attr_extra_state_attributes = new_attributes
+            if value_changed:
+                self._async_cancel_held_back_write()
+                self._value_written_at = time.monotonic()
+            self.async_write_ha_state()
+            if value_changed and self._next_timer_cache is not None:
+                self._async_schedule_next_timer_refresh()
+
+
+class WebastoRequestBudgetSensor(
+    CoordinatorEntity[WebastoConnectUpdateCoordinator], SensorEntity
+):
+    """Diagnostic sensor for the cloud request budget of the account."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        description: WebastoConnectSensorEntityDescription,
+        coordinator: WebastoConnectUpdateCoordinator,
+    ) -> None:
+        """Initialize a request budget sensor."""
+        # Budget usage changes with every request, not with device payloads.
+        super().__init__(coordinator, context=WebastoBudgetListenerContext())
+        entry_id = coordinator.config_entry.entry_id
+
+        self.entity_description = description
+        self._attr_name = description.name  # type: ignore[assignment]
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_account")},
+            name=ACCOUNT_DEVICE_NAME,
+            manufacturer="Webasto",
+            model="ThermoConnect cloud",
+            entry_type=DeviceEntryType.SERVICE,
+            configuration_url="https://my.webastoconnect.com",
+        )
+        self._attr_icon = description.icon
+        self._attr_native_value = description.value_fn(  # type: ignore
+            self.coordinator
+        )
+        self.entity_id = sensor.ENTITY_ID_FORMAT.format(
+            util_slugify(f"{ACCOUNT_DEVICE_NAME} {self._attr_name}")
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        new_value = self.entity_description.value_fn(  # type: ignore
+            self.coordinator
+        )
+        if new_value != self._attr_native_value:
+            self._attr_native_value = new_value
             self.async_write_ha_state()
@@ -8,10 +8,14 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import device_registry as dr
 from homeassistant.util import dt as dt_util
 from pywebasto.exceptions import InvalidRequestException, UnauthorizedException
 
@@ -46,10 +50,19 @@ except ImportError:
 
 from .const import (
     DOMAIN,
+    SERVICE_APPLY_TIMERS,
     SERVICE_CREATE_TIMER,
     SERVICE_DELETE_TIMER,
+    SERVICE_GET_LOCATION_TRAIL,
+    SERVICE_GET_TIMERS,
     SERVICE_UPDATE_TIMER,
 )
+from .device_index import async_get_device_index
+from .timers import (
+    _next_timer_sensor_payload,
+    _payload_simple_timers,
+    _replace_line_timers,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +80,12 @@ ATTR_LATITUDE = "latitude"
 ATTR_LONGITUDE = "longitude"
 ATTR_CLEAR_LOCATION = "clear_location"
 ATTR_LINE = "line"
+ATTR_OPERATIONS = "operations"
+ATTR_OPERATION = "operation"
+ATTR_TIMERS = "timers"
+OPERATION_CREATE = "create"
+OPERATION_UPDATE = "update"
+OPERATION_DELETE = "delete"
 LINE_HEATER = "heater"
 LINE_VENTILATION = "ventilation"
 LINE_HEATER_LEGACY = "OUTH"
@@ -87,85 +106,93 @@ WEEKDAY_TO_MASK = {
     "sunday": 64,
 }
 
-_BASE_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.string})
-_CREATE_TIMER_SCHEMA = _BASE_SCHEMA.extend(
+_LOCATION_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_START_TIME): cv.string,
-        vol.Required(ATTR_DURATION_MINUTES): vol.All(vol.Coerce(int), vol.Range(min=1)),
-        vol.Optional(ATTR_REPEAT_DAYS, default=[]): [vol.In(tuple(WEEKDAY_TO_MASK))],
-        vol.Optional(ATTR_REPEAT): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(ATTR_ENABLED, default=True): cv.boolean,
-        vol.Optional(ATTR_LOCATION): vol.Schema(
-            {
-                vol.Required("latitude"): vol.Coerce(float),
-                vol.Required("longitude"): vol.Coerce(float),
-                vol.Optional("radius"): vol.Coerce(float),
-            }
-        ),
-        vol.Optional(ATTR_LATITUDE): cv.string,
-        vol.Optional(ATTR_LONGITUDE): cv.string,
+        vol.Required("latitude"): vol.Coerce(float),
+        vol.Required("longitude"): vol.Coerce(float),
+        vol.Optional("radius"): vol.Coerce(float),
     }
 )
+_TIMER_INDEX = vol.All(vol.Coerce(int), vol.Range(min=0))
+_CREATE_TIMER_FIELDS = {
+    vol.Required(ATTR_START_TIME): cv.string,
+    vol.Required(ATTR_DURATION_MINUTES): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(ATTR_REPEAT_DAYS, default=[]): [vol.In(tuple(WEEKDAY_TO_MASK))],
+    vol.Optional(ATTR_REPEAT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_ENABLED, default=True): cv.boolean,
+    vol.Optional(ATTR_LOCATION): _LOCATION_SCHEMA,
+    vol.Optional(ATTR_LATITUDE): cv.string,
+    vol.Optional(ATTR_LONGITUDE): cv.string,
+}
+_UPDATE_TIMER_FIELDS = {
+    vol.Required(ATTR_TIMER_INDEX): _TIMER_INDEX,
+    vol.Optional(ATTR_START_TIME): cv.string,
+    vol.Optional(ATTR_DURATION_MINUTES): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(ATTR_REPEAT_DAYS): [vol.In(tuple(WEEKDAY_TO_MASK))],
+    vol.Optional(ATTR_REPEAT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_ENABLED): cv.boolean,
+    vol.Optional(ATTR_CLEAR_LOCATION): cv.boolean,
+    vol.Optional(ATTR_LOCATION): _LOCATION_SCHEMA,
+    vol.Optional(ATTR_LATITUDE): vol.Any(cv.string, None),
+    vol.Optional(ATTR_LONGITUDE): vol.Any(cv.string, None),
+}
+
+_BASE_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.string})
+_CREATE_TIMER_SCHEMA = _BASE_SCHEMA.extend(_CREATE_TIMER_FIELDS)
 _UPDATE_TIMER_SCHEMA = _BASE_SCHEMA.extend(
     {
         vol.Optional(ATTR_LINE, default=LINE_HEATER): vol.In(VALID_TIMER_LINES),
-        vol.Required(ATTR_TIMER_INDEX): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(ATTR_START_TIME): cv.string,
-        vol.Optional(ATTR_DURATION_MINUTES): vol.All(vol.Coerce(int), vol.Range(min=1)),
-        vol.Optional(ATTR_REPEAT_DAYS): [vol.In(tuple(WEEKDAY_TO_MASK))],
-        vol.Optional(ATTR_REPEAT): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(ATTR_ENABLED): cv.boolean,
-        vol.Optional(ATTR_CLEAR_LOCATION): cv.boolean,
-        vol.Optional(ATTR_LOCATION): vol.Schema(
-            {
-                vol.Required("latitude"): vol.Coerce(float),
-                vol.Required("longitude"): vol.Coerce(float),
-                vol.Optional("radius"): vol.Coerce(float),
-            }
-        ),
-        vol.Optional(ATTR_LATITUDE): vol.Any(cv.string, None),
-        vol.Optional(ATTR_LONGITUDE): vol.Any(cv.string, None),
+        **_UPDATE_TIMER_FIELDS,
     }
 )
 _DELETE_TIMER_SCHEMA = _BASE_SCHEMA.extend(
     {
-        vol.Required(ATTR_TIMER_INDEX): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(ATTR_TIMER_INDEX): _TIMER_INDEX,
     }
 )
+_OPERATION_LINE = {vol.Optional(ATTR_LINE): vol.In(VALID_TIMER_LINES)}
+_TIMER_OPERATION_SCHEMA = vol.Any(
+    vol.Schema(
+        {
+            vol.Required(ATTR_OPERATION): OPERATION_CREATE,
+            **_OPERATION_LINE,
+            **_CREATE_TIMER_FIELDS,
+        }
+    ),
+    vol.Schema(
+        {
+            vol.Required(ATTR_OPERATION): OPERATION_UPDATE,
+            **_OPERATION_LINE,
+            **_UPDATE_TIMER_FIELDS,
+        }
+    ),
+    vol.Schema(
+        {
+            vol.Required(ATTR_OPERATION): OPERATION_DELETE,
+            **_OPERATION_LINE,
+            vol.Required(ATTR_TIMER_INDEX): _TIMER_INDEX,
+        }
+    ),
+)
+_APPLY_TIMERS_SCHEMA = vol.All(
+    _BASE_SCHEMA.extend(
+        {
+            vol.Optional(ATTR_LINE): vol.In(VALID_TIMER_LINES),
+            vol.Exclusive(ATTR_OPERATIONS, "changes"): [_TIMER_OPERATION_SCHEMA],
+            vol.Exclusive(ATTR_TIMERS, "changes"): [vol.Schema(_CREATE_TIMER_FIELDS)],
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_OPERATIONS, ATTR_TIMERS),
+)
 
 
 def _coordinator_and_device(hass: HomeAssistant, device_id: str) -> tuple[Any, Any]:
     """Resolve coordinator + device from HA device id or Webasto API device id."""
-    # Backwards compatibility for callers that still pass API device id directly.
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        runtime_data = getattr(entry, "runtime_data", None)
-        if runtime_data is None:
-            continue
-        coordinator = runtime_data.coordinator
-        for cloud_device in coordinator.cloud.devices.values():
-            if str(cloud_device.device_id) == str(device_id):
-                return coordinator, cloud_device
-
-    # Preferred path: device selector value (HA device registry id).
-    device_registry = dr.async_get(hass)
-    ha_device = device_registry.async_get(str(device_id))
-    if ha_device is not None:
-        internal_device_ids = {
-            identifier
-            for domain, identifier in ha_device.identifiers
-            if domain == DOMAIN
-        }
-
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            runtime_data = getattr(entry, "runtime_data", None)
-            if runtime_data is None:
-                continue
-            coordinator = runtime_data.coordinator
-            for internal_id, cloud_device in coordinator.cloud.devices.items():
-                if str(internal_id) in internal_device_ids:
-                    return coordinator, cloud_device
-
-    raise HomeAssistantError(f"No Webasto device found with device_id '{device_id}'")
+    if (found := async_get_device_index(hass).async_resolve(device_id)) is None:
+        raise HomeAssistantError(
+            f"No Webasto device found with device_id '{device_id}'"
+        )
+    return found
 
 
 def _ensure_timer_api_support(coordinator: Any) -> None:
@@ -353,6 +380,58 @@ def _coerce_timer(
     )
 
 
+async def _async_line_timers(
+    coordinator: Any, device: Any, output: Any
+) -> list[SimpleTimer]:
+    """Return the timers of an output line, fetching them only when stale."""
+
+    async def _fetch() -> list[dict[str, Any]]:
+        timers = await coordinator.cloud.get_timers(device=device, line=output)
+        # get_timers refreshed the account, every device payload is fresh now.
+        coordinator.timer_cache.feed_devices(coordinator.cloud.devices)
+        return [timer.to_api_dict() for timer in timers]
+
+    payload = await coordinator.timer_cache.async_get(
+        device.device_id, output.value, _fetch
+    )
+    try:
+        return [SimpleTimer.from_api_dict(timer) for timer in payload]
+    except (KeyError, TypeError, ValueError) as err:
+        raise InvalidRequestException(
+            f"Invalid simple timer data in response: {err}"
+        ) from err
+
+
+def _payload_timers(last_data: Any, output: Any) -> list[SimpleTimer] | None:
+    """Return the timers of an output line in a device payload."""
+    try:
+        return [
+            SimpleTimer.from_api_dict(timer)
+            for timer in _payload_simple_timers(last_data, {output.value})
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def _async_save_line_timers(
+    coordinator: Any, device: Any, timers: list[SimpleTimer], output: Any
+) -> None:
+    """Save the timers of an output line and drop its cached copy."""
+    try:
+        await coordinator.cloud.save_timers(device=device, timers=timers, line=output)
+    finally:
+        coordinator.timer_cache.invalidate(device.device_id, output.value)
+    # save_timers refreshed the account, but the cloud may still report the old
+    # list for a moment. The payload follows what was saved either way.
+    last_data = getattr(device, "last_data", None)
+    if _payload_timers(last_data, output) != timers:
+        if _replace_line_timers(
+            last_data, output.value, [timer.to_api_dict() for timer in timers]
+        ):
+            coordinator.async_mark_device_edited(device.device_id)
+    coordinator.timer_cache.feed_devices(coordinator.cloud.devices)
+
+
 async def async_create_timer(
     coordinator: Any,
     device: Any,
@@ -367,11 +446,11 @@ async def async_create_timer(
             if line is not None
             else _active_output_for_device(device)
         )
-        timers = await coordinator.cloud.get_timers(device=device, line=output)
+        timers = await _async_line_timers(coordinator, device, output)
         timers.append(timer)
-        await coordinator.cloud.save_timers(device=device, timers=timers, line=output)
+        await _async_save_line_timers(coordinator, device, timers, output)
 
-    await coordinator.async_execute_cloud_call(_operation)
+    await coordinator.async_execute_device_call(device.device_id, _operation)
     coordinator.async_update_listeners()
 
 
@@ -391,18 +470,18 @@ async def async_update_timer(
 
         if line is not None:
             output = _output_for_line(line)
-            timers = await coordinator.cloud.get_timers(device=device, line=output)
+            timers = await _async_line_timers(coordinator, device, output)
             total_timers = len(timers)
         else:
-            heater_timers = await coordinator.cloud.get_timers(
-                device=device, line=Outputs.HEATER
+            heater_timers = await _async_line_timers(
+                coordinator, device, Outputs.HEATER
             )
             if timer_index < len(heater_timers):
                 output = Outputs.HEATER
                 timers = heater_timers
             else:
-                vent_timers = await coordinator.cloud.get_timers(
-                    device=device, line=Outputs.VENTILATION
+                vent_timers = await _async_line_timers(
+                    coordinator, device, Outputs.VENTILATION
                 )
                 selected_index = timer_index - len(heater_timers)
                 output = Outputs.VENTILATION
@@ -424,9 +503,9 @@ async def async_update_timer(
             existing=timers[selected_index],
             hass=hass,
         )
-        await coordinator.cloud.save_timers(device=device, timers=timers, line=output)
+        await _async_save_line_timers(coordinator, device, timers, output)
 
-    await coordinator.async_execute_cloud_call(_operation)
+    await coordinator.async_execute_device_call(device.device_id, _operation)
     coordinator.async_update_listeners()
 
 
@@ -439,18 +518,108 @@ async def async_delete_timer(
 
     async def _operation() -> None:
         output = _active_output_for_device(device)
-        timers = await coordinator.cloud.get_timers(device=device, line=output)
+        timers = await _async_line_timers(coordinator, device, output)
         if timer_index >= len(timers):
             active_scope = "active output timers"
             _raise_timer_index_error(timer_index, len(timers), scope=active_scope)
         del timers[timer_index]
-        await coordinator.cloud.save_timers(device=device, timers=timers, line=output)
+        await _async_save_line_timers(coordinator, device, timers, output)
+
+    await coordinator.async_execute_device_call(device.device_id, _operation)
+    coordinator.async_update_listeners()
+
+
+async def async_apply_timers(
+    coordinator: Any,
+    device: Any,
+    operations: list[dict[str, Any]] | None = None,
+    timers: list[dict[str, Any]] | None = None,
+    line: str | None = None,
+    hass: HomeAssistant | None = None,
+) -> None:
+    """Apply timer operations or a desired timer list with one save per line.
+
+    Operations run in order, an index refers to the list left by the previous
+    operations. Everything is validated before the first save, lines that end
+    up unchanged are not written.
+    """
+    default_output = (
+        _output_for_line(line)
+        if line is not None
+        else _active_output_for_device(device)
+    )
+    desired = (
+        None
+        if timers is None
+        else [_coerce_timer(timer_data, hass=hass) for timer_data in timers]
+    )
 
-    await coordinator.async_execute_cloud_call(_operation)
+    async def _operation() -> None:
+        current: dict[Any, list[SimpleTimer]] = {}
+        edited: dict[Any, list[SimpleTimer]] = {}
+
+        async def _line_timers(output: Any) -> list[SimpleTimer]:
+            if output not in edited:
+                current[output] = await _async_line_timers(coordinator, device, output)
+                edited[output] = list(current[output])
+            return edited[output]
+
+        if desired is not None:
+            await _line_timers(default_output)
+            edited[default_output] = desired
+
+        for position, operation in enumerate(operations or []):
+            output = (
+                _output_for_line(operation[ATTR_LINE])
+                if operation.get(ATTR_LINE) is not None
+                else default_output
+            )
+            line_timers = await _line_timers(output)
+            kind = operation[ATTR_OPERATION]
+            if kind == OPERATION_CREATE:
+                line_timers.append(_coerce_timer(operation, hass=hass))
+                continue
+
+            timer_index = int(operation[ATTR_TIMER_INDEX])
+            if timer_index >= len(line_timers):
+                _raise_timer_index_error(
+                    timer_index,
+                    len(line_timers),
+                    scope=f"{kind} operation {position}",
+                )
+            if kind == OPERATION_UPDATE:
+                line_timers[timer_index] = _coerce_timer(
+                    operation, existing=line_timers[timer_index], hass=hass
+                )
+            else:
+                del line_timers[timer_index]
+
+        for output, line_timers in edited.items():
+            if line_timers == current[output]:
+                LOGGER.debug("Timers of %s are unchanged, skipping save", output.value)
+                continue
+            await _async_save_line_timers(coordinator, device, line_timers, output)
+
+    await coordinator.async_execute_device_call(device.device_id, _operation)
     coordinator.async_update_listeners()
 
 
-async def _async_handle_create_timer(hass: HomeAssistant, call: ServiceCall) -> None:
+def _timers_response(device: Any) -> ServiceResponse:
+    """Return the timers of a device with their next runs."""
+    _, attributes = _next_timer_sensor_payload(device)
+    return attributes
+
+
+def _timer_service_response(call: ServiceCall, device: Any) -> ServiceResponse:
+    """Return the timers of a device with their next runs, when asked for."""
+    if not call.return_response:
+        return None
+    return _timers_response(device)
+
+
+async def _async_handle_create_timer(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
     """Handle create_timer service."""
     coordinator, device = _coordinator_and_device(hass, call.data[ATTR_DEVICE_ID])
     _ensure_timer_api_support(coordinator)
@@ -466,8 +635,12 @@ async def _async_handle_create_timer(hass: HomeAssistant, call: ServiceCall) ->
     except (InvalidRequestException, UnauthorizedException) as err:
         raise HomeAssistantError(f"Failed to create timer: {err}") from err
 
+    return _timer_service_response(call, device)
+
 
-async def _async_handle_update_timer(hass: HomeAssistant, call: ServiceCall) -> None:
+async def _async_handle_update_timer(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
     """Handle update_timer service."""
     coordinator, device = _coordinator_and_device(hass, call.data[ATTR_DEVICE_ID])
     _ensure_timer_api_support(coordinator)
@@ -490,8 +663,12 @@ async def _async_handle_update_timer(hass: HomeAssistant, call: ServiceCall) ->
     except (InvalidRequestException, UnauthorizedException) as err:
         raise HomeAssistantError(f"Failed to update timer: {err}") from err
 
+    return _timer_service_response(call, device)
+
 
-async def _async_handle_delete_timer(hass: HomeAssistant, call: ServiceCall) -> None:
+async def _async_handle_delete_timer(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
     """Handle delete_timer service."""
     coordinator, device = _coordinator_and_device(hass, call.data[ATTR_DEVICE_ID])
     _ensure_timer_api_support(coordinator)
@@ -502,18 +679,68 @@ async def _async_handle_delete_timer(hass: HomeAssistant, call: ServiceCall) ->
     except (InvalidRequestException, UnauthorizedException) as err:
         raise HomeAssistantError(f"Failed to delete timer: {err}") from err
 
+    return _timer_service_response(call, device)
+
+
+async def _async_handle_apply_timers(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle apply_timers service."""
+    coordinator, device = _coordinator_and_device(hass, call.data[ATTR_DEVICE_ID])
+    _ensure_timer_api_support(coordinator)
+
+    try:
+        await async_apply_timers(
+            coordinator,
+            device,
+            operations=call.data.get(ATTR_OPERATIONS),
+            timers=call.data.get(ATTR_TIMERS),
+            line=call.data.get(ATTR_LINE),
+            hass=hass,
+        )
+    except (InvalidRequestException, UnauthorizedException) as err:
+        raise HomeAssistantError(f"Failed to apply timers: {err}") from err
+
+    return _timer_service_response(call, device)
+
+
+async def _async_handle_get_timers(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle get_timers service."""
+    _, device = _coordinator_and_device(hass, call.data[ATTR_DEVICE_ID])
+    return _timers_response(device)
+
+
+async def _async_handle_get_location_trail(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle get_location_trail service."""
+    coordinator, device = _coordinator_and_device(hass, call.data[ATTR_DEVICE_ID])
+    trail = coordinator.location_trail(device.device_id)
+    return {"trail": trail.as_list() if trail is not None else []}
+
 
 def async_register_services(hass: HomeAssistant) -> None:
     """Register domain services."""
 
-    async def _handle_create(call: ServiceCall) -> None:
-        await _async_handle_create_timer(hass, call)
+    async def _handle_create(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_create_timer(hass, call)
+
+    async def _handle_update(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_update_timer(hass, call)
 
-    async def _handle_update(call: ServiceCall) -> None:
-        await _async_handle_update_timer(hass, call)
+    async def _handle_delete(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_delete_timer(hass, call)
 
-    async def _handle_delete(call: ServiceCall) -> None:
-        await _async_handle_delete_timer(hass, call)
+    async def _handle_apply(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_apply_timers(hass, call)
+
+    async def _handle_get(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_get_timers(hass, call)
+
+    async def _handle_get_trail(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_get_location_trail(hass, call)
 
     if not hass.services.has_service(DOMAIN, SERVICE_CREATE_TIMER):
         hass.services.async_register(
@@ -521,6 +748,7 @@ def async_register_services(hass: HomeAssistant) -> None:
             SERVICE_CREATE_TIMER,
             _handle_create,
             schema=_CREATE_TIMER_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
         )
     if not hass.services.has_service(DOMAIN, SERVICE_UPDATE_TIMER):
         hass.services.async_register(
@@ -528,6 +756,7 @@ def async_register_services(hass: HomeAssistant) -> None:
             SERVICE_UPDATE_TIMER,
             _handle_update,
             schema=_UPDATE_TIMER_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
         )
     if not hass.services.has_service(DOMAIN, SERVICE_DELETE_TIMER):
         hass.services.async_register(
@@ -535,11 +764,43 @@ def async_register_services(hass: HomeAssistant) -> None:
             SERVICE_DELETE_TIMER,
             _handle_delete,
             schema=_DELETE_TIMER_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_APPLY_TIMERS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_APPLY_TIMERS,
+            _handle_apply,
+            schema=_APPLY_TIMERS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_TIMERS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_TIMERS,
+            _handle_get,
+            schema=_BASE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_LOCATION_TRAIL):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_LOCATION_TRAIL,
+            _handle_get_trail,
+            schema=_BASE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
         )
 
 
 def async_unregister_services(hass: HomeAssistant) -> None:
     """Unregister domain services."""
-    for service in (SERVICE_CREATE_TIMER, SERVICE_UPDATE_TIMER, SERVICE_DELETE_TIMER):
+    for service in (
+        SERVICE_CREATE_TIMER,
+        SERVICE_UPDATE_TIMER,
+        SERVICE_DELETE_TIMER,
+        SERVICE_APPLY_TIMERS,
+        SERVICE_GET_TIMERS,
+        SERVICE_GET_LOCATION_TRAIL,
+    ):
         if hass.services.has_service(DOMAIN, service):
             hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,202 @@
+"""Cloud sessions shared by config entries and flows using the same account."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from pywebasto import WebastoConnect
+
+from .budget import POLL_REQUEST_COST, async_get_request_budget
+from .const import DOMAIN
+from .timers import TimerCache
+
+DATA_CLOUD_SESSIONS = f"{DOMAIN}_cloud_sessions"
+LOGGER = logging.getLogger(__name__)
+
+
+def _session_key(username: str) -> str:
+    """Return the registry key of an account."""
+    return username.strip().lower()
+
+
+class _CloudOperationLocks:
+    """Per-device cloud operation locks plus an exclusive session lock.
+
+    Device operations only serialize with other operations on the same device.
+    Session operations change shared ``pywebasto`` state, like the active webapi
+    device, so they wait for running device operations and block new ones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the lock manager."""
+        self._device_locks: dict[Any, asyncio.Lock] = {}
+        self._session_lock = asyncio.Lock()
+        self._active_device_operations = 0
+        self._devices_idle = asyncio.Event()
+        self._devices_idle.set()
+
+    @asynccontextmanager
+    async def device(self, device_id: Any) -> AsyncIterator[None]:
+        """Hold the lock of a single device."""
+        lock = self._device_locks.setdefault(device_id, asyncio.Lock())
+        async with lock:
+            async with self._session_lock:
+                self._active_device_operations += 1
+                self._devices_idle.clear()
+            try:
+                yield
+            finally:
+                self._active_device_operations -= 1
+                if self._active_device_operations == 0:
+                    self._devices_idle.set()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[None]:
+        """Hold the session lock once no device operation is running."""
+        async with self._session_lock:
+            await self._devices_idle.wait()
+            yield
+
+
+@dataclass(slots=True, eq=False)
+class WebastoCloudSession:
+    """Authenticated pywebasto client shared by entries of one account.
+
+    The first joined coordinator is the leader and runs the only poll loop,
+    the other coordinators are refreshed from its polls.
+    """
+
+    cloud: WebastoConnect
+    password: str | None
+    key: str | None = None
+    registry: dict[str, "WebastoCloudSession"] | None = None
+    coordinators: list[Any] = field(default_factory=list)
+    connected: bool = False
+    connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    locks: _CloudOperationLocks = field(default_factory=_CloudOperationLocks)
+    timer_cache: TimerCache = field(default_factory=TimerCache)
+
+    def is_leader(self, coordinator: Any) -> bool:
+        """Return True when the coordinator runs the poll loop of the session."""
+        return not self.coordinators or self.coordinators[0] is coordinator
+
+    @property
+    def budget_entry_id(self) -> str:
+        """Return the entry charged for requests made outside a coordinator."""
+        if self.coordinators:
+            return self.coordinators[0].config_entry.entry_id
+        return self.key or ""
+
+    def followers(self, coordinator: Any) -> list[Any]:
+        """Return the coordinators refreshed by the polls of a leader."""
+        if not self.is_leader(coordinator):
+            return []
+        return self.coordinators[1:]
+
+    async def async_connect(self) -> None:
+        """Log in once, later callers reuse the authenticated client."""
+        async with self.connect_lock:
+            if self.connected:
+                # Reuses fresh account data instead of logging in again.
+                async with self.locks.session():
+                    await self.cloud.update()
+                return
+            await self.cloud.connect()
+            self.connected = True
+
+    @callback
+    def async_register(self) -> None:
+        """Register the session again after the last coordinator closed it."""
+        if self.registry is not None and self.key is not None:
+            # Another session may have taken the account, this one stays private.
+            self.registry.setdefault(self.key, self)
+
+    @callback
+    def async_join(self, coordinator: Any) -> None:
+        """Attach a coordinator to the session."""
+        if coordinator not in self.coordinators:
+            self.coordinators.append(coordinator)
+
+    async def async_leave(self, coordinator: Any) -> None:
+        """Detach a coordinator, closing the client when no one uses it anymore."""
+        was_leader = self.is_leader(coordinator)
+        if coordinator in self.coordinators:
+            self.coordinators.remove(coordinator)
+
+        if self.coordinators:
+            if was_leader:
+                self.coordinators[0].async_take_over_polling()
+            return
+
+        if self.registry is not None and self.registry.get(self.key) is self:
+            del self.registry[self.key]
+        self.connected = False
+        await self.cloud.close()
+
+
+@callback
+def async_lookup_cloud_session(
+    hass: HomeAssistant, username: str, password: str | None
+) -> WebastoCloudSession | None:
+    """Return the registered session of an account when the password matches."""
+    sessions: dict[str, WebastoCloudSession] = hass.data.get(DATA_CLOUD_SESSIONS, {})
+    session = sessions.get(_session_key(username))
+    if session is None or session.password != password:
+        return None
+    return session
+
+
+@callback
+def async_get_cloud_session(
+    hass: HomeAssistant,
+    username: str,
+    password: str | None,
+    cloud_factory: Callable[[], WebastoConnect],
+) -> WebastoCloudSession:
+    """Return the shared session of an account, creating it when needed."""
+    if (session := async_lookup_cloud_session(hass, username, password)) is not None:
+        return session
+
+    sessions: dict[str, WebastoCloudSession] = hass.data.setdefault(
+        DATA_CLOUD_SESSIONS, {}
+    )
+    key = _session_key(username)
+    if key in sessions and sessions[key].coordinators:
+        # Credentials differ from the session in use, keep this client private.
+        LOGGER.debug("Creating a separate Webasto session for %s", username)
+        return WebastoCloudSession(cloud=cloud_factory(), password=password)
+
+    session = WebastoCloudSession(
+        cloud=cloud_factory(), password=password, key=key, registry=sessions
+    )
+    sessions[key] = session
+    return session
+
+
+async def async_validate_credentials(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    cloud_factory: Callable[[], WebastoConnect],
+) -> None:
+    """Validate credentials, reusing a connected session when they match."""
+    session = async_lookup_cloud_session(hass, username, password)
+    if session is not None and session.connected:
+        LOGGER.debug("Reusing connected Webasto session for %s", username)
+        # Charged like a command, a user is waiting on the flow.
+        async_get_request_budget(hass, username).consume(
+            session.budget_entry_id, POLL_REQUEST_COST, command=True
+        )
+        async with session.locks.session():
+            await session.cloud.update()
+        return
+
+    webasto = cloud_factory()
+    try:
+        await webasto.connect()
+    finally:
+        await webasto.close()
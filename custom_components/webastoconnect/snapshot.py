@@ -0,0 +1,101 @@
+"""Device snapshots restoring entities before the Webasto cloud answers."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from pywebasto import WebastoConnect, WebastoDevice
+
+from .const import DOMAIN
+
+SNAPSHOT_STORAGE_VERSION = 1
+# Device data changes on most polls, save at most once per delay.
+SNAPSHOT_SAVE_DELAY = 60
+# Stored instead of the GPS position, the first poll brings the real one back.
+SNAPSHOT_LOCATION = {"state": "OFF"}
+LOGGER = logging.getLogger(__name__)
+
+
+def _snapshot_key(entry_id: str) -> str:
+    """Return the storage key of a config entry snapshot."""
+    return f"{DOMAIN}.{entry_id}.snapshot"
+
+
+class DeviceSnapshotStore:
+    """Last good device payloads of a config entry, kept in HA storage."""
+
+    # Client and device names the scheduled save reads when it runs.
+    _pending: tuple[WebastoConnect, dict[str, str]] | None = None
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, _snapshot_key(entry_id), private=True
+        )
+
+    async def async_restore(self, cloud: WebastoConnect) -> dict[str, str] | None:
+        """Hydrate the client with the stored devices, returning their names.
+
+        Returns None when no usable snapshot exists.
+        """
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as err:  # noqa: BLE001
+            LOGGER.warning("Could not load Webasto device snapshot: %s", err)
+            return None
+
+        if not isinstance(snapshot, dict) or not snapshot.get("devices"):
+            return None
+
+        devices: dict[str, WebastoDevice] = {}
+        try:
+            for device_id, data in snapshot["devices"].items():
+                device = WebastoDevice(device_id, data["name"])
+                device.app_data = data["app_data"]
+                if data.get("settings"):
+                    device.settings = data["settings"]
+                devices[device_id] = device
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            LOGGER.warning("Ignoring invalid Webasto device snapshot: %s", err)
+            return None
+
+        cloud.devices.update(devices)
+        LOGGER.debug("Restored %s Webasto device(s) from snapshot", len(devices))
+        return dict(snapshot.get("device_names") or {})
+
+    @callback
+    def async_schedule_save(
+        self, cloud: WebastoConnect, device_names: dict[str, str]
+    ) -> None:
+        """Save the current device data within the save delay.
+
+        A pending save is not pushed back, it stores the data current when it runs.
+        """
+        scheduled = self._pending is not None
+        self._pending = (cloud, device_names)
+        if not scheduled:
+            self._store.async_delay_save(self._data, SNAPSHOT_SAVE_DELAY)
+
+    def _data(self) -> dict[str, Any]:
+        """Return the device data of the scheduled save."""
+        if self._pending is None:
+            return {}
+        cloud, device_names = self._pending
+        self._pending = None
+        return {
+            "devices": {
+                str(device_id): {
+                    "name": device.name,
+                    "app_data": {**device.app_data, "location": SNAPSHOT_LOCATION},
+                    "settings": device.settings or None,
+                }
+                for device_id, device in cloud.devices.items()
+                if isinstance(device.app_data, dict) and not device.pending_approval
+            },
+            "device_names": device_names,
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot."""
+        await self._store.async_remove()
@@ -9,9 +9,14 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import callback
 from homeassistant.util import slugify as util_slugify
 
-from . import WebastoConfigEntry
-from .api import WebastoConnectUpdateCoordinator
-from .base import WebastoBaseEntity, WebastoConnectSwitchEntityDescription
+from .api import WebastoConfigEntry, WebastoConnectUpdateCoordinator
+from .base import (
+    CONNECTION_DATA_KEYS,
+    WebastoConnectSwitchEntityDescription,
+    WebastoOptimisticEntity,
+)
+from .command_queue import CoalescingCommandQueue
+from .payload import OUTPUT_DATA_KEYS
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +29,7 @@ SWITCHES = [
         command_fn=lambda webasto, id, state: webasto.set_output_main(id, state),
         name_fn=lambda webasto: webasto.output_main_name,
         entity_registry_enabled_default=True,
+        data_keys=OUTPUT_DATA_KEYS + CONNECTION_DATA_KEYS,
     ),
     WebastoConnectSwitchEntityDescription(
         key="ventilation_mode",
@@ -32,6 +38,7 @@ SWITCHES = [
         value_fn=lambda webasto: cast(bool, webasto.is_ventilation),
         command_fn=lambda webasto, id, state: webasto.ventilation_mode(id, state),
         entity_registry_enabled_default=False,
+        data_keys=OUTPUT_DATA_KEYS + CONNECTION_DATA_KEYS,
     ),
     WebastoConnectSwitchEntityDescription(
         key="aux1_output",
@@ -41,6 +48,7 @@ SWITCHES = [
         command_fn=lambda webasto, id, state: webasto.set_output_aux1(id, state),
         name_fn=lambda webasto: webasto.output_aux1_name,
         entity_registry_enabled_default=True,
+        data_keys=OUTPUT_DATA_KEYS + CONNECTION_DATA_KEYS,
     ),
     WebastoConnectSwitchEntityDescription(
         key="aux2_output",
@@ -50,6 +58,7 @@ SWITCHES = [
         command_fn=lambda webasto, id, state: webasto.set_output_aux2(id, state),
         name_fn=lambda webasto: webasto.output_aux2_name,
         entity_registry_enabled_default=True,
+        data_keys=OUTPUT_DATA_KEYS + CONNECTION_DATA_KEYS,
     ),
 ]
 
@@ -77,9 +86,11 @@ async def async_setup_entry(hass, entry: WebastoConfigEntry, async_add_devices):
     async_add_devices(switches)
 
 
-class WebastoConnectSwitch(WebastoBaseEntity, SwitchEntity):
+class WebastoConnectSwitch(WebastoOptimisticEntity, SwitchEntity):
     """Representation of a Webasto Connect switch."""
 
+    _command_queue: CoalescingCommandQueue[bool] | None = None
+
     def __init__(
         self,
         device_id: int,
@@ -118,6 +129,8 @@ class WebastoConnectSwitch(WebastoBaseEntity, SwitchEntity):
         self._attr_is_on = self.entity_description.value_fn(  # type: ignore
             self._device
         )
+        if self._optimistic_value is not None:
+            self._attr_is_on = self._optimistic_value
 
         if self.entity_description.key == "main_output":
             if self._device.is_ventilation:
@@ -132,21 +145,25 @@ class WebastoConnectSwitch(WebastoBaseEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         LOGGER.debug("Turning on %s", self.entity_id)
-        await self.coordinator.async_execute_cloud_call(
-            self.entity_description.command_fn,  # type: ignore[arg-type]
-            self._cloud,
-            self._cloud.devices[self._device_id],
-            True,
-        )
-        self.coordinator.async_update_listeners()
+        await self._async_command_with_confirmation(True, self._async_queue_state)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         LOGGER.debug("Turning off %s", self.entity_id)
-        await self.coordinator.async_execute_cloud_call(
+        await self._async_command_with_confirmation(False, self._async_queue_state)
+
+    async def _async_queue_state(self, state: bool) -> None:
+        """Queue a state write, coalescing rapid on/off toggles."""
+        if self._command_queue is None:
+            self._command_queue = CoalescingCommandQueue(self._async_send_state)
+        await self._command_queue.async_submit(state)
+
+    async def _async_send_state(self, state: bool) -> None:
+        """Send a state write to the device."""
+        await self.coordinator.async_execute_device_call(
+            self._device_id,
             self.entity_description.command_fn,  # type: ignore[arg-type]
             self._cloud,
             self._cloud.devices[self._device_id],
-            False,
+            state,
         )
-        self.coordinator.async_update_listeners()
@@ -0,0 +1,285 @@
+"""Timer payload helpers shared by the coordinator, sensors and services."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import json
+import time
+from typing import Any
+
+from .payload import TIMER_LINES, DevicePayload, normalize_payload
+
+WEEKDAY_BITMASK = [1, 2, 4, 8, 16, 32, 64]  # Monday..Sunday
+# Payloads older than this are fetched again before editing timers, so edits
+# made in the Webasto app meanwhile are not overwritten.
+TIMER_CACHE_MAX_AGE = 30.0
+
+
+def _payload_simple_timers(
+    last_data: Any, lines: set[str] | frozenset[str] = TIMER_LINES
+) -> list[dict[str, Any]]:
+    """Extract `simple` timers of the given output lines from an API payload."""
+    return normalize_payload(last_data).line_timers(lines)
+
+
+def _next_timer_occurrence_utc(
+    *,
+    start: int,
+    repeat: int,
+    now_utc: datetime,
+) -> datetime | None:
+    """Calculate next UTC occurrence for a timer."""
+    if start <= 0 or start >= 24 * 60:
+        return None
+
+    hour = start // 60
+    minute = start % 60
+
+    if repeat == 0:
+        candidate = now_utc.replace(
+            hour=hour,
+            minute=minute,
+            second=0,
+            microsecond=0,
+        )
+        if candidate <= now_utc:
+            candidate += timedelta(days=1)
+        return candidate
+
+    for day_offset in range(0, 8):
+        candidate_date = now_utc.date() + timedelta(days=day_offset)
+        weekday = candidate_date.weekday()
+        if repeat & WEEKDAY_BITMASK[weekday] == 0:
+            continue
+
+        candidate = datetime(
+            candidate_date.year,
+            candidate_date.month,
+            candidate_date.day,
+            hour,
+            minute,
+            tzinfo=UTC,
+        )
+        if candidate > now_utc:
+            return candidate
+
+    return None
+
+
+def _next_timer_run_utc(
+    webasto: Any, now_utc: datetime, payload: DevicePayload | None = None
+) -> datetime | None:
+    """Return the earliest upcoming run of any enabled timer on a device."""
+    if payload is None:
+        payload = normalize_payload(getattr(webasto, "last_data", None))
+
+    next_run: datetime | None = None
+    for timer in payload.timers:
+        if not timer.get("enabled", False):
+            continue
+        occurrence = _next_timer_occurrence_utc(
+            start=int(timer.get("start", 0)),
+            repeat=int(timer.get("repeat", 0)),
+            now_utc=now_utc,
+        )
+        if occurrence is not None and (next_run is None or occurrence < next_run):
+            next_run = occurrence
+    return next_run
+
+
+def _timer_start_hhmm(start: int) -> str:
+    """Format timer start (minutes after midnight) as HH:MM."""
+    hour = start // 60
+    minute = start % 60
+    return f"{hour:02d}:{minute:02d}"
+
+
+def _line_label(line: str | None) -> str | None:
+    """Return user-friendly timer line label."""
+    if line == "OUTH":
+        return "Heater"
+    if line == "OUTV":
+        return "Ventilation"
+    return line
+
+
+def _next_timer_sensor_payload(
+    webasto: Any,
+    *,
+    now_utc: datetime | None = None,
+    payload: DevicePayload | None = None,
+) -> tuple[datetime | None, dict[str, Any]]:
+    """Build state + attributes for next-enabled-timer sensor."""
+    now = now_utc or datetime.now(UTC)
+    if payload is None:
+        payload = normalize_payload(getattr(webasto, "last_data", None))
+    timers = payload.timers
+
+    timer_items: list[dict[str, Any]] = []
+    next_index: int | None = None
+    next_occurrence: datetime | None = None
+    next_timer: dict[str, Any] | None = None
+
+    for index, timer in enumerate(timers):
+        start = int(timer.get("start", 0))
+        repeat = int(timer.get("repeat", 0))
+        enabled = bool(timer.get("enabled", False))
+        duration = int(timer.get("duration", 0))
+        location = timer.get("location")
+        latitude = location.get("lat") if isinstance(location, dict) else None
+        longitude = location.get("lon") if isinstance(location, dict) else None
+
+        occurrence = None
+        if enabled and start > 0:
+            occurrence = _next_timer_occurrence_utc(
+                start=start,
+                repeat=repeat,
+                now_utc=now,
+            )
+
+        item = {
+            "index": index,
+            "line": _line_label(timer.get("line")),
+            "line_code": timer.get("line"),
+            "start": start,
+            "start_hhmm_utc": _timer_start_hhmm(start) if start > 0 else None,
+            "duration": duration,
+            "repeat": repeat,
+            "enabled": enabled,
+            "latitude": latitude,
+            "longitude": longitude,
+            "next_run_utc": occurrence.isoformat() if occurrence else None,
+        }
+        timer_items.append(item)
+
+        if not enabled or occurrence is None:
+            continue
+        if next_occurrence is None or occurrence < next_occurrence:
+            next_occurrence = occurrence
+            next_index = index
+            next_timer = item
+
+    return next_occurrence, {
+        "next_timer_index": next_index,
+        "next_timer": next_timer,
+        "timers": timer_items,
+    }
+
+
+def _replace_line_timers(
+    last_data: Any, line: str, timers: list[dict[str, Any]]
+) -> bool:
+    """Write the simple timers of an output line into an API payload in place.
+
+    Other timer types of the line are kept. Returns False when the payload has
+    no output for the line.
+    """
+    if not isinstance(last_data, dict):
+        return False
+
+    replaced = False
+    for section in ("outputs", "disabled_outputs"):
+        outputs = last_data.get(section)
+        if not isinstance(outputs, list):
+            continue
+        for output in outputs:
+            if not isinstance(output, dict) or output.get("line") != line:
+                continue
+            current = output.get("timers")
+            kept = [
+                timer
+                for timer in (current if isinstance(current, list) else [])
+                if not (isinstance(timer, dict) and timer.get("type") == "simple")
+            ]
+            # A line listed twice keeps its simple timers in the first output only.
+            output["timers"] = kept if replaced else [*kept, *timers]
+            replaced = True
+    return replaced
+
+
+@dataclass(slots=True)
+class _TimerCacheEntry:
+    """Timers of one device output line."""
+
+    timers: tuple[dict[str, Any], ...]
+    version: int
+    fetched_at: float
+
+
+class TimerCache:
+    """Simple timers per device and output line, fed by device payloads.
+
+    Timers are read from the last payload while it is younger than
+    ``TIMER_CACHE_MAX_AGE``. Older or invalidated lines are fetched again,
+    concurrent readers of a line share one fetch.
+    """
+
+    def __init__(self, max_age: float = TIMER_CACHE_MAX_AGE) -> None:
+        """Initialize the cache."""
+        self._max_age = max_age
+        self._payloads: dict[str, tuple[dict[str, Any], float]] = {}
+        self._entries: dict[tuple[str, str], _TimerCacheEntry] = {}
+        self._invalid: set[tuple[str, str]] = set()
+        self._fetches: dict[tuple[str, str], asyncio.Future[list[dict[str, Any]]]] = {}
+
+    def feed(self, device_id: Any, last_data: Any) -> None:
+        """Remember the latest payload of a device."""
+        if not isinstance(last_data, dict):
+            return
+        device_id = str(device_id)
+        payload = self._payloads.get(device_id)
+        if payload is not None and payload[0] is last_data:
+            # pywebasto replaces the payload on every fetch, this one is known.
+            return
+        self._payloads[device_id] = (last_data, time.monotonic())
+        self._invalid = {key for key in self._invalid if key[0] != device_id}
+
+    def feed_devices(self, devices: Mapping[Any, Any]) -> None:
+        """Remember the latest payloads of all devices."""
+        for device_id, device in devices.items():
+            self.feed(device_id, getattr(device, "last_data", None))
+
+    def invalidate(self, device_id: Any, line: str) -> None:
+        """Forget the timers of a line until a newer payload arrives."""
+        key = (str(device_id), line)
+        self._entries.pop(key, None)
+        self._invalid.add(key)
+
+    def get(self, device_id: Any, line: str) -> list[dict[str, Any]] | None:
+        """Return the timers of a line, or None when they need fetching."""
+        key = (str(device_id), line)
+        payload = self._payloads.get(key[0])
+        if (
+            key in self._invalid
+            or payload is None
+            or time.monotonic() - payload[1] > self._max_age
+        ):
+            return None
+
+        last_data, fetched_at = payload
+        timers = _payload_simple_timers(last_data, {line})
+        version = hash(json.dumps(timers, sort_keys=True, default=str))
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            entry = self._entries[key] = _TimerCacheEntry(
+                tuple(timers), version, fetched_at
+            )
+        return [dict(timer) for timer in entry.timers]
+
+    async def async_get(
+        self,
+        device_id: Any,
+        line: str,
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        """Return the timers of a line, fetching them when the cache is stale."""
+        if (timers := self.get(device_id, line)) is not None:
+            return timers
+
+        key = (str(device_id), line)
+        if (future := self._fetches.get(key)) is None:
+            future = self._fetches[key] = asyncio.ensure_future(fetch())
+            future.add_done_callback(lambda _: self._fetches.pop(key, None))
+        timers = await asyncio.shield(future)
+        return [dict(timer) for timer in timers]
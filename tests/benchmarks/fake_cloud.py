@@ -0,0 +1,451 @@
+"""Local stand-in for the Webasto cloud with fault injection.
+
+Serves the app backend and webapi endpoints used by pywebasto for a synthetic
+fleet, so the real pywebasto HTTP path can be exercised offline. Faults are
+injected per request, either at random through a ``FaultPlan`` or one by one
+with ``FakeWebastoCloud.fail_next``.
+"""
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+import copy
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Any
+from uuid import uuid4
+
+from aiohttp import ClientSession, web
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pywebasto import WebastoConnect  # noqa: E402
+from pywebasto.consts import API_URL, APP_API_URL  # noqa: E402
+
+from tests.benchmarks.fanout import (  # noqa: E402
+    synthetic_app_data,
+    synthetic_settings,
+)
+
+FAKE_USERNAME = "fleet@example.com"
+FAKE_PASSWORD = "fleet-password"
+# Fault kind answering with half a JSON document instead of an HTTP error.
+MALFORMED = "malformed"
+
+
+@dataclass(slots=True)
+class FaultPlan:
+    """Random faults applied to every request of the fake cloud."""
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (401, 403, 429)
+    malformed_rate: float = 0.0
+    seed: int | None = None
+
+
+@dataclass(slots=True)
+class _QueuedFault:
+    """Fault for the next request matching a path fragment."""
+
+    fault: int | str
+    path: str | None
+    remaining: int
+
+
+class _RoutedSession:
+    """aiohttp session sending the pywebasto cloud URLs to the fake cloud."""
+
+    def __init__(self, base_url: str) -> None:
+        """Initialize the session."""
+        self._session = ClientSession()
+        self._routes = ((API_URL, f"{base_url}/webapi"), (APP_API_URL, base_url))
+
+    @property
+    def closed(self) -> bool:
+        """Return True when the underlying session is closed."""
+        return self._session.closed
+
+    def _route(self, url: str) -> str:
+        """Return the fake cloud URL of a Webasto cloud URL."""
+        for prefix, target in self._routes:
+            if url.startswith(prefix):
+                return f"{target}{url[len(prefix) :]}"
+        return url
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        """Send a POST request."""
+        return self._session.post(self._route(url), **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request."""
+        return self._session.request(method, self._route(url), **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        await self._session.close()
+
+
+class FakeCloudClient(WebastoConnect):
+    """pywebasto client talking to a fake cloud instead of the Webasto cloud."""
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        """Initialize the client."""
+        super().__init__(**kwargs)
+        self._base_url = base_url
+
+    async def _get_session(self) -> Any:
+        """Create or reuse a session routed to the fake cloud."""
+        if self._session is None or self._session.closed:
+            self._session = _RoutedSession(self._base_url)
+        return self._session
+
+
+class FakeWebastoCloud:
+    """Webasto cloud serving a synthetic fleet on a local port."""
+
+    def __init__(
+        self,
+        device_count: int = 1,
+        faults: FaultPlan | None = None,
+        username: str = FAKE_USERNAME,
+        password: str = FAKE_PASSWORD,
+    ) -> None:
+        """Initialize the fleet."""
+        self.username = username
+        self.password = password
+        self.faults = faults or FaultPlan()
+        self.devices: dict[str, dict[str, Any]] = {}
+        self.settings: dict[str, dict[str, Any]] = {}
+        for index in range(device_count):
+            payload = synthetic_app_data(index)
+            self.devices[payload["id"]] = payload
+            self.settings[payload["id"]] = synthetic_settings()
+        self.requests: Counter[str] = Counter()
+        self.injected: Counter[str] = Counter()
+        self._rng = random.Random(self.faults.seed)
+        self._queued: deque[_QueuedFault] = deque()
+        self._client_secrets: dict[str, str | None] = {}
+        self._sessions: dict[str, str | None] = {}
+        self._tick = 0
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def __aenter__(self) -> "FakeWebastoCloud":
+        """Start serving on entering the context."""
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop serving when leaving the context."""
+        await self.async_stop()
+
+    async def async_start(self) -> None:
+        """Start the HTTP server on a free local port."""
+        app = web.Application(middlewares=[self._fault_middleware])
+        app.add_routes(
+            [
+                web.get("/remuc/mobile-api/client_id", self._client_id),
+                web.post(
+                    "/remuc/mobile-api/client/{client_id}/register", self._register
+                ),
+                web.post("/remote/client/{client_id}/info", self._client_info),
+                web.get("/remuc/mobile-api/client/{client_id}/all", self._all),
+                web.post(
+                    "/remuc/mobile-api/client/{client_id}/heatermode",
+                    self._heater_mode,
+                ),
+                web.post(
+                    "/remuc/mobile-api/client/{client_id}/location-services",
+                    self._location_services,
+                ),
+                web.post(
+                    "/remote/client/{client_id}/device/{device_id}/cmd", self._command
+                ),
+                web.post(
+                    "/remote/client/{client_id}/device/{device_id}/timers2",
+                    self._save_timers,
+                ),
+                web.get(
+                    "/remote/client/{client_id}/device/{device_id}/assocstatus2",
+                    self._association_status,
+                ),
+                web.post("/webapi/login", self._login),
+                web.post("/webapi/get_service_data", self._service_data),
+                web.post("/webapi/change_device", self._change_device),
+                web.post("/webapi/get_settings", self._get_settings),
+                web.post("/webapi/post_settings", self._post_settings),
+            ]
+        )
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+
+    async def async_stop(self) -> None:
+        """Stop the HTTP server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def client(self, password: str | None = None, **kwargs: Any) -> FakeCloudClient:
+        """Return a pywebasto client for this cloud.
+
+        The client never reuses cached account data, so every poll reaches the
+        fake cloud.
+        """
+        kwargs.setdefault("refresh_interval", 0)
+        return FakeCloudClient(
+            self.base_url,
+            username=self.username,
+            password=self.password if password is None else password,
+            **kwargs,
+        )
+
+    def fail_next(
+        self, fault: int | str, path: str | None = None, count: int = 1
+    ) -> None:
+        """Answer the next requests containing ``path`` with a fault.
+
+        ``fault`` is an HTTP status code or ``MALFORMED``.
+        """
+        self._queued.append(_QueuedFault(fault, path, count))
+
+    def drift(self, change_ratio: float) -> None:
+        """Change the temperature of a share of the devices."""
+        self._tick += 1
+        payloads = list(self.devices.values())
+        changed = max(1, round(len(payloads) * change_ratio)) if change_ratio else 0
+        for offset in range(min(changed, len(payloads))):
+            payload = payloads[(self._tick * changed + offset) % len(payloads)]
+            payload["temperature"] = f"{(self._tick + offset) % 30 - 5}C"
+
+    def output(self, device_id: str, line: str) -> dict[str, Any] | None:
+        """Return an enabled or disabled output of a device."""
+        payload = self.devices[device_id]
+        for section in ("outputs", "disabled_outputs"):
+            for output in payload.get(section, []):
+                if output["line"] == line:
+                    return output
+        return None
+
+    def _take_fault(self, path: str) -> int | str | None:
+        """Return the fault to inject into a request, if any."""
+        for queued in self._queued:
+            if queued.path is None or queued.path in path:
+                queued.remaining -= 1
+                if queued.remaining <= 0:
+                    self._queued.remove(queued)
+                return queued.fault
+
+        faults = self.faults
+        if faults.error_rate and self._rng.random() < faults.error_rate:
+            return self._rng.choice(faults.error_statuses)
+        if faults.malformed_rate and self._rng.random() < faults.malformed_rate:
+            return MALFORMED
+        return None
+
+    @web.middleware
+    async def _fault_middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        """Count requests and inject latency and faults."""
+        route = request.match_info.route.resource
+        self.requests[route.canonical if route is not None else request.path] += 1
+
+        faults = self.faults
+        if faults.latency or faults.latency_jitter:
+            await asyncio.sleep(
+                faults.latency + self._rng.uniform(0, faults.latency_jitter)
+            )
+
+        fault = self._take_fault(request.path)
+        if isinstance(fault, int):
+            self.injected[str(fault)] += 1
+            return web.Response(status=fault, text=f"Injected HTTP {fault}")
+
+        response = await handler(request)
+        if fault == MALFORMED and isinstance(response, web.Response):
+            self.injected[MALFORMED] += 1
+            body = response.text or ""
+            return web.Response(text=body[: len(body) // 2] or "{", status=200)
+        return response
+
+    def _require_app_client(self, request: web.Request) -> None:
+        """Reject app requests without the registered client secret."""
+        client_id = request.match_info["client_id"]
+        secret = self._client_secrets.get(client_id)
+        if secret is None or request.headers.get("Authorization") != secret:
+            raise web.HTTPUnauthorized(text="Unknown app client")
+
+    def _require_webapi_session(self, request: web.Request) -> str:
+        """Return the session token of a webapi request, rejecting unknown ones."""
+        cookie = request.headers.get("Cookie", "")
+        token = cookie.removeprefix("hssess=").rstrip(";")
+        if token not in self._sessions:
+            raise web.HTTPUnauthorized(text="Session expired")
+        return token
+
+    def _device(self, device_id: str) -> dict[str, Any]:
+        """Return the payload of a device, rejecting unknown devices."""
+        if (payload := self.devices.get(device_id)) is None:
+            raise web.HTTPBadRequest(text=f"Unknown device {device_id}")
+        return payload
+
+    async def _client_id(self, request: web.Request) -> web.Response:
+        """Hand out a new app client id."""
+        client_id = uuid4().hex
+        self._client_secrets[client_id] = None
+        return web.Response(text=client_id)
+
+    async def _register(self, request: web.Request) -> web.Response:
+        """Register the secret of an app client."""
+        client_id = request.match_info["client_id"]
+        if client_id not in self._client_secrets:
+            raise web.HTTPUnauthorized(text="Unknown app client")
+        self._client_secrets[client_id] = json.loads(await request.text())["secret"]
+        return web.Response(text="")
+
+    async def _client_info(self, request: web.Request) -> web.Response:
+        """Accept the client info of an app client."""
+        self._require_app_client(request)
+        return web.Response(text="")
+
+    async def _all(self, request: web.Request) -> web.Response:
+        """Return the account data of all devices."""
+        self._require_app_client(request)
+        return web.json_response({"devices": list(self.devices.values())})
+
+    async def _heater_mode(self, request: web.Request) -> web.Response:
+        """Switch a device between heater and ventilation mode."""
+        self._require_app_client(request)
+        data = json.loads(await request.text())
+        payload = self._device(str(data["dev_id"]))
+        main_line = "OUTV" if data["mode"] else "OUTH"
+        outputs = payload["outputs"] + payload["disabled_outputs"]
+        payload["outputs"] = [
+            output
+            for output in outputs
+            if output["line"] not in ("OUTH", "OUTV") or output["line"] == main_line
+        ]
+        payload["disabled_outputs"] = [
+            output for output in outputs if output not in payload["outputs"]
+        ]
+        return web.Response(text="")
+
+    async def _location_services(self, request: web.Request) -> web.Response:
+        """Enable or disable location services of a device."""
+        self._require_app_client(request)
+        data = json.loads(await request.text())
+        self._device(str(data["dev_id"]))["location"]["state"] = data["state"]
+        return web.Response(text="")
+
+    async def _command(self, request: web.Request) -> web.Response:
+        """Switch an output, like ``OUT H ON``."""
+        self._require_app_client(request)
+        payload = self._device(request.match_info["device_id"])
+        _, line, state = (await request.text()).split()
+        output = next(
+            (item for item in payload["outputs"] if item["line"] == f"OUT{line}"),
+            None,
+        )
+        if output is None:
+            raise web.HTTPBadRequest(text=f"Output OUT{line} is not enabled")
+        output["state"] = state
+        if line in ("H", "V"):
+            output["ontime"] = int(time.time()) + 1800 if state == "ON" else 0
+        return web.Response(text="")
+
+    async def _save_timers(self, request: web.Request) -> web.Response:
+        """Replace the simple timers of an output."""
+        self._require_app_client(request)
+        device_id = request.match_info["device_id"]
+        self._device(device_id)
+        data = json.loads(await request.text())
+        output = self.output(device_id, f"OUT{data['output']}")
+        if output is None:
+            raise web.HTTPBadRequest(text=f"Unknown output {data['output']}")
+        output["timers"] = data["timers"]
+        return web.Response(text="")
+
+    async def _association_status(self, request: web.Request) -> web.Response:
+        """Report every device as associated with the app client."""
+        self._require_app_client(request)
+        self._device(request.match_info["device_id"])
+        return web.Response(text="master")
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Log in to the webapi, handing out a session cookie."""
+        data = await request.post()
+        if data.get("username") != self.username or (
+            data.get("password") != self.password
+        ):
+            raise web.HTTPUnauthorized(text="Username or password incorrect")
+        token = uuid4().hex
+        self._sessions[token] = next(iter(self.devices), None)
+        response = web.Response(text="")
+        response.set_cookie("hssess", token)
+        return response
+
+    async def _service_data(self, request: web.Request) -> web.Response:
+        """Return the webapi data of the active device."""
+        token = self._require_webapi_session(request)
+        device_id = self._sessions[token]
+        devices = [
+            [payload["id"], payload["name"], f"check-{payload['id']}"]
+            for payload in self.devices.values()
+        ]
+        data: dict[str, Any] = {"account_info": {"devices": devices}}
+        if device_id is not None:
+            data |= {
+                "id": device_id,
+                "alias": self.devices[device_id]["name"],
+                "check_id": f"check-{device_id}",
+            }
+        return web.json_response(data)
+
+    async def _change_device(self, request: web.Request) -> web.Response:
+        """Change the active device of a webapi session."""
+        token = self._require_webapi_session(request)
+        device_id = str((await request.post())["device"])
+        self._device(device_id)
+        self._sessions[token] = device_id
+        return web.Response(text="")
+
+    async def _get_settings(self, request: web.Request) -> web.Response:
+        """Return the settings of the active device."""
+        token = self._require_webapi_session(request)
+        return web.json_response(self.settings.get(self._sessions[token] or "", {}))
+
+    async def _post_settings(self, request: web.Request) -> web.Response:
+        """Apply device settings to the active device."""
+        token = self._require_webapi_session(request)
+        device_id = self._sessions[token]
+        if device_id is None:
+            raise web.HTTPBadRequest(text="No active device")
+
+        device_settings = json.loads(await request.text())["device_settings"]
+        settings = copy.deepcopy(self.settings[device_id])
+        for group in settings["settings_tab"]:
+            for option in group["options"]:
+                key = option["key"]
+                if key in device_settings:
+                    option["value"] = device_settings[key]
+                elif f"{key}_timeout_h" in device_settings:
+                    option["timeout"] = (
+                        device_settings[f"{key}_timeout_h"] * 3600
+                        + device_settings[f"{key}_timeout_min"] * 60
+                    )
+        self.settings[device_id] = settings
+        return web.Response(text="")
@@ -0,0 +1,331 @@
+"""Benchmark coordinator update fan-out for growing device counts.
+
+Builds synthetic pywebasto devices with realistic app payloads, creates every
+entity type for them and measures time, allocations and state writes per poll.
+
+Run with ``scripts/benchmark`` or ``python tests/benchmarks/fanout.py``.
+"""
+
+import argparse
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pywebasto import WebastoDevice  # noqa: E402
+
+from custom_components.webastoconnect.api import (  # noqa: E402
+    WebastoConnectUpdateCoordinator,
+)
+from custom_components.webastoconnect.binary_sensor import (  # noqa: E402
+    BINARY_SENSORS,
+    WebastoConnectBinarySensor,
+)
+from custom_components.webastoconnect.device_tracker import (  # noqa: E402
+    TRACKER,
+    WebastoConnectDeviceTracker,
+)
+from custom_components.webastoconnect.number import (  # noqa: E402
+    NUMBERS,
+    WebastoConnectNumber,
+)
+from custom_components.webastoconnect.sensor import (  # noqa: E402
+    SENSORS,
+    WebastoConnectSensor,
+)
+from custom_components.webastoconnect.switch import (  # noqa: E402
+    SWITCHES,
+    WebastoConnectSwitch,
+)
+from tests.helpers import build_coordinator  # noqa: E402
+
+DEFAULT_DEVICE_COUNTS = (1, 10, 100, 1000)
+# Share of devices reporting new data on a poll, like a temperature drift.
+DEFAULT_CHANGE_RATIO = 0.1
+
+
+def synthetic_app_data(index: int, tick: int = 0) -> dict[str, Any]:
+    """Return an app backend payload like the one pywebasto receives."""
+    heater_on = index % 4 == 0
+    return {
+        "id": f"{index:06d}",
+        "name": f"Vehicle {index}",
+        "assocStatus": "associated",
+        "temperature": f"{(index + tick) % 30 - 5}C",
+        "voltage": f"{12 + (index % 10) / 10:.1f}V",
+        "connection_lost": False,
+        "subscription": {"expiration": 1893456000},
+        "location": {
+            "state": "ON",
+            "lat": 55.0 + index / 10000,
+            "lon": 12.0 + index / 10000,
+        },
+        "outputs": [
+            {
+                "line": "OUTH",
+                "name": "Heater",
+                "icon": "heater",
+                "state": "ON" if heater_on else "OFF",
+                "ontime": 1893456000 if heater_on else 0,
+                "timers": [
+                    {
+                        "type": "simple",
+                        "start": 360 + (index % 60),
+                        "duration": 1800,
+                        "repeat": 31,
+                        "enabled": True,
+                    },
+                    {
+                        "type": "simple",
+                        "start": 1020,
+                        "duration": 1200,
+                        "repeat": 96,
+                        "enabled": index % 2 == 0,
+                    },
+                ],
+            },
+            {"line": "OUT1", "name": "AUX1", "icon": "aux", "state": "OFF"},
+            {"line": "OUT2", "name": "AUX2", "icon": "aux", "state": "OFF"},
+        ],
+        "disabled_outputs": [
+            {
+                "line": "OUTV",
+                "name": "Ventilation",
+                "icon": "fan",
+                "timers": [
+                    {
+                        "type": "simple",
+                        "start": 720,
+                        "duration": 900,
+                        "repeat": 0,
+                        "enabled": False,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def synthetic_settings() -> dict[str, Any]:
+    """Return a webapi settings payload."""
+    return {
+        "settings_tab": [
+            {
+                "group": "general",
+                "options": [
+                    {"key": "allow_GPS", "value": True},
+                    {"key": "low_voltage_cutoff", "value": 11.5},
+                    {"key": "ext_temp_comp", "value": 0.5},
+                ],
+            },
+            {
+                "group": "outputs",
+                "options": [
+                    {"key": "OUTH", "timeout": 1800},
+                    {"key": "OUTV", "timeout": 1800},
+                    {"key": "OUT1", "timeout": 600},
+                    {"key": "OUT2", "timeout": 600},
+                ],
+            },
+        ]
+    }
+
+
+def build_device(index: int) -> WebastoDevice:
+    """Create a pywebasto device hydrated with synthetic payloads."""
+    device = WebastoDevice(f"{index:06d}", f"Vehicle {index}")
+    device.app_data = synthetic_app_data(index)
+    device.settings = synthetic_settings()
+    return device
+
+
+@dataclass(slots=True)
+class Fleet:
+    """Coordinator, entities and write counter for one benchmark size."""
+
+    coordinator: WebastoConnectUpdateCoordinator
+    entities: list[Any]
+    writes: list[int]
+
+
+def register_entities(
+    coordinator: WebastoConnectUpdateCoordinator,
+) -> tuple[list[Any], list[int]]:
+    """Create every entity type per device and register them as listeners."""
+    writes = [0]
+
+    def _count_write() -> None:
+        writes[0] += 1
+
+    factories: list[tuple[Callable[..., Any], Any]] = [
+        *((WebastoConnectSensor, description) for description in SENSORS),
+        *((WebastoConnectSwitch, description) for description in SWITCHES),
+        *((WebastoConnectBinarySensor, description) for description in BINARY_SENSORS),
+        *((WebastoConnectNumber, description) for description in NUMBERS),
+        (WebastoConnectDeviceTracker, TRACKER),
+    ]
+    entities = []
+    for device_id in coordinator.cloud.devices:
+        for entity_class, description in factories:
+            entity = entity_class(device_id, description, coordinator)
+            entity.async_write_ha_state = _count_write
+            coordinator._listeners[len(coordinator._listeners)] = (
+                entity._handle_coordinator_update,
+                entity.coordinator_context,
+            )
+            entities.append(entity)
+    return entities, writes
+
+
+def build_fleet(device_count: int) -> Fleet:
+    """Create a coordinator with every entity type registered as listener."""
+    devices = {f"{index:06d}": build_device(index) for index in range(device_count)}
+    coordinator = build_coordinator(
+        SimpleNamespace(devices=devices), entry_id="benchmark"
+    )
+    entities, writes = register_entities(coordinator)
+
+    # Prime the fingerprints like the first refresh after setup does.
+    coordinator.async_update_listeners()
+    writes[0] = 0
+    return Fleet(coordinator, entities, writes)
+
+
+def simulate_poll(fleet: Fleet, tick: int, change_ratio: float) -> None:
+    """Replace the payloads of a share of the devices, like a cloud poll."""
+    devices = list(fleet.coordinator.cloud.devices.values())
+    changed = max(1, round(len(devices) * change_ratio)) if change_ratio else 0
+    for offset in range(changed):
+        index = (tick * changed + offset) % len(devices)
+        devices[index].app_data = synthetic_app_data(index, tick)
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Per-poll measurements of one benchmark run."""
+
+    mode: str
+    devices: int
+    entities: int
+    median_ms: float
+    allocated_kib: float
+    writes: float
+
+
+def _measure(
+    fleet: Fleet,
+    mode: str,
+    notify: Callable[[], None],
+    polls: int,
+    change_ratio: float,
+) -> BenchmarkResult:
+    """Measure a notification strategy over a number of polls."""
+    durations: list[float] = []
+    allocated: list[int] = []
+    fleet.writes[0] = 0
+    for tick in range(1, polls + 1):
+        simulate_poll(fleet, tick, change_ratio)
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        notify()
+        durations.append(time.perf_counter() - started)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated.append(peak - before)
+
+    return BenchmarkResult(
+        mode=mode,
+        devices=len(fleet.coordinator.cloud.devices),
+        entities=len(fleet.entities),
+        median_ms=statistics.median(durations) * 1000,
+        allocated_kib=statistics.median(allocated) / 1024,
+        writes=fleet.writes[0] / polls,
+    )
+
+
+def run_benchmark(
+    device_counts: tuple[int, ...] = DEFAULT_DEVICE_COUNTS,
+    polls: int = 5,
+    change_ratio: float = DEFAULT_CHANGE_RATIO,
+) -> list[BenchmarkResult]:
+    """Run the fan-out benchmark for each device count."""
+    results: list[BenchmarkResult] = []
+    tracemalloc.start()
+    try:
+        for device_count in device_counts:
+            fleet = build_fleet(device_count)
+            results.append(
+                _measure(
+                    fleet,
+                    "coordinator",
+                    fleet.coordinator.async_update_listeners,
+                    polls,
+                    change_ratio,
+                )
+            )
+
+            # A fresh fleet sees the same polls as the coordinator run did.
+            baseline = build_fleet(device_count)
+
+            def _notify_all(fleet: Fleet = baseline) -> None:
+                for entity in fleet.entities:
+                    entity._handle_coordinator_update()
+
+            results.append(
+                _measure(baseline, "all-entities", _notify_all, polls, change_ratio)
+            )
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Return the results as a plain text table."""
+    lines = [
+        f"{'mode':<13}{'devices':>8}{'entities':>10}"
+        f"{'ms/poll':>10}{'KiB/poll':>10}{'writes/poll':>13}"
+    ]
+    lines.extend(
+        f"{result.mode:<13}{result.devices:>8}{result.entities:>10}"
+        f"{result.median_ms:>10.2f}{result.allocated_kib:>10.1f}{result.writes:>13.1f}"
+        for result in results
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--devices",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_DEVICE_COUNTS),
+        help="device counts to benchmark",
+    )
+    parser.add_argument("--polls", type=int, default=5, help="polls per size")
+    parser.add_argument(
+        "--change-ratio",
+        type=float,
+        default=DEFAULT_CHANGE_RATIO,
+        help="share of devices reporting new data on each poll",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = run_benchmark(tuple(args.devices), args.polls, args.change_ratio)
+    sys.stdout.write(f"{format_results(results)}\n")
+    sys.stdout.write(f"\nFinished in {time.perf_counter() - started:.1f}s\n")
+
+
+if __name__ == "__main__":
+    main()
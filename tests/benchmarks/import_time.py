@@ -0,0 +1,144 @@
+"""Measure the import time of the integration package with ``-X importtime``.
+
+Imports the Home Assistant modules that are loaded before any custom
+integration in a fresh interpreter, then the package, and reports what the
+package import itself costs and which modules it pulled in.
+
+Run with ``scripts/import-time`` or ``python tests/benchmarks/import_time.py``.
+"""
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[2]
+PACKAGE = "custom_components.webastoconnect"
+# Loaded by Home Assistant core before it imports an integration.
+PRELOADED = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.components.http",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.issue_registry",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.loader",
+)
+_MARKER = "webastoconnect-import-start"
+# Measured around 40 ms, the margin absorbs slow machines.
+IMPORT_BUDGET_MS = 150
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    """Import timings of one module in microseconds."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Modules imported by the package import of one interpreter run."""
+
+    module: str
+    timings: list[ImportTiming] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Return the time all newly imported modules took."""
+        return sum(timing.self_us for timing in self.timings) / 1000
+
+    @property
+    def modules(self) -> set[str]:
+        """Return the names of the newly imported modules."""
+        return {timing.name for timing in self.timings}
+
+    def format(self, top: int = 15) -> str:
+        """Return the slowest modules as a plain text table."""
+        lines = [
+            f"{self.module}: {self.total_ms:.1f} ms, {len(self.timings)} modules",
+            f"{'self ms':>9}{'cumulative ms':>15}  module",
+        ]
+        lines.extend(
+            f"{timing.self_us / 1000:>9.1f}{timing.cumulative_us / 1000:>15.1f}"
+            f"  {timing.name}"
+            for timing in sorted(
+                self.timings, key=lambda timing: timing.self_us, reverse=True
+            )[:top]
+        )
+        return "\n".join(lines)
+
+
+def _parse(stderr: str) -> list[ImportTiming]:
+    """Parse the ``-X importtime`` lines written after the marker."""
+    timings: list[ImportTiming] = []
+    _, _, output = stderr.partition(_MARKER)
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def measure_import(module: str = PACKAGE) -> ImportReport:
+    """Import a module in a fresh interpreter and return its import timings."""
+    code = "\n".join(
+        (
+            *(f"import {name}" for name in PRELOADED),
+            "import sys",
+            f"sys.stderr.write('{_MARKER}\\n')",
+            f"import {module}",
+        )
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return ImportReport(module, _parse(result.stderr))
+
+
+def best_of(runs: int, module: str = PACKAGE) -> ImportReport:
+    """Return the fastest of a number of measurements, damping noise."""
+    return min(
+        (measure_import(module) for _ in range(runs)),
+        key=lambda report: report.total_ms,
+    )
+
+
+def main() -> None:
+    """Run the measurement from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=PACKAGE, help="module to import")
+    parser.add_argument("--runs", type=int, default=5, help="interpreter runs")
+    parser.add_argument("--top", type=int, default=15, help="modules to list")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=IMPORT_BUDGET_MS,
+        help="fail when the import takes longer, in milliseconds",
+    )
+    args = parser.parse_args()
+
+    report = best_of(args.runs, args.module)
+    sys.stdout.write(f"{report.format(args.top)}\n")
+    if report.total_ms > args.budget:
+        sys.exit(f"Import took {report.total_ms:.1f} ms, over {args.budget} ms")
+
+
+if __name__ == "__main__":
+    main()
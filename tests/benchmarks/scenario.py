@@ -0,0 +1,301 @@
+"""Drive the integration end to end against the fake Webasto cloud.
+
+Connects a cloud session through the real pywebasto HTTP path, polls through
+the coordinator with every entity listening, toggles switches and edits timers
+through the service helpers, and reports latency percentiles per operation.
+
+Run with ``scripts/scenario`` or ``python tests/benchmarks/scenario.py``.
+"""
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+import statistics
+import sys
+from tempfile import TemporaryDirectory
+import time
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from pywebasto import SimpleTimer  # noqa: E402
+
+from custom_components.webastoconnect.api import (  # noqa: E402
+    ACTIVE_SCAN_INTERVAL,
+    WebastoConnectUpdateCoordinator,
+)
+from custom_components.webastoconnect.budget import RequestBudget  # noqa: E402
+from custom_components.webastoconnect.services import (  # noqa: E402
+    async_create_timer,
+    async_delete_timer,
+    async_update_timer,
+)
+from custom_components.webastoconnect.switch import (  # noqa: E402
+    WebastoConnectSwitch,
+)
+from tests.benchmarks.fake_cloud import FakeWebastoCloud, FaultPlan  # noqa: E402
+from tests.benchmarks.fanout import register_entities  # noqa: E402
+from tests.helpers import build_coordinator  # noqa: E402
+
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass(slots=True)
+class ScenarioReport:
+    """Latencies, errors and cloud traffic of a scenario run."""
+
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, Counter[str]] = field(
+        default_factory=lambda: defaultdict(Counter)
+    )
+    requests: Counter[str] = field(default_factory=Counter)
+    injected: Counter[str] = field(default_factory=Counter)
+    state_writes: int = 0
+    retry_stats: dict[str, Any] = field(default_factory=dict)
+
+    def percentiles(self, operation: str) -> dict[int, float]:
+        """Return latency percentiles of an operation in milliseconds."""
+        samples = sorted(self.latencies.get(operation, ()))
+        if not samples:
+            return {}
+        if len(samples) == 1:
+            return dict.fromkeys(PERCENTILES, samples[0] * 1000)
+        cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+        return {
+            percentile: cut_points[percentile - 1] * 1000 for percentile in PERCENTILES
+        }
+
+    def format(self) -> str:
+        """Return the report as a plain text table."""
+        header = f"{'operation':<14}{'count':>7}{'errors':>8}" + "".join(
+            f"{f'p{percentile} ms':>10}" for percentile in PERCENTILES
+        )
+        lines = [header]
+        for operation in sorted(self.latencies.keys() | self.errors.keys()):
+            percentiles = self.percentiles(operation)
+            errors = sum(self.errors.get(operation, Counter()).values())
+            lines.append(
+                f"{operation:<14}{len(self.latencies.get(operation, ())) + errors:>7}"
+                f"{errors:>8}"
+                + "".join(
+                    f"{percentiles.get(percentile, 0.0):>10.1f}"
+                    for percentile in PERCENTILES
+                )
+            )
+        lines.append("")
+        lines.append(f"cloud requests: {sum(self.requests.values())}")
+        lines.append(f"injected faults: {dict(self.injected) or 'none'}")
+        lines.append(f"entity state writes: {self.state_writes}")
+        for operation, errors in sorted(self.errors.items()):
+            if errors:
+                lines.append(f"{operation} errors: {dict(errors)}")
+        return "\n".join(lines)
+
+
+async def _timed(
+    report: ScenarioReport,
+    operation: str,
+    call: Callable[[], Awaitable[Any]],
+) -> bool:
+    """Run an operation, recording its latency or the error it raised."""
+    started = time.perf_counter()
+    try:
+        await call()
+    except Exception as err:  # noqa: BLE001
+        report.errors[operation][type(err).__name__] += 1
+        return False
+    report.latencies[operation].append(time.perf_counter() - started)
+    return True
+
+
+def build_scenario_coordinator(
+    hass: HomeAssistant, cloud: FakeWebastoCloud, budget: RequestBudget | None = None
+) -> WebastoConnectUpdateCoordinator:
+    """Create a coordinator polling the fake cloud without a running Home Assistant."""
+    coordinator = build_coordinator(
+        cloud.client(),
+        hass=hass,
+        entry_id="scenario",
+        username=cloud.username,
+        password=cloud.password,
+    )
+    # A bottomless budget measures the cloud path rather than the throttling.
+    coordinator.request_budget = budget or RequestBudget(
+        capacity=10**9, command_reserve=0
+    )
+    coordinator.update_interval = ACTIVE_SCAN_INTERVAL
+    return coordinator
+
+
+async def run_scenario(
+    device_count: int = 10,
+    polls: int = 5,
+    commands: int = 20,
+    timer_rounds: int = 1,
+    concurrency: int = 4,
+    change_ratio: float = 0.1,
+    faults: FaultPlan | None = None,
+    cloud: FakeWebastoCloud | None = None,
+) -> ScenarioReport:
+    """Run setup, polling, switch commands and timer services once."""
+    report = ScenarioReport()
+    cloud = cloud or FakeWebastoCloud(device_count, faults)
+    config_dir = TemporaryDirectory()
+    async with cloud:
+        coordinator = build_scenario_coordinator(HomeAssistant(config_dir.name), cloud)
+        session = coordinator.cloud_session
+        try:
+            if not await _timed(report, "setup", session.async_connect):
+                return _finish(report, cloud)
+
+            session.async_join(coordinator)
+            entities, writes = register_entities(coordinator)
+            coordinator.async_update_listeners()
+
+            async def _poll() -> None:
+                # Mirrors the bookkeeping of DataUpdateCoordinator.async_refresh.
+                try:
+                    await coordinator._async_update_data()
+                except Exception:
+                    coordinator.last_update_success = False
+                    raise
+                else:
+                    coordinator.last_update_success = True
+                finally:
+                    coordinator.async_update_listeners()
+
+            for _ in range(polls):
+                cloud.drift(change_ratio)
+                await _timed(report, "poll", _poll)
+
+            limiter = asyncio.Semaphore(concurrency)
+            switches = [
+                entity
+                for entity in entities
+                if isinstance(entity, WebastoConnectSwitch)
+                and entity.entity_description.key in ("main_output", "aux1_output")
+            ]
+
+            async def _switch(entity: WebastoConnectSwitch, state: bool) -> None:
+                async with limiter:
+                    await _timed(
+                        report,
+                        "switch",
+                        lambda: entity._async_queue_state(state),
+                    )
+
+            if switches:
+                await asyncio.gather(
+                    *(
+                        _switch(switches[index % len(switches)], index % 2 == 0)
+                        for index in range(commands)
+                    )
+                )
+            coordinator.async_update_listeners()
+
+            async def _timers(device: Any) -> None:
+                timer = SimpleTimer(start=420, duration=1200, repeat=31)
+                async with limiter:
+                    await _timed(
+                        report,
+                        "timer_create",
+                        lambda: async_create_timer(
+                            coordinator, device, timer, line="heater"
+                        ),
+                    )
+                    await _timed(
+                        report,
+                        "timer_update",
+                        lambda: async_update_timer(
+                            coordinator,
+                            device,
+                            0,
+                            {"duration": 900},
+                            line="heater",
+                        ),
+                    )
+                    await _timed(
+                        report,
+                        "timer_delete",
+                        lambda: async_delete_timer(coordinator, device, 0),
+                    )
+
+            for _ in range(timer_rounds):
+                await asyncio.gather(
+                    *(_timers(device) for device in session.cloud.devices.values())
+                )
+
+            report.state_writes = writes[0]
+            report.retry_stats = coordinator.retry_policy.as_dict()
+        finally:
+            await session.async_leave(coordinator)
+            config_dir.cleanup()
+
+    return _finish(report, cloud)
+
+
+def _finish(report: ScenarioReport, cloud: FakeWebastoCloud) -> ScenarioReport:
+    """Copy the traffic counters of the fake cloud into the report."""
+    report.requests = Counter(cloud.requests)
+    report.injected = Counter(cloud.injected)
+    return report
+
+
+def main() -> None:
+    """Run a scenario from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10, help="fleet size")
+    parser.add_argument("--polls", type=int, default=5, help="coordinator polls")
+    parser.add_argument("--commands", type=int, default=20, help="switch commands")
+    parser.add_argument(
+        "--timer-rounds", type=int, default=1, help="timer edits per device"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="parallel user operations"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added per request"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random extra seconds per request"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="share of 401/403/429 answers"
+    )
+    parser.add_argument(
+        "--malformed-rate",
+        type=float,
+        default=0.0,
+        help="share of truncated JSON answers",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="fault random seed")
+    args = parser.parse_args()
+
+    faults = FaultPlan(
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+    report = asyncio.run(
+        run_scenario(
+            device_count=args.devices,
+            polls=args.polls,
+            commands=args.commands,
+            timer_rounds=args.timer_rounds,
+            concurrency=args.concurrency,
+            faults=faults,
+        )
+    )
+    sys.stdout.write(f"{report.format()}\n")
+
+
+if __name__ == "__main__":
+    main()
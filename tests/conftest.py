@@ -8,3 +8,12 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import pytest  # noqa: E402
+
+from tests.helpers import build_coordinator  # noqa: E402
+
+
+@pytest.fixture
+def coordinator_factory():
+    """Return a builder of coordinators around fake cloud clients."""
+    return build_coordinator
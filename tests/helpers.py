@@ -0,0 +1,47 @@
+"""Builders shared by the tests and benchmarks."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+
+from custom_components.webastoconnect import api
+from custom_components.webastoconnect.api import WebastoConnectUpdateCoordinator
+
+
+def build_hass(config_dir: str = "/config") -> SimpleNamespace:
+    """Return the parts of Home Assistant a coordinator uses when built."""
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            path=lambda *parts: "/".join((config_dir, *parts)),
+            config_dir=config_dir,
+        ),
+        data={},
+    )
+
+
+def build_coordinator(
+    cloud: Any = None,
+    *,
+    hass: Any = None,
+    entry_id: str = "entry-1",
+    username: str = "user@example.com",
+    password: str = "secret",
+) -> WebastoConnectUpdateCoordinator:
+    """Build a coordinator the way setup does, around a fake cloud client.
+
+    A session already registered for the account is joined instead, like in
+    Home Assistant.
+    """
+    if cloud is None:
+        cloud = SimpleNamespace(devices={})
+    entry = SimpleNamespace(
+        entry_id=entry_id,
+        data={CONF_EMAIL: username, CONF_PASSWORD: password},
+        options={},
+    )
+    with patch.object(api, "WebastoConnect", lambda **kwargs: cloud):
+        return WebastoConnectUpdateCoordinator(
+            hass if hass is not None else build_hass(), entry
+        )
@@ -1,8 +1,8 @@
 """Tests for Webasto coordinator update handling."""
 
-import asyncio
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -14,11 +14,16 @@ from pywebasto.exceptions import (
 )
 
 from custom_components.webastoconnect.api import (
+    ACTIVE_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
     SCAN_INTERVAL,
+    TIMER_LEAD_TIME,
     WebastoConnectUpdateCoordinator,
+    _adaptive_update_interval,
     _credential_callbacks,
     _credential_store_path,
 )
+from custom_components.webastoconnect.budget import RequestBudget
 
 
 def test_scan_interval_is_60_seconds() -> None:
@@ -34,30 +39,23 @@ def test_credential_store_path_uses_config_entry_id() -> None:
     assert _credential_store_path(hass, entry) == ".storage/webasto_entry-1.json"
 
 
-@pytest.mark.asyncio
-async def test_credential_callbacks_store_credentials_by_entry_id(tmp_path) -> None:
-    """Credential callbacks should read and write the per-entry credential file."""
-
-    async def async_add_executor_job(func, *args):
-        return func(*args)
-
+def test_credential_callbacks_share_one_store_per_entry(tmp_path) -> None:
+    """Coordinator and flows of an entry should use the same credential store."""
     hass = SimpleNamespace(
-        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
-        async_add_executor_job=async_add_executor_job,
+        config=SimpleNamespace(
+            path=lambda *parts: str(tmp_path.joinpath(*parts)),
+            config_dir=str(tmp_path),
+        ),
+        data={},
     )
     entry = SimpleNamespace(entry_id="entry-1")
-    credentials = SimpleNamespace(client_id="client", client_secret="secret")
-    credential_load, credential_save = _credential_callbacks(hass, entry)
 
-    assert await credential_load() is None
+    load, save = _credential_callbacks(hass, entry)
+    other_load, _ = _credential_callbacks(hass, entry)
+    third_load, _ = _credential_callbacks(hass, SimpleNamespace(entry_id="entry-2"))
 
-    await credential_save(credentials)
-
-    assert await credential_load() == {
-        "client_id": "client",
-        "client_secret": "secret",
-    }
-    assert (tmp_path / ".storage" / "webasto_entry-1.json").exists()
+    assert load.__self__ is save.__self__ is other_load.__self__
+    assert third_load.__self__ is not load.__self__
 
 
 def test_update_coordinator_uses_entry_credential_callbacks(monkeypatch) -> None:
@@ -68,7 +66,10 @@ def test_update_coordinator_uses_entry_credential_callbacks(monkeypatch) -> None
         "custom_components.webastoconnect.api.DataUpdateCoordinator.__init__",
         lambda *args, **kwargs: None,
     )
-    hass = SimpleNamespace(config=SimpleNamespace(path=lambda *parts: "/".join(parts)))
+    hass = SimpleNamespace(
+        config=SimpleNamespace(path=lambda *parts: "/".join(parts), config_dir="/tmp"),
+        data={},
+    )
     entry = SimpleNamespace(
         entry_id="entry-1",
         data={"email": "user@test", "password": "pw"},
@@ -92,19 +93,126 @@ def test_update_coordinator_uses_entry_credential_callbacks(monkeypatch) -> None
     }
 
 
-def _build_coordinator(update_mock: AsyncMock) -> WebastoConnectUpdateCoordinator:
-    """Create a minimal coordinator instance for unit testing."""
-    coordinator = object.__new__(WebastoConnectUpdateCoordinator)
-    coordinator.cloud = SimpleNamespace(update=update_mock, connect=AsyncMock())
-    coordinator._cloud_operation_lock = asyncio.Lock()
+def _build_coordinator(
+    coordinator_factory, update_mock: AsyncMock
+) -> WebastoConnectUpdateCoordinator:
+    """Create a coordinator with a connected session around a mocked update."""
+    coordinator = coordinator_factory(
+        SimpleNamespace(update=update_mock, connect=AsyncMock(), devices={})
+    )
+    coordinator.cloud_session.connected = True
     return coordinator
 
 
+def _timer_device(start: int, *, enabled: bool = True) -> SimpleNamespace:
+    """Create an idle device with one daily timer."""
+    return SimpleNamespace(
+        output_main=False,
+        output_aux1=False,
+        output_aux2=False,
+        last_data={
+            "outputs": [
+                {
+                    "line": "OUTH",
+                    "timers": [
+                        {
+                            "type": "simple",
+                            "start": start,
+                            "duration": 1800,
+                            "repeat": 0,
+                            "enabled": enabled,
+                        }
+                    ],
+                }
+            ]
+        },
+    )
+
+
+def test_adaptive_interval_is_fast_while_output_is_on() -> None:
+    """Any active output should switch polling to the fast interval."""
+    devices = {
+        1: SimpleNamespace(output_main=False, output_aux1=False, last_data={}),
+        2: SimpleNamespace(output_main=False, output_aux1=True, last_data={}),
+    }
+
+    interval = _adaptive_update_interval(
+        devices, datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+    )
+
+    assert interval == ACTIVE_SCAN_INTERVAL
+
+
+def test_adaptive_interval_is_slow_when_idle_without_timers() -> None:
+    """Idle devices without enabled timers should be polled slowly."""
+    devices = {1: _timer_device(600, enabled=False)}
+
+    interval = _adaptive_update_interval(
+        devices, datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+    )
+
+    assert interval == IDLE_SCAN_INTERVAL
+
+
+def test_adaptive_interval_is_fast_when_timer_is_due() -> None:
+    """A timer inside the lead time window should switch to fast polling."""
+    devices = {1: _timer_device(605)}  # 10:05 UTC
+
+    interval = _adaptive_update_interval(
+        devices, datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    )
+
+    assert interval == ACTIVE_SCAN_INTERVAL
+
+
+def test_adaptive_interval_wakes_up_before_timer_lead_time() -> None:
+    """Idle polling should not sleep past the start of the timer lead window."""
+    devices = {1: _timer_device(600)}  # 10:00 UTC
+    now = datetime(2026, 3, 2, 9, 47, tzinfo=UTC)
+
+    interval = _adaptive_update_interval(devices, now)
+
+    assert interval == timedelta(minutes=13) - TIMER_LEAD_TIME
+
+
+def test_adaptive_interval_defaults_without_devices() -> None:
+    """Without devices the default scan interval should be used."""
+    assert _adaptive_update_interval({}, datetime.now(UTC)) == SCAN_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_update_data_adapts_interval_to_active_output(
+    coordinator_factory,
+) -> None:
+    """A poll reporting an active output should shorten the polling interval."""
+    update_mock = AsyncMock()
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
+    coordinator.cloud.devices = {1: SimpleNamespace(output_main=True, last_data={})}
+
+    await coordinator._async_update_data()
+
+    assert coordinator.update_interval == ACTIVE_SCAN_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_update_data_forces_cloud_update_when_polling_fast(
+    coordinator_factory,
+) -> None:
+    """Fast polling should bypass the pywebasto freshness cache."""
+    update_mock = AsyncMock()
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
+    coordinator.update_interval = ACTIVE_SCAN_INTERVAL
+
+    await coordinator._async_update_data()
+
+    update_mock.assert_awaited_once_with(force=True)
+
+
 @pytest.mark.asyncio
-async def test_update_data_calls_cloud_update() -> None:
+async def test_update_data_calls_cloud_update(coordinator_factory) -> None:
     """Coordinator should call cloud update once."""
     update_mock = AsyncMock()
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
 
     await coordinator._async_update_data()
 
@@ -112,10 +220,12 @@ async def test_update_data_calls_cloud_update() -> None:
 
 
 @pytest.mark.asyncio
-async def test_update_data_raises_auth_failed_on_unauthorized() -> None:
+async def test_update_data_raises_auth_failed_on_unauthorized(
+    coordinator_factory,
+) -> None:
     """Unauthorized from update should immediately trigger reauth."""
     update_mock = AsyncMock(side_effect=UnauthorizedException("unauthorized"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
 
     with pytest.raises(ConfigEntryAuthFailed):
         await coordinator._async_update_data()
@@ -124,10 +234,12 @@ async def test_update_data_raises_auth_failed_on_unauthorized() -> None:
 
 
 @pytest.mark.asyncio
-async def test_update_data_unauthorized_does_not_attempt_connect_validation() -> None:
+async def test_update_data_unauthorized_does_not_attempt_connect_validation(
+    coordinator_factory,
+) -> None:
     """Unauthorized flow should not call connect validation anymore."""
     update_mock = AsyncMock(side_effect=UnauthorizedException("invalid auth"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
     coordinator.cloud.connect = AsyncMock(side_effect=RuntimeError("should not run"))
 
     with pytest.raises(ConfigEntryAuthFailed):
@@ -137,10 +249,12 @@ async def test_update_data_unauthorized_does_not_attempt_connect_validation() ->
 
 
 @pytest.mark.asyncio
-async def test_update_data_unauthorized_ignores_connect_validation_errors() -> None:
+async def test_update_data_unauthorized_ignores_connect_validation_errors(
+    coordinator_factory,
+) -> None:
     """Connect-side errors are irrelevant because connect is not used in flow."""
     update_mock = AsyncMock(side_effect=UnauthorizedException("unauthorized"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
     coordinator.cloud.connect = AsyncMock(
         side_effect=InvalidRequestException("bad state")
     )
@@ -152,10 +266,12 @@ async def test_update_data_unauthorized_ignores_connect_validation_errors() -> N
 
 
 @pytest.mark.asyncio
-async def test_update_data_unauthorized_ignores_connect_network_failure() -> None:
+async def test_update_data_unauthorized_ignores_connect_network_failure(
+    coordinator_factory,
+) -> None:
     """Connect failures should not affect unauthorized handling."""
     update_mock = AsyncMock(side_effect=UnauthorizedException("unauthorized"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
     coordinator.cloud.connect = AsyncMock(side_effect=RuntimeError("network down"))
 
     with pytest.raises(ConfigEntryAuthFailed):
@@ -164,48 +280,127 @@ async def test_update_data_unauthorized_ignores_connect_network_failure() -> Non
 
 
 @pytest.mark.asyncio
-async def test_update_data_maps_invalid_request_to_update_failed() -> None:
+async def test_update_data_maps_invalid_request_to_update_failed(
+    coordinator_factory,
+) -> None:
     """Invalid requests should raise UpdateFailed for coordinator retries."""
     update_mock = AsyncMock(side_effect=InvalidRequestException("bad request"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
 
-    with pytest.raises(UpdateFailed):
+    with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
 
+    assert 60 <= exc_info.value.retry_after <= 120
+
 
 @pytest.mark.asyncio
-async def test_update_data_sets_retry_after_for_rate_limit() -> None:
+async def test_update_data_sets_retry_after_for_rate_limit(coordinator_factory) -> None:
     """Rate limits should request delayed retry."""
     update_mock = AsyncMock(side_effect=TooManyRequestsException("too many"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
 
     with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
 
-    assert exc_info.value.retry_after == 300
+    assert 300 <= exc_info.value.retry_after <= 600
     assert "rate limited" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-async def test_update_data_sets_retry_after_for_unexpected_errors() -> None:
+async def test_update_data_sets_retry_after_for_unexpected_errors(
+    coordinator_factory,
+) -> None:
     """Unexpected exceptions should request delayed retry."""
     update_mock = AsyncMock(side_effect=RuntimeError("boom"))
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
 
     with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
 
-    assert exc_info.value.retry_after == 300
+    assert 60 <= exc_info.value.retry_after <= 120
 
 
 @pytest.mark.asyncio
-async def test_update_data_includes_exception_type_for_unexpected_errors() -> None:
+async def test_update_data_includes_exception_type_for_unexpected_errors(
+    coordinator_factory,
+) -> None:
     """Unexpected failures should include original exception type in message."""
     update_mock = AsyncMock(side_effect=TimeoutError())
-    coordinator = _build_coordinator(update_mock)
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
 
     with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
 
-    assert exc_info.value.retry_after == 300
+    assert 30 <= exc_info.value.retry_after <= 60
     assert "TimeoutError" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_confirmation_refresh_forces_update_then_reconciles(
+    coordinator_factory,
+) -> None:
+    """Command confirmations should force fresh data before reconciling."""
+    update_mock = AsyncMock()
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
+    coordinator._confirmation_callbacks = {}
+    coordinator._unsub_confirmation = None
+    order: list[str] = []
+
+    async def _refresh() -> None:
+        await coordinator._async_update_data()
+        order.append("refresh")
+
+    coordinator.async_refresh = _refresh
+    coordinator.hass = Mock()
+    reconcile = Mock(side_effect=lambda: order.append("reconcile"))
+
+    with patch("custom_components.webastoconnect.api.async_call_later") as call_later:
+        coordinator.async_request_confirmation_refresh(reconcile)
+        coordinator.async_request_confirmation_refresh(reconcile)
+        assert call_later.call_count == 2
+        call_later.return_value.assert_called_once()
+
+    await coordinator._async_confirm_commands(datetime.now(UTC))
+
+    update_mock.assert_awaited_once_with(force=True)
+    assert order == ["refresh", "reconcile"]
+    assert coordinator._force_next_update is False
+
+
+@pytest.mark.asyncio
+async def test_update_data_skips_poll_when_budget_is_exhausted(
+    coordinator_factory,
+) -> None:
+    """Background polls should be skipped instead of running into rate limits."""
+    update_mock = AsyncMock()
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
+    coordinator.request_budget = RequestBudget(capacity=10, command_reserve=20)
+
+    await coordinator._async_update_data()
+
+    update_mock.assert_not_awaited()
+    assert coordinator.update_interval > SCAN_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_update_data_resets_backoff_after_success(coordinator_factory) -> None:
+    """A successful poll should reset the failure backoff."""
+    update_mock = AsyncMock()
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
+    coordinator.retry_policy.consecutive_failures = 3
+
+    await coordinator._async_update_data()
+
+    assert coordinator.retry_policy.consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_update_data_waits_for_background_login(coordinator_factory) -> None:
+    """Polls before the cloud session is connected should not call the cloud."""
+    update_mock = AsyncMock()
+    coordinator = _build_coordinator(coordinator_factory, update_mock)
+    coordinator.cloud_session.connected = False
+
+    assert await coordinator._async_update_data() is None
+
+    update_mock.assert_not_awaited()
@@ -1,23 +1,32 @@
 """Tests for Webasto base entity behavior."""
 
 from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 from homeassistant.util import slugify as util_slugify
 
-from custom_components.webastoconnect.base import WebastoBaseEntity, webasto_device_name
+from custom_components.webastoconnect.api import (
+    WebastoConnectUpdateCoordinator,
+    webasto_device_name,
+)
+from custom_components.webastoconnect.base import WebastoBaseEntity
+from custom_components.webastoconnect.const import DOMAIN
 from custom_components.webastoconnect.sensor import WebastoConnectSensor
 
 
-def test_device_name_uses_app_alias_when_device_name_is_id() -> None:
+def test_device_name_uses_app_alias_when_device_name_is_id(
+    coordinator_factory,
+) -> None:
     """Device info name should use the approved app name when available."""
     entity = object.__new__(WebastoBaseEntity)
     device = SimpleNamespace(
         device_id="123",
         name="123",
         app_data={"alias": "Car"},
+        settings={},
     )
-    entity._device_id = "123"
-    entity._cloud = SimpleNamespace(devices={"123": device})
+    coordinator = coordinator_factory(SimpleNamespace(devices={"123": device}))
+    entity._device_context = coordinator.device_context("123")
 
     assert entity._device_name == "Car"
 
@@ -33,18 +42,100 @@ def test_device_name_uses_fallback_name() -> None:
     assert webasto_device_name(device, "Car") == "Car"
 
 
-def test_entity_id_uses_app_alias_when_device_name_is_id() -> None:
+def test_entity_id_uses_app_alias_when_device_name_is_id(coordinator_factory) -> None:
     """Entity id should use the configured device name."""
     sensor = object.__new__(WebastoConnectSensor)
     device = SimpleNamespace(
         device_id="123",
         name="123",
         app_data={"alias": "Car"},
+        settings={},
     )
-    sensor._device_id = "123"
-    sensor._cloud = SimpleNamespace(devices={"123": device})
+    coordinator = coordinator_factory(SimpleNamespace(devices={"123": device}))
+    sensor._device_context = coordinator.device_context("123")
     sensor._attr_name = "Temperature"
 
     entity_id = "sensor." + util_slugify(f"{sensor._device_name} {sensor._attr_name}")
 
     assert entity_id == "sensor.car_temperature"
+
+
+def _context_coordinator(
+    coordinator_factory, device: SimpleNamespace
+) -> WebastoConnectUpdateCoordinator:
+    """Create a coordinator polling one device."""
+    return coordinator_factory(SimpleNamespace(devices={"123": device}))
+
+
+def test_device_context_is_shared_and_refreshed_in_place(coordinator_factory) -> None:
+    """Entities should share one context the coordinator keeps current."""
+    device = SimpleNamespace(
+        device_id="123",
+        name="123",
+        last_data={"alias": "Car"},
+        dev_data=None,
+        app_data={"alias": "Car"},
+        settings={"hw_version": "1"},
+    )
+    coordinator = _context_coordinator(coordinator_factory, device)
+    coordinator.hass = SimpleNamespace()
+    registry = SimpleNamespace(
+        async_get_device=Mock(return_value=SimpleNamespace(id="ha-device")),
+        async_update_device=Mock(),
+    )
+    coordinator.async_update_listeners()
+
+    context = coordinator.device_context("123")
+    device_info = context.device_info
+    assert coordinator.device_context("123") is context
+    assert context.name == "Car"
+    assert context.unique_id_prefix == "123_"
+    assert device_info["hw_version"] == "1"
+
+    with (
+        patch(
+            "custom_components.webastoconnect.api.webasto_device_name",
+            wraps=webasto_device_name,
+        ) as derive_name,
+        patch(
+            "custom_components.webastoconnect.api.dr.async_get",
+            return_value=registry,
+        ),
+    ):
+        device.last_data = {"alias": "Car", "temperature": "5C"}
+        coordinator.async_update_listeners()
+        assert derive_name.call_count == 0
+
+        device.settings = {"hw_version": "2"}
+        coordinator.async_update_listeners()
+        assert derive_name.call_count == 1
+        registry.async_update_device.assert_called_once_with(
+            "ha-device", name="Car", hw_version="2", sw_version="Unknown"
+        )
+
+        coordinator.device_names = {"123": "Other"}
+        device.app_data = {"id": "123"}
+        device.last_data = device.app_data
+        coordinator.async_update_listeners()
+
+    assert context.name == "Other"
+    assert registry.async_update_device.call_args.kwargs["name"] == "Other"
+    assert context.device_info is device_info
+    assert device_info == {
+        "identifiers": {(DOMAIN, "123")},
+        "name": "Other",
+        "model": "ThermoConnect",
+        "manufacturer": "Webasto",
+        "hw_version": "2",
+        "sw_version": "Unknown",
+        "configuration_url": "https://my.webastoconnect.com",
+    }
+
+
+def test_device_context_uses_coordinator_names(coordinator_factory) -> None:
+    """Device contexts should fall back to the webapi device names."""
+    device = SimpleNamespace(device_id="123", name="123", app_data={}, settings={})
+    coordinator = coordinator_factory(SimpleNamespace(devices={"123": device}))
+    coordinator.device_names = {"123": "Car"}
+
+    assert coordinator.device_context("123").name == "Car"
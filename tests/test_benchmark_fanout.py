@@ -0,0 +1,28 @@
+"""Smoke test of the coordinator fan-out benchmark harness."""
+
+from tests.benchmarks.fanout import build_fleet, format_results, run_benchmark
+
+
+def test_fleet_registers_every_entity_type_per_device() -> None:
+    """Each synthetic device should get the same set of listening entities."""
+    single = build_fleet(1)
+    fleet = build_fleet(3)
+
+    assert len(fleet.entities) == 3 * len(single.entities)
+    assert len(fleet.coordinator._listeners) == len(fleet.entities)
+
+
+def test_benchmark_reports_a_row_per_mode_and_size() -> None:
+    """The harness should only write state for devices with new data."""
+    results = run_benchmark((1, 4), polls=2, change_ratio=0.25)
+
+    assert [(result.mode, result.devices) for result in results] == [
+        ("coordinator", 1),
+        ("all-entities", 1),
+        ("coordinator", 4),
+        ("all-entities", 4),
+    ]
+    coordinator, everything = results[2], results[3]
+    assert 0 < coordinator.writes < everything.writes
+    assert everything.writes <= everything.entities
+    assert "ms/poll" in format_results(results)
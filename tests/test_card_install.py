@@ -1,9 +1,13 @@
-"""Tests for bundled card install/version handling."""
+"""Tests for bundled card serving/version handling."""
 
+import gzip
+from hashlib import sha256
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
+from aiohttp.hdrs import CACHE_CONTROL
+from aiohttp.web import HTTPNotFound
 import pytest
 from homeassistant.components.lovelace.const import (
     CONF_RESOURCE_TYPE_WS,
@@ -13,12 +17,22 @@ from homeassistant.components.lovelace.const import (
 from homeassistant.const import CONF_TYPE, CONF_URL
 
 import custom_components.webastoconnect as integration
+from custom_components.webastoconnect import card_install
 from custom_components.webastoconnect.card_install import (
-    ensure_card_installed,
-    read_card_hash,
-    read_card_version,
-    should_install_card,
+    CARD_CACHE_CONTROL,
+    WebastoCardView,
+    read_card_info,
+    remove_legacy_card,
 )
+from custom_components.webastoconnect.const import (
+    CARD_FILENAME,
+    CARD_SOURCE_DIR,
+    CARD_WWW_SUBDIR,
+)
+
+
+def _sha(content: str) -> str:
+    return sha256(content.encode()).hexdigest()[:12]
 
 
 def _prepare_source_tree(base: Path, version: str) -> Path:
@@ -26,7 +40,7 @@ def _prepare_source_tree(base: Path, version: str) -> Path:
     source_dir = integration_path / "card"
     source_dir.mkdir(parents=True)
 
-    (source_dir / "webasto-connect-card.js").write_text(
+    (source_dir / CARD_FILENAME).write_text(
         f'globalThis.__WEBASTO_CONNECT_CARD_VERSION__ = "{version}";\n'
         "console.log('webasto card');",
         encoding="utf-8",
@@ -34,12 +48,7 @@ def _prepare_source_tree(base: Path, version: str) -> Path:
     return integration_path
 
 
-def test_read_card_version_returns_none_on_missing(tmp_path: Path) -> None:
-    """Missing card file should return None."""
-    assert read_card_version(tmp_path / "missing.js") is None
-
-
-def test_read_card_version_from_js_marker(tmp_path: Path) -> None:
+def test_read_card_info_from_js_marker(tmp_path: Path) -> None:
     """Card version should be parsed from JavaScript marker line."""
     card_file = tmp_path / "card.js"
     card_file.write_text(
@@ -47,69 +56,100 @@ def test_read_card_version_from_js_marker(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    assert read_card_version(card_file) == "0.1.0"
+    version, card_hash = read_card_info(card_file)
 
+    assert version == "0.1.0"
+    assert card_hash is not None
+    assert len(card_hash) == 12
 
-def test_read_card_hash_returns_short_hash(tmp_path: Path) -> None:
-    """Card hash should be stable and short enough for cache-busting."""
-    card_file = tmp_path / "card.js"
-    card_file.write_text("console.log('webasto');", encoding="utf-8")
 
-    card_hash = read_card_hash(card_file)
+def test_read_card_info_reads_bundle_once(tmp_path: Path, monkeypatch) -> None:
+    """Version and hash should be served from memory until the bundle changes."""
+    card_file = _prepare_source_tree(tmp_path, "0.1.0") / "card" / CARD_FILENAME
+    version, card_hash = read_card_info(card_file)
 
-    assert card_hash is not None
-    assert len(card_hash) == 12
+    read_bytes = Mock(side_effect=AssertionError("content read"))
+    monkeypatch.setattr(Path, "read_bytes", read_bytes)
+    assert read_card_info(card_file) == (version, card_hash)
+    monkeypatch.undo()
 
+    card_file.write_text(
+        'globalThis.__WEBASTO_CONNECT_CARD_VERSION__ = "0.2.0";', encoding="utf-8"
+    )
+    assert read_card_info(card_file) == (
+        "0.2.0",
+        _sha('globalThis.__WEBASTO_CONNECT_CARD_VERSION__ = "0.2.0";'),
+    )
+    assert version == "0.1.0"
+    assert card_hash == _sha(
+        'globalThis.__WEBASTO_CONNECT_CARD_VERSION__ = "0.1.0";\n'
+        "console.log('webasto card');"
+    )
 
-def test_should_install_card_logic(tmp_path: Path) -> None:
-    """Install should happen when file missing, version differs, or content changes."""
-    source = tmp_path / "source-webasto-connect-card.js"
-    target = tmp_path / "webasto-connect-card.js"
-    source.write_text("same-content", encoding="utf-8")
 
-    assert should_install_card("0.1.0", None, source, target) is True
+def test_read_card_info_without_version_marker(tmp_path: Path) -> None:
+    """A bundle without version marker should not be served."""
+    card_file = tmp_path / CARD_FILENAME
+    card_file.write_text("console.log('webasto');", encoding="utf-8")
 
-    target.write_text("same-content", encoding="utf-8")
-    assert should_install_card("0.1.0", "0.1.0", source, target) is False
-    assert should_install_card("0.1.0", "0.0.9", source, target) is True
-    assert should_install_card(None, "0.1.0", source, target) is False
+    assert read_card_info(card_file) == (None, None)
+    assert read_card_info(tmp_path / "missing.js") == (None, None)
 
-    target.write_text("changed-content", encoding="utf-8")
-    assert should_install_card("0.1.0", "0.1.0", source, target) is True
 
+def test_bundled_card_ships_precompressed_variants() -> None:
+    """Gzip and brotli variants should be built next to the bundle."""
+    card_file = Path(integration.__file__).parent / CARD_SOURCE_DIR / CARD_FILENAME
 
-def test_ensure_card_installed_copies_bundle(tmp_path: Path) -> None:
-    """Built card should be copied to www folder."""
-    integration_path = _prepare_source_tree(tmp_path, "0.1.0")
-    www_path = tmp_path / "www"
+    assert read_card_info(card_file)[0] is not None
+    assert (
+        gzip.decompress(card_file.with_name(f"{CARD_FILENAME}.gz").read_bytes())
+        == card_file.read_bytes()
+    )
+    assert card_file.with_name(f"{CARD_FILENAME}.br").stat().st_size > 0
 
-    installed, version, card_hash = ensure_card_installed(integration_path, www_path)
 
-    assert installed is True
-    assert version == "0.1.0"
-    assert card_hash is not None
-    assert (www_path / "webastoconnect" / "webasto-connect-card.js").exists()
+def test_remove_legacy_card_deletes_old_www_copy(tmp_path: Path) -> None:
+    """The copy of older releases should be removed with its directory."""
+    legacy_dir = tmp_path / CARD_WWW_SUBDIR
+    legacy_dir.mkdir()
+    (legacy_dir / CARD_FILENAME).write_text("old", encoding="utf-8")
+    (legacy_dir / f".{CARD_FILENAME}.json").write_text("{}", encoding="utf-8")
 
+    assert remove_legacy_card(tmp_path) is True
+    assert not legacy_dir.exists()
+    assert remove_legacy_card(tmp_path) is False
 
-def test_ensure_card_installed_skips_when_up_to_date(tmp_path: Path) -> None:
-    """Second install with same version should be skipped."""
-    integration_path = _prepare_source_tree(tmp_path, "0.1.0")
-    www_path = tmp_path / "www"
 
-    first_installed, _, _ = ensure_card_installed(integration_path, www_path)
-    second_installed, version, card_hash = ensure_card_installed(
-        integration_path, www_path
-    )
+def test_remove_legacy_card_keeps_other_files(tmp_path: Path) -> None:
+    """Files the integration did not write should stay in place."""
+    legacy_dir = tmp_path / CARD_WWW_SUBDIR
+    legacy_dir.mkdir()
+    (legacy_dir / CARD_FILENAME).write_text("old", encoding="utf-8")
+    (legacy_dir / "picture.png").write_bytes(b"png")
 
-    assert first_installed is True
-    assert second_installed is False
-    assert version == "0.1.0"
-    assert card_hash is not None
+    assert remove_legacy_card(tmp_path) is True
+    assert [path.name for path in legacy_dir.iterdir()] == ["picture.png"]
 
 
 @pytest.mark.asyncio
-async def test_ensure_lovelace_resource_updates_stable_path_with_hash() -> None:
-    """Resource URL should keep a stable path and only change the hash query."""
+async def test_card_view_serves_bundle_with_immutable_cache(tmp_path: Path) -> None:
+    """The current hash should be cached forever, stale hashes revalidated."""
+    card_file = _prepare_source_tree(tmp_path, "0.1.0") / "card" / CARD_FILENAME
+    view = WebastoCardView(card_file, "abc123def456")
+
+    response = await view.get(Mock(), "abc123def456", CARD_FILENAME)
+    stale = await view.get(Mock(), "000000000000", CARD_FILENAME)
+
+    assert response._path == card_file
+    assert response.headers[CACHE_CONTROL] == CARD_CACHE_CONTROL
+    assert stale.headers[CACHE_CONTROL] == "no-cache"
+    with pytest.raises(HTTPNotFound):
+        await view.get(Mock(), "abc123def456", "other.js")
+
+
+@pytest.mark.asyncio
+async def test_ensure_lovelace_resource_moves_local_copy_to_served_card() -> None:
+    """A resource of the old www copy should point at the served card."""
     resources = SimpleNamespace(
         async_items=lambda: [
             {
@@ -130,18 +170,20 @@ async def test_ensure_lovelace_resource_updates_stable_path_with_hash() -> None:
         }
     )
 
-    await integration._async_ensure_lovelace_card_resource(hass, "newhash123456")
+    assert await integration._async_ensure_lovelace_card_resource(
+        hass, "newhash123456"
+    )
 
     resources.async_update_item.assert_awaited_once_with(
         "res-1",
-        {CONF_URL: "/local/webastoconnect/webasto-connect-card.js?v=newhash123456"},
+        {CONF_URL: "/webastoconnect/card/newhash123456/webasto-connect-card.js"},
     )
     resources.async_create_item.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_ensure_lovelace_resource_creates_stable_path_when_missing() -> None:
-    """Missing resource should be created at the stable card path."""
+async def test_ensure_lovelace_resource_creates_hashed_path_when_missing() -> None:
+    """Missing resource should be created at the hashed card path."""
     resources = SimpleNamespace(
         async_items=lambda: [],
         async_update_item=AsyncMock(),
@@ -160,8 +202,95 @@ async def test_ensure_lovelace_resource_creates_stable_path_when_missing() -> No
 
     resources.async_create_item.assert_awaited_once_with(
         {
-            CONF_URL: "/local/webastoconnect/webasto-connect-card.js?v=abc123def456",
+            CONF_URL: "/webastoconnect/card/abc123def456/webasto-connect-card.js",
             CONF_RESOURCE_TYPE_WS: "module",
         }
     )
     resources.async_update_item.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ensure_lovelace_resource_keeps_current_hash() -> None:
+    """A resource already at the current hash should be left alone."""
+    resources = SimpleNamespace(
+        async_items=lambda: [
+            {
+                "id": "res-1",
+                CONF_URL: "/webastoconnect/card/abc123def456/webasto-connect-card.js",
+                CONF_TYPE: "module",
+            }
+        ],
+        async_update_item=AsyncMock(),
+        async_create_item=AsyncMock(),
+    )
+    hass = SimpleNamespace(
+        data={
+            LOVELACE_DATA: SimpleNamespace(
+                resource_mode=MODE_STORAGE,
+                resources=resources,
+            )
+        }
+    )
+
+    await integration._async_ensure_lovelace_card_resource(hass, "abc123def456")
+
+    resources.async_update_item.assert_not_called()
+    resources.async_create_item.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ensure_lovelace_resource_skips_yaml_mode() -> None:
+    """YAML mode resources are managed by the user and left alone."""
+    hass = SimpleNamespace(
+        data={LOVELACE_DATA: SimpleNamespace(resource_mode="yaml", resources=None)}
+    )
+
+    assert not await integration._async_ensure_lovelace_card_resource(
+        hass, "abc123def456"
+    )
+
+
+@pytest.mark.asyncio
+async def test_register_card_removes_legacy_copy_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """The old www copy should be removed once the stored resource moved."""
+    integration_path = _prepare_source_tree(tmp_path, "0.1.0")
+    legacy_card = tmp_path / "www" / CARD_WWW_SUBDIR / CARD_FILENAME
+    legacy_card.parent.mkdir(parents=True)
+    legacy_card.write_text("old", encoding="utf-8")
+    resources = SimpleNamespace(
+        async_items=lambda: [],
+        async_update_item=AsyncMock(),
+        async_create_item=AsyncMock(),
+    )
+
+    async def _executor(func, *args):
+        return func(*args)
+
+    hass = SimpleNamespace(
+        data={
+            LOVELACE_DATA: SimpleNamespace(
+                resource_mode=MODE_STORAGE,
+                resources=resources,
+            )
+        },
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+        http=SimpleNamespace(register_view=Mock()),
+        async_add_executor_job=_executor,
+    )
+    monkeypatch.setattr(
+        integration, "async_import_module", AsyncMock(return_value=card_install)
+    )
+
+    await integration._async_register_card(
+        hass, SimpleNamespace(file_path=integration_path)
+    )
+    assert not legacy_card.parent.exists()
+
+    legacy_card.parent.mkdir()
+    legacy_card.write_text("old", encoding="utf-8")
+    await integration._async_register_card(
+        hass, SimpleNamespace(file_path=integration_path)
+    )
+    assert legacy_card.exists()
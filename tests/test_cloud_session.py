@@ -0,0 +1,120 @@
+"""Tests for cloud sessions shared between config entries."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.webastoconnect.session import (
+    async_get_cloud_session,
+    async_validate_credentials,
+)
+
+
+def _fake_cloud() -> SimpleNamespace:
+    """Create a fake pywebasto client."""
+    return SimpleNamespace(connect=AsyncMock(), update=AsyncMock(), close=AsyncMock())
+
+
+def test_entries_with_same_account_share_one_client() -> None:
+    """Matching credentials should reuse the registered client."""
+    hass = SimpleNamespace(data={})
+    factory = Mock(side_effect=_fake_cloud)
+
+    first = async_get_cloud_session(hass, "User@Example.com", "pw", factory)
+    second = async_get_cloud_session(hass, "user@example.com", "pw", factory)
+
+    assert first is second
+    factory.assert_called_once()
+
+
+def test_different_password_gets_private_client_while_in_use() -> None:
+    """A session in use should not be replaced by other credentials."""
+    hass = SimpleNamespace(data={})
+    shared = async_get_cloud_session(hass, "user@example.com", "pw", _fake_cloud)
+    shared.async_join(object())
+
+    other = async_get_cloud_session(hass, "user@example.com", "other", _fake_cloud)
+
+    assert other is not shared
+    assert other.registry is None
+    assert async_get_cloud_session(hass, "user@example.com", "pw", _fake_cloud) is (
+        shared
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_logs_in_once_and_hands_over_polling() -> None:
+    """Later entries should reuse the login and take over when the leader leaves."""
+    hass = SimpleNamespace(data={})
+    session = async_get_cloud_session(hass, "user@example.com", "pw", _fake_cloud)
+    leader = SimpleNamespace(async_take_over_polling=Mock())
+    follower = SimpleNamespace(async_take_over_polling=Mock())
+
+    await session.async_connect()
+    session.async_join(leader)
+    await session.async_connect()
+    session.async_join(follower)
+
+    session.cloud.connect.assert_awaited_once()
+    session.cloud.update.assert_awaited_once()
+    assert session.followers(leader) == [follower]
+    assert session.followers(follower) == []
+
+    await session.async_leave(leader)
+    follower.async_take_over_polling.assert_called_once()
+    session.cloud.close.assert_not_awaited()
+
+    await session.async_leave(follower)
+    session.cloud.close.assert_awaited_once()
+    assert hass.data["webastoconnect_cloud_sessions"] == {}
+
+
+@pytest.mark.asyncio
+async def test_validate_credentials_reuses_connected_session() -> None:
+    """Flows should not log in again when a matching session is connected."""
+    hass = SimpleNamespace(data={})
+    session = async_get_cloud_session(hass, "user@example.com", "pw", _fake_cloud)
+    await session.async_connect()
+    factory = Mock(side_effect=_fake_cloud)
+
+    await async_validate_credentials(hass, "user@example.com", "pw", factory)
+
+    factory.assert_not_called()
+    session.cloud.update.assert_awaited_once()
+    budget = hass.data["webastoconnect_request_budgets"]["user@example.com"]
+    assert sum(budget.entry_requests.values()) == 1
+
+
+@pytest.mark.asyncio
+async def test_validate_credentials_waits_for_running_poll() -> None:
+    """The flow refresh should not race a poll on the shared client."""
+    hass = SimpleNamespace(data={})
+    session = async_get_cloud_session(hass, "user@example.com", "pw", _fake_cloud)
+    session.async_join(SimpleNamespace(config_entry=SimpleNamespace(entry_id="e1")))
+    await session.async_connect()
+
+    async with session.locks.session():
+        validating = asyncio.ensure_future(
+            async_validate_credentials(hass, "user@example.com", "pw", _fake_cloud)
+        )
+        await asyncio.sleep(0)
+        session.cloud.update.assert_not_awaited()
+    await validating
+
+    session.cloud.update.assert_awaited_once()
+    budget = hass.data["webastoconnect_request_budgets"]["user@example.com"]
+    assert budget.entry_requests == {"e1": 1}
+
+
+@pytest.mark.asyncio
+async def test_validate_credentials_uses_throwaway_client_otherwise() -> None:
+    """Unknown credentials should be validated with a closed throwaway client."""
+    hass = SimpleNamespace(data={})
+    cloud = _fake_cloud()
+
+    await async_validate_credentials(hass, "user@example.com", "pw", lambda: cloud)
+
+    cloud.connect.assert_awaited_once()
+    cloud.close.assert_awaited_once()
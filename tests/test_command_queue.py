@@ -0,0 +1,118 @@
+"""Tests for coalescing entity write queues."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+
+from custom_components.webastoconnect.command_queue import CoalescingCommandQueue
+
+
+@pytest.mark.asyncio
+async def test_burst_is_coalesced_into_latest_value() -> None:
+    """Values queued behind a running write should collapse into the latest."""
+    sent: list[float] = []
+
+    async def send(value: float) -> None:
+        sent.append(value)
+        await asyncio.sleep(0.01)
+
+    queue = CoalescingCommandQueue(send)
+
+    first = asyncio.ensure_future(queue.async_submit(1))
+    await asyncio.sleep(0.001)
+    await asyncio.gather(*(queue.async_submit(value) for value in (2, 3, 4)), first)
+
+    assert sent == [1, 4]
+
+
+@pytest.mark.asyncio
+async def test_debounce_only_sends_final_value() -> None:
+    """A debounced queue should send one write for a whole burst."""
+    send = AsyncMock()
+    queue = CoalescingCommandQueue(send, delay=0.01)
+
+    async def submit_later(value: float, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await queue.async_submit(value)
+
+    await asyncio.gather(
+        queue.async_submit(10.5),
+        submit_later(11.0, 0.001),
+        submit_later(11.5, 0.002),
+    )
+
+    send.assert_awaited_once_with(11.5)
+
+
+@pytest.mark.asyncio
+async def test_toggle_back_to_sent_value_is_skipped() -> None:
+    """A burst ending on the value just written should not write it again."""
+    sent: list[bool] = []
+
+    async def send(value: bool) -> None:
+        sent.append(value)
+        await asyncio.sleep(0.01)
+
+    queue = CoalescingCommandQueue(send)
+
+    first = asyncio.ensure_future(queue.async_submit(True))
+    await asyncio.sleep(0.001)
+    await asyncio.gather(queue.async_submit(False), queue.async_submit(True), first)
+
+    assert sent == [True]
+
+
+@pytest.mark.asyncio
+async def test_write_error_reaches_every_coalesced_caller() -> None:
+    """Callers sharing a write should all receive its exception."""
+    send = AsyncMock(side_effect=RuntimeError("boom"))
+    queue = CoalescingCommandQueue(send, delay=0.01)
+
+    results = await asyncio.gather(
+        queue.async_submit(1),
+        queue.async_submit(2),
+        return_exceptions=True,
+    )
+
+    send.assert_awaited_once_with(2)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_abort_shared_write() -> None:
+    """Cancelling one waiter must leave the write for other callers intact."""
+    send = AsyncMock()
+    queue = CoalescingCommandQueue(send, delay=0.01)
+
+    first = asyncio.ensure_future(queue.async_submit(1))
+    await asyncio.sleep(0)
+    first.cancel()
+    await queue.async_submit(2)
+
+    send.assert_awaited_once_with(2)
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_worker_and_fails_waiting_callers() -> None:
+    """Removing the entity should not leave the worker or its callers hanging."""
+    started = asyncio.Event()
+
+    async def send(value: int) -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    queue = CoalescingCommandQueue(send)
+
+    sending = asyncio.ensure_future(queue.async_submit(1))
+    await started.wait()
+    queued = asyncio.ensure_future(queue.async_submit(2))
+    await asyncio.sleep(0)
+    await queue.async_cancel()
+
+    results = await asyncio.gather(sending, queued, return_exceptions=True)
+
+    assert all(isinstance(result, HomeAssistantError) for result in results)
+    assert queue._worker is None
+    assert queue._pending_future is None
@@ -4,20 +4,24 @@ import asyncio
 
 import pytest
 
-from custom_components.webastoconnect.api import WebastoConnectUpdateCoordinator
+from custom_components.webastoconnect.api import (
+    WebastoConnectUpdateCoordinator,
+)
 
 
-def _build_coordinator() -> WebastoConnectUpdateCoordinator:
-    """Create a coordinator with only the lock state needed for tests."""
-    coordinator = object.__new__(WebastoConnectUpdateCoordinator)
-    coordinator._cloud_operation_lock = asyncio.Lock()
+def _build_coordinator(coordinator_factory) -> WebastoConnectUpdateCoordinator:
+    """Create a coordinator with a connected session and no devices."""
+    coordinator = coordinator_factory()
+    coordinator.cloud_session.connected = True
     return coordinator
 
 
 @pytest.mark.asyncio
-async def test_async_execute_cloud_call_serializes_parallel_calls() -> None:
+async def test_async_execute_cloud_call_serializes_parallel_calls(
+    coordinator_factory,
+) -> None:
     """Parallel cloud calls must execute one at a time."""
-    coordinator = _build_coordinator()
+    coordinator = _build_coordinator(coordinator_factory)
     order: list[str] = []
     running = False
     overlap_detected = False
@@ -42,3 +46,77 @@ async def test_async_execute_cloud_call_serializes_parallel_calls() -> None:
         ["start-a", "end-a", "start-b", "end-b"],
         ["start-b", "end-b", "start-a", "end-a"],
     ]
+
+
+class _OverlapTracker:
+    """Record start/end order and overlap of tracked cloud calls."""
+
+    def __init__(self) -> None:
+        self.order: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def cloud_call(self, marker: str) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.order.append(f"start-{marker}")
+        await asyncio.sleep(0.01)
+        self.order.append(f"end-{marker}")
+        self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_device_calls_on_different_devices_run_concurrently(
+    coordinator_factory,
+) -> None:
+    """A slow call on one device must not block another device."""
+    coordinator = _build_coordinator(coordinator_factory)
+    tracker = _OverlapTracker()
+
+    await asyncio.gather(
+        coordinator.async_execute_device_call("dev1", tracker.cloud_call, "a"),
+        coordinator.async_execute_device_call("dev2", tracker.cloud_call, "b"),
+    )
+
+    assert tracker.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_device_calls_on_same_device_are_serialized(coordinator_factory) -> None:
+    """Calls on the same device must execute one at a time."""
+    coordinator = _build_coordinator(coordinator_factory)
+    tracker = _OverlapTracker()
+
+    await asyncio.gather(
+        coordinator.async_execute_device_call("dev1", tracker.cloud_call, "a"),
+        coordinator.async_execute_device_call("dev1", tracker.cloud_call, "b"),
+    )
+
+    assert tracker.max_running == 1
+
+
+@pytest.mark.asyncio
+async def test_session_call_excludes_device_calls(coordinator_factory) -> None:
+    """Session calls wait for running device calls and block new ones."""
+    coordinator = _build_coordinator(coordinator_factory)
+    tracker = _OverlapTracker()
+
+    async def later_device_call() -> None:
+        await asyncio.sleep(0)
+        await coordinator.async_execute_device_call("dev2", tracker.cloud_call, "c")
+
+    await asyncio.gather(
+        coordinator.async_execute_device_call("dev1", tracker.cloud_call, "a"),
+        coordinator.async_execute_cloud_call(tracker.cloud_call, "session"),
+        later_device_call(),
+    )
+
+    assert tracker.max_running == 1
+    assert tracker.order == [
+        "start-a",
+        "end-a",
+        "start-session",
+        "end-session",
+        "start-c",
+        "end-c",
+    ]
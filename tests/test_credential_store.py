@@ -0,0 +1,82 @@
+"""Tests for the cached pywebasto credential store."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.webastoconnect.credentials import (
+    CREDENTIAL_SAVE_DELAY,
+    WebastoCredentialStore,
+)
+
+
+def _credential_store(stored=None, legacy_path=None) -> WebastoCredentialStore:
+    """Create a credential store backed by a storage stub."""
+
+    async def async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass = SimpleNamespace(
+        config=SimpleNamespace(config_dir="/config"),
+        data={},
+        async_add_executor_job=async_add_executor_job,
+    )
+    store = WebastoCredentialStore(hass, "entry-1", legacy_path)
+    store._store = SimpleNamespace(
+        async_load=AsyncMock(return_value=stored),
+        async_save=AsyncMock(),
+        async_delay_save=Mock(),
+        path="/config/.storage/webastoconnect.entry-1.credentials",
+    )
+    return store
+
+
+@pytest.mark.asyncio
+async def test_credentials_are_read_from_disk_once() -> None:
+    """Later logins should be served from memory."""
+    store = _credential_store({"client_id": "client", "client_secret": "secret"})
+
+    first = await store.async_load()
+    second = await store.async_load()
+
+    assert first == second == {"client_id": "client", "client_secret": "secret"}
+    store._store.async_load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_saves_are_delayed_and_skip_unchanged_credentials() -> None:
+    """Saving should batch writes and ignore credentials already stored."""
+    store = _credential_store()
+    credentials = SimpleNamespace(client_id="client", client_secret="secret")
+
+    await store.async_save(credentials)
+    await store.async_save(credentials)
+
+    data_func, delay = store._store.async_delay_save.call_args.args
+    store._store.async_delay_save.assert_called_once()
+    assert delay == CREDENTIAL_SAVE_DELAY
+    assert data_func() == {"client_id": "client", "client_secret": "secret"}
+    assert await store.async_load() == data_func()
+    store._store.async_load.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_legacy_credential_file_is_moved_to_storage(tmp_path) -> None:
+    """Credentials of the old plain JSON file should be migrated and removed."""
+    legacy_path = tmp_path / "webasto_entry-1.json"
+    legacy_path.write_text(
+        json.dumps({"client_id": "client", "client_secret": "secret"}),
+        encoding="utf-8",
+    )
+    store = _credential_store(legacy_path=legacy_path)
+
+    assert await store.async_load() == {
+        "client_id": "client",
+        "client_secret": "secret",
+    }
+    store._store.async_save.assert_awaited_once_with(
+        {"client_id": "client", "client_secret": "secret"}
+    )
+    assert not legacy_path.exists()
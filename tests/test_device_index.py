@@ -0,0 +1,82 @@
+"""Tests for the service call device index."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.webastoconnect import device_index
+from custom_components.webastoconnect.const import DOMAIN
+from custom_components.webastoconnect.device_index import async_get_device_index
+
+
+class _Devices(dict):
+    """Device dict counting how often it is iterated."""
+
+    iterations = 0
+
+    def __iter__(self):
+        type(self).iterations += 1
+        return super().__iter__()
+
+
+def _coordinator(*device_ids: int) -> SimpleNamespace:
+    """Return a coordinator stub owning the given devices."""
+    return SimpleNamespace(
+        cloud=SimpleNamespace(
+            devices=_Devices(
+                (device_id, SimpleNamespace(device_id=device_id))
+                for device_id in device_ids
+            )
+        )
+    )
+
+
+@pytest.fixture
+def hass(monkeypatch) -> SimpleNamespace:
+    """Return a hass stub with a device registry of one Webasto device."""
+    registry = {
+        "ha-device-2": SimpleNamespace(identifiers={(DOMAIN, "2"), ("other", "9")})
+    }
+    monkeypatch.setattr(
+        device_index.dr,
+        "async_get",
+        lambda hass: SimpleNamespace(async_get=registry.get),
+    )
+    _Devices.iterations = 0
+    return SimpleNamespace(data={})
+
+
+def test_resolves_webasto_and_registry_ids_without_rescanning(hass) -> None:
+    """Repeated lookups should be served from the index built once."""
+    first = _coordinator(1)
+    second = _coordinator(2, 3)
+    index = async_get_device_index(hass)
+    index.async_add("entry-1", first)
+    index.async_add("entry-2", second)
+
+    assert index.async_resolve("1") == (first, first.cloud.devices[1])
+    assert index.async_resolve("ha-device-2") == (second, second.cloud.devices[2])
+    assert index.async_resolve("3") == (second, second.cloud.devices[3])
+    assert _Devices.iterations == 2
+    assert async_get_device_index(hass) is index
+
+
+def test_follows_device_changes_and_unloads(hass) -> None:
+    """Added or removed devices and unloaded entries should be picked up."""
+    coordinator = _coordinator(1)
+    index = async_get_device_index(hass)
+    index.async_add("entry-1", coordinator)
+    assert index.async_resolve("1") is not None
+
+    coordinator.cloud.devices[2] = SimpleNamespace(device_id=2)
+    del coordinator.cloud.devices[1]
+
+    assert index.async_resolve("ha-device-2") == (
+        coordinator,
+        coordinator.cloud.devices[2],
+    )
+    assert index.async_resolve("1") is None
+
+    index.async_remove("entry-1")
+
+    assert index.async_resolve("2") is None
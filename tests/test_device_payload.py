@@ -0,0 +1,89 @@
+"""Tests for the normalized device payload."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.webastoconnect import api
+from custom_components.webastoconnect.payload import normalize_payload
+
+
+def _payload(ontime: int = 1_772_469_422) -> dict:
+    """Return a raw payload with heater and ventilation outputs."""
+    return {
+        "outputs": [
+            {"line": "OUTA", "state": "ON", "ontime": 5},
+            {
+                "line": "OUTH",
+                "state": "ON",
+                "ontime": ontime,
+                "timers": [
+                    {"type": "simple", "start": 420},
+                    {"type": "smart", "start": 0},
+                    "invalid",
+                ],
+            },
+            "invalid",
+        ],
+        "disabled_outputs": [
+            {
+                "line": "OUTV",
+                "state": "OFF",
+                "timers": [{"type": "simple", "start": 60}],
+            },
+            {
+                "line": "OUTH",
+                "state": "OFF",
+                "timers": [{"type": "simple", "start": 90}],
+            },
+        ],
+    }
+
+
+def test_normalize_payload_indexes_outputs_and_timers_in_one_pass() -> None:
+    """Outputs, timers and the main end time should come from one walk."""
+    payload = normalize_payload(_payload())
+
+    assert set(payload.outputs) == {"OUTA", "OUTH", "OUTV"}
+    assert payload.outputs["OUTH"].disabled is False
+    assert payload.outputs["OUTV"].disabled is True
+    assert payload.main_end_time == datetime.fromtimestamp(1_772_469_422, UTC)
+    assert [(timer["line"], timer["start"]) for timer in payload.timers] == [
+        ("OUTH", 420),
+        ("OUTV", 60),
+        ("OUTH", 90),
+    ]
+    assert payload.line_timers({"OUTH"}) == [
+        {"type": "simple", "start": 420, "line": "OUTH"},
+        {"type": "simple", "start": 90, "line": "OUTH"},
+    ]
+    assert normalize_payload(_payload()).timers_hash == payload.timers_hash
+    assert normalize_payload(None).timers == ()
+
+
+def test_coordinator_normalizes_each_payload_once(coordinator_factory) -> None:
+    """The coordinator should reuse a payload until it is replaced or edited."""
+    device = SimpleNamespace(last_data=_payload(), settings=None, dev_data=None)
+    coordinator = coordinator_factory(SimpleNamespace(devices={"1": device}))
+    coordinator.async_update_listeners()
+
+    with patch.object(
+        api, "normalize_payload", wraps=api.normalize_payload
+    ) as normalize:
+        first = coordinator.device_payload("1")
+        assert coordinator.device_payload("1") is first
+        coordinator.async_update_listeners()
+        assert coordinator.device_payload("1") is first
+        assert normalize.call_count == 1
+
+        device.last_data["outputs"][1]["ontime"] = 1_772_470_000
+        coordinator.async_update_listeners()
+        assert coordinator.device_payload("1") is first
+        coordinator.async_mark_device_edited("1")
+        coordinator.async_update_listeners()
+        edited = coordinator.device_payload("1")
+        assert edited.main_end_time == datetime.fromtimestamp(1_772_470_000, UTC)
+
+        device.last_data = _payload()
+        assert coordinator.device_payload("1") is not edited
+        assert normalize.call_count == 3
@@ -0,0 +1,89 @@
+"""Tests for the stored device snapshot."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pywebasto import WebastoDevice
+
+from custom_components.webastoconnect.snapshot import (
+    SNAPSHOT_SAVE_DELAY,
+    DeviceSnapshotStore,
+)
+
+
+def _snapshot_store(stored: dict | None = None) -> DeviceSnapshotStore:
+    """Create a snapshot store backed by a storage stub."""
+    snapshot_store = object.__new__(DeviceSnapshotStore)
+    snapshot_store._store = SimpleNamespace(
+        async_load=AsyncMock(return_value=stored),
+        async_delay_save=Mock(),
+    )
+    return snapshot_store
+
+
+def _app_data() -> dict:
+    """Return a minimal app backend payload."""
+    return {
+        "temperature": "12C",
+        "voltage": "12.4V",
+        "location": {"state": "ON", "lat": 55.0, "lon": 12.0},
+        "connection_lost": False,
+        "subscription": {"expiration": 1893456000},
+        "outputs": [{"line": "OUTH", "icon": "heater", "state": "ON"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_saved_snapshot_restores_devices() -> None:
+    """Devices saved from one client should hydrate a fresh client."""
+    device = WebastoDevice("1", "Heater")
+    device.app_data = _app_data()
+    saving = _snapshot_store()
+
+    saving.async_schedule_save(SimpleNamespace(devices={"1": device}), {"1": "Car"})
+
+    data_func, delay = saving._store.async_delay_save.call_args.args
+    assert delay == SNAPSHOT_SAVE_DELAY
+    cloud = SimpleNamespace(devices={})
+
+    device_names = await _snapshot_store(data_func()).async_restore(cloud)
+
+    assert device_names == {"1": "Car"}
+    restored = cloud.devices["1"]
+    assert restored.name == "Heater"
+    assert restored.temperature == 12
+    assert restored.output_main is True
+    assert restored.is_connected is True
+    assert restored.location is False
+
+
+def test_pending_save_is_not_pushed_back() -> None:
+    """Saves during a pending one should not delay it, it writes the latest data."""
+    device = WebastoDevice("1", "Heater")
+    device.app_data = _app_data()
+    store = _snapshot_store()
+
+    store.async_schedule_save(SimpleNamespace(devices={}), {})
+    store.async_schedule_save(SimpleNamespace(devices={"1": device}), {"1": "Car"})
+
+    store._store.async_delay_save.assert_called_once()
+    data_func, _ = store._store.async_delay_save.call_args.args
+    assert list(data_func()["devices"]) == ["1"]
+
+    store.async_schedule_save(SimpleNamespace(devices={"1": device}), {"1": "Car"})
+
+    assert store._store.async_delay_save.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stored",
+    [None, {"devices": {}}, {"devices": {"1": {"name": "Heater"}}}],
+)
+async def test_missing_or_invalid_snapshot_is_ignored(stored) -> None:
+    """Setup should fall back to a blocking login without a usable snapshot."""
+    cloud = SimpleNamespace(devices={})
+
+    assert await _snapshot_store(stored).async_restore(cloud) is None
+    assert cloud.devices == {}
@@ -1,9 +1,19 @@
 """Tests for Webasto device tracker location guards."""
 
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import pytest
+from pywebasto import WebastoDevice
+
+from custom_components.webastoconnect import device_tracker, services
 from custom_components.webastoconnect.device_tracker import WebastoConnectDeviceTracker
+from custom_components.webastoconnect.location import (
+    LocationSnapshot,
+    LocationTrail,
+    haversine_distance,
+)
 
 
 def _build_tracker(location, prev_lat=None, prev_lon=None) -> WebastoConnectDeviceTracker:
@@ -48,3 +58,177 @@ def test_tracker_update_writes_state_when_location_changes() -> None:
     assert tracker._prev_lon == 12.0
     tracker.async_write_ha_state.assert_called_once()
 
+
+def test_tracker_ignores_movement_below_threshold() -> None:
+    """GPS noise of a parked vehicle should not write state."""
+    tracker = _build_tracker(
+        {"lat": 55.0001, "lon": 12.0}, prev_lat=55.0, prev_lon=12.0
+    )
+    tracker._location = LocationSnapshot(55.0, 12.0)
+    tracker._min_movement = 25.0
+
+    tracker._handle_coordinator_update()
+
+    tracker.async_write_ha_state.assert_not_called()
+    assert tracker.latitude == 55.0
+
+
+def test_tracker_writes_movement_above_threshold_and_records_trail() -> None:
+    """Real movement should write state and extend the trail."""
+    tracker = _build_tracker({"lat": 55.001, "lon": 12.0}, prev_lat=55.0, prev_lon=12.0)
+    tracker._min_movement = 25.0
+    tracker._trail = LocationTrail()
+
+    tracker._handle_coordinator_update()
+
+    tracker.async_write_ha_state.assert_called_once()
+    assert tracker.latitude == 55.001
+    assert [point["latitude"] for point in tracker._trail.as_list()] == [55.001]
+
+
+def test_tracker_writes_when_location_disappears() -> None:
+    """Losing the location should always write state."""
+    tracker = _build_tracker(False, prev_lat=55.0, prev_lon=12.0)
+    tracker._location = LocationSnapshot(55.0, 12.0)
+    tracker._min_movement = 25.0
+
+    tracker._handle_coordinator_update()
+
+    tracker.async_write_ha_state.assert_called_once()
+    assert tracker.available is False
+    assert tracker._prev_lat is None
+
+
+def test_haversine_distance_in_meters() -> None:
+    """One thousandth of a degree latitude should be about 111 meters."""
+    assert haversine_distance(55.0, 12.0, 55.001, 12.0) == pytest.approx(111.2, abs=0.1)
+
+
+def test_trail_merges_close_positions_and_stays_bounded() -> None:
+    """Positions within the spacing should replace the last point."""
+    trail = LocationTrail(length=2, spacing=timedelta(minutes=5))
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    trail.add(LocationSnapshot(55.0, 12.0), start)
+    trail.add(LocationSnapshot(55.1, 12.0), start + timedelta(minutes=1))
+    trail.add(LocationSnapshot(55.2, 12.0), start + timedelta(minutes=10))
+    trail.add(LocationSnapshot(55.3, 12.123456789), start + timedelta(minutes=20))
+
+    assert trail.as_list() == [
+        {
+            "time": "2026-01-01T00:10:00+00:00",
+            "latitude": 55.2,
+            "longitude": 12.0,
+        },
+        {
+            "time": "2026-01-01T00:20:00+00:00",
+            "latitude": 55.3,
+            "longitude": 12.12346,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_location_trail_returns_recorded_positions(monkeypatch) -> None:
+    """get_location_trail should serve the trail recorded by the tracker."""
+    trail = LocationTrail()
+    trail.add(LocationSnapshot(55.0, 12.0), datetime(2026, 1, 1, tzinfo=UTC))
+    trails = {"dev1": trail}
+    coordinator = SimpleNamespace(location_trail=trails.get)
+    monkeypatch.setattr(
+        services,
+        "_coordinator_and_device",
+        lambda hass, device_id: (coordinator, SimpleNamespace(device_id=device_id)),
+    )
+
+    response = await services._async_handle_get_location_trail(
+        SimpleNamespace(), SimpleNamespace(data={"device_id": "dev1"})
+    )
+    missing = await services._async_handle_get_location_trail(
+        SimpleNamespace(), SimpleNamespace(data={"device_id": "dev2"})
+    )
+
+    assert response == {"trail": trail.as_list()}
+    assert missing == {"trail": []}
+
+
+def test_tracker_writes_availability_change_without_movement() -> None:
+    """A disconnect should write state even when the vehicle did not move."""
+    tracker = _build_tracker(
+        {"lat": 55.0001, "lon": 12.0}, prev_lat=55.0, prev_lon=12.0
+    )
+    tracker._cloud.devices[1].is_connected = False
+    tracker._location = LocationSnapshot(55.0, 12.0)
+    tracker._min_movement = 25.0
+
+    tracker._handle_coordinator_update()
+
+    tracker.async_write_ha_state.assert_called_once()
+    assert tracker.available is False
+
+
+def test_tracker_writes_reconnect_without_movement() -> None:
+    """A reconnect should write state even when the vehicle did not move."""
+    tracker = _build_tracker(
+        {"lat": 55.0001, "lon": 12.0}, prev_lat=55.0, prev_lon=12.0
+    )
+    tracker._attr_available = False
+    tracker._location = LocationSnapshot(55.0, 12.0)
+    tracker._min_movement = 25.0
+
+    tracker._handle_coordinator_update()
+
+    tracker.async_write_ha_state.assert_called_once()
+    assert tracker.available is True
+
+
+def test_tracker_is_notified_when_only_the_connection_changes(
+    coordinator_factory,
+) -> None:
+    """A connection change without new coordinates should reach the tracker."""
+    device = WebastoDevice("1", "Heater")
+    device.app_data = {
+        "location": {"state": "ON", "lat": 55.0, "lon": 12.0},
+        "connection_lost": False,
+    }
+    coordinator = coordinator_factory(SimpleNamespace(devices={"1": device}))
+    tracker = WebastoConnectDeviceTracker("1", device_tracker.TRACKER, coordinator)
+    tracker.async_write_ha_state = Mock()
+    coordinator._listeners[1] = (
+        tracker._handle_coordinator_update,
+        tracker.coordinator_context,
+    )
+    coordinator.async_update_listeners()
+    tracker.async_write_ha_state.reset_mock()
+
+    device.app_data = {**device.app_data, "connection_lost": True}
+    coordinator.async_update_listeners()
+
+    tracker.async_write_ha_state.assert_called_once()
+    assert tracker.available is False
+
+
+@pytest.mark.asyncio
+async def test_tracker_setup_applies_options() -> None:
+    """Movement and trail length options should reach the tracker."""
+    device = SimpleNamespace(name="Heater", location=False)
+    coordinator = SimpleNamespace(
+        cloud=SimpleNamespace(devices={1: device}),
+        location_trail=Mock(return_value=None),
+    )
+    entry = SimpleNamespace(
+        options={"min_movement": 100, "trail_length": 10},
+        runtime_data=SimpleNamespace(coordinator=coordinator),
+    )
+    created = []
+
+    def fake_tracker(device_id, description, coordinator):
+        created.append(description)
+        return SimpleNamespace(entity_id="device_tracker.heater_location")
+
+    with patch.object(device_tracker, "WebastoConnectDeviceTracker", fake_tracker):
+        await device_tracker.async_setup_entry(None, entry, Mock())
+
+    assert created[0].min_movement == 100.0
+    assert created[0].trail_length == 10
+    assert device_tracker.TRACKER.min_movement == 25.0
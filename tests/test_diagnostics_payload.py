@@ -57,3 +57,45 @@ async def test_diagnostics_keeps_api_payload_and_redacts_sensitive_fields() -> N
     assert diagnostics["entry"]["title"] == "**REDACTED**"
     assert diagnostics["entry"]["unique_id"] == "**REDACTED**"
     assert "_WebastoDevice__internal_only" not in payload
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_includes_normalized_outputs() -> None:
+    """Diagnostics should show how outputs and timers were read."""
+    device = SimpleNamespace(
+        device_id=123,
+        name="My Heater",
+        last_data={
+            "outputs": [
+                {
+                    "line": "OUTH",
+                    "state": "ON",
+                    "ontime": 1_772_469_422,
+                    "timers": [{"type": "simple", "start": 420}],
+                }
+            ],
+            "disabled_outputs": [{"line": "OUTV", "state": "OFF", "timers": []}],
+        },
+    )
+    entry = SimpleNamespace(
+        entry_id="entry-1",
+        runtime_data=SimpleNamespace(
+            coordinator=SimpleNamespace(cloud=SimpleNamespace(devices={123: device}))
+        ),
+        as_dict=dict,
+    )
+
+    diagnostics = await async_get_config_entry_diagnostics(SimpleNamespace(), entry)
+
+    assert diagnostics["devices"]["123"]["normalized_payload"] == {
+        "outputs": {
+            "OUTH": {
+                "state": "ON",
+                "disabled": False,
+                "end_time": "2026-03-02T16:37:02+00:00",
+            },
+            "OUTV": {"state": "OFF", "disabled": True, "end_time": None},
+        },
+        "simple_timers": {"OUTH": 1},
+        "main_end_time": "2026-03-02T16:37:02+00:00",
+    }
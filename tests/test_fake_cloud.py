@@ -0,0 +1,59 @@
+"""End-to-end tests against the local fake Webasto cloud."""
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+import pytest
+from pywebasto.exceptions import UnauthorizedException
+
+from custom_components.webastoconnect.retry import FailureClass
+from tests.benchmarks.fake_cloud import MALFORMED, FakeWebastoCloud
+from tests.benchmarks.scenario import build_scenario_coordinator, run_scenario
+from tests.helpers import build_hass
+
+
+@pytest.mark.asyncio
+async def test_scenario_drives_commands_and_timers_through_pywebasto() -> None:
+    """Switch writes and timer services should reach the fake cloud."""
+    cloud = FakeWebastoCloud(device_count=2)
+
+    report = await run_scenario(polls=2, commands=2, cloud=cloud)
+
+    assert not any(report.errors.values())
+    assert len(report.latencies["poll"]) == 2
+    assert len(report.latencies["switch"]) == 2
+    assert len(report.latencies["timer_delete"]) == 2
+    assert report.percentiles("switch")[50] > 0
+    assert report.state_writes > 0
+    assert cloud.output("000000", "OUTH")["state"] == "ON"
+    assert cloud.requests["/remote/client/{client_id}/device/{device_id}/timers2"] == 6
+
+
+@pytest.mark.asyncio
+async def test_injected_faults_map_to_failure_classes() -> None:
+    """Rate limits and malformed payloads should be classified by the coordinator."""
+    async with FakeWebastoCloud(device_count=1) as cloud:
+        coordinator = build_scenario_coordinator(build_hass(), cloud)
+        await coordinator.cloud_session.async_connect()
+
+        for fault in (429, MALFORMED):
+            cloud.fail_next(fault, path="/all")
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        await coordinator.async_close_cloud()
+
+    assert set(coordinator.retry_policy.stats) == {
+        FailureClass.RATE_LIMITED,
+        FailureClass.TEMPORARY,
+    }
+    assert coordinator.retry_policy.consecutive_failures == 0
+    assert cloud.injected == {"429": 1, MALFORMED: 1}
+
+
+@pytest.mark.asyncio
+async def test_wrong_password_is_rejected_by_fake_login() -> None:
+    """The webapi login should reject unknown credentials."""
+    async with FakeWebastoCloud() as cloud:
+        client = cloud.client(password="wrong")
+        with pytest.raises(UnauthorizedException):
+            await client.connect()
+        await client.close()
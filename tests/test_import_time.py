@@ -0,0 +1,50 @@
+"""Modules the integration package must not import at startup."""
+
+import subprocess
+import sys
+
+from tests.benchmarks.import_time import (
+    IMPORT_BUDGET_MS,
+    PACKAGE,
+    ROOT,
+    measure_import,
+)
+
+# Only needed once an entry is set up, a dashboard loads or a user asks.
+LAZY_MODULES = (
+    f"{PACKAGE}.base",
+    f"{PACKAGE}.card_install",
+    f"{PACKAGE}.diagnostics",
+    f"{PACKAGE}.repairs",
+    f"{PACKAGE}.services",
+    "homeassistant.components.lovelace",
+    "homeassistant.components.sensor",
+)
+
+
+def test_package_import_defers_heavy_modules() -> None:
+    """Importing the package should leave setup-only modules unloaded."""
+    report = measure_import()
+
+    assert not report.modules & set(LAZY_MODULES), report.format()
+
+
+def test_package_import_stays_within_budget() -> None:
+    """Importing the package should stay well within the startup budget."""
+    # Twice the scripts/import-time budget, so loaded CI machines do not flake.
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "tests" / "benchmarks" / "import_time.py"),
+            "--runs",
+            "3",
+            "--budget",
+            str(IMPORT_BUDGET_MS * 2),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
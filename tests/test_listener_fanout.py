@@ -0,0 +1,115 @@
+"""Tests for per-device differential listener notification."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from custom_components.webastoconnect.api import (
+    WebastoConnectUpdateCoordinator,
+    WebastoListenerContext,
+    _changed_data_keys,
+)
+
+
+def _device(temperature: str = "10C", voltage: str = "12.4V") -> SimpleNamespace:
+    """Create a device with a minimal raw payload."""
+    return SimpleNamespace(
+        last_data={"temperature": temperature, "voltage": voltage, "outputs": []},
+        settings=None,
+        dev_data=None,
+    )
+
+
+def _build_coordinator(
+    coordinator_factory, devices: dict
+) -> WebastoConnectUpdateCoordinator:
+    """Create a coordinator polling the given devices."""
+    return coordinator_factory(SimpleNamespace(devices=devices))
+
+
+def _add_listener(coordinator, context) -> Mock:
+    """Register a mock listener with the given context."""
+    listener = Mock()
+    coordinator._listeners[len(coordinator._listeners) + 1] = (listener, context)
+    return listener
+
+
+def test_first_notification_updates_all_listeners(coordinator_factory) -> None:
+    """Listeners should all be updated before any fingerprint is known."""
+    coordinator = _build_coordinator(coordinator_factory, {1: _device()})
+    listener = _add_listener(
+        coordinator, WebastoListenerContext(1, frozenset({"last_data.temperature"}))
+    )
+
+    coordinator.async_update_listeners()
+
+    listener.assert_called_once()
+
+
+def test_unchanged_payload_skips_listeners(coordinator_factory) -> None:
+    """Listeners should not be woken when the device payload is unchanged."""
+    coordinator = _build_coordinator(coordinator_factory, {1: _device()})
+    listener = _add_listener(coordinator, WebastoListenerContext(1))
+    coordinator.async_update_listeners()
+    listener.reset_mock()
+
+    coordinator.async_update_listeners()
+
+    listener.assert_not_called()
+
+
+def test_changed_field_only_updates_dependent_listeners(coordinator_factory) -> None:
+    """Only listeners depending on a changed field of that device are updated."""
+    devices = {1: _device(), 2: _device()}
+    coordinator = _build_coordinator(coordinator_factory, devices)
+    temperature = _add_listener(
+        coordinator, WebastoListenerContext(1, frozenset({"last_data.temperature"}))
+    )
+    voltage = _add_listener(
+        coordinator, WebastoListenerContext(1, frozenset({"last_data.voltage"}))
+    )
+    section = _add_listener(
+        coordinator, WebastoListenerContext(1, frozenset({"last_data"}))
+    )
+    other_device = _add_listener(coordinator, WebastoListenerContext(2))
+    untracked = _add_listener(coordinator, None)
+    coordinator.async_update_listeners()
+    for listener in (temperature, voltage, section, other_device, untracked):
+        listener.reset_mock()
+
+    devices[1].last_data = {**devices[1].last_data, "temperature": "11C"}
+    coordinator.async_update_listeners()
+
+    temperature.assert_called_once()
+    section.assert_called_once()
+    untracked.assert_called_once()
+    voltage.assert_not_called()
+    other_device.assert_not_called()
+
+
+def test_update_success_change_updates_all_listeners(coordinator_factory) -> None:
+    """Availability changes must reach every listener even without data changes."""
+    coordinator = _build_coordinator(coordinator_factory, {1: _device()})
+    listener = _add_listener(
+        coordinator, WebastoListenerContext(1, frozenset({"last_data.temperature"}))
+    )
+    coordinator.async_update_listeners()
+    listener.reset_mock()
+
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+
+    listener.assert_called_once()
+
+
+def test_changed_data_keys_compares_sections_by_value() -> None:
+    """Replaced but equal sections are unchanged, lost sections report fields."""
+    last_data = {"temperature": "10C", "location": {"lat": 55.0}}
+    previous = {"last_data": last_data, "settings": None}
+
+    assert _changed_data_keys(previous, dict(previous)) == frozenset()
+    assert _changed_data_keys(
+        previous, {"last_data": {**last_data, "temperature": "11C"}, "settings": None}
+    ) == frozenset({"last_data", "last_data.temperature"})
+    assert _changed_data_keys(previous, {"last_data": None, "settings": None}) == (
+        frozenset({"last_data", "last_data.temperature", "last_data.location"})
+    )
@@ -0,0 +1,106 @@
+"""Tests for optimistic command state and reconciliation."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.webastoconnect.number import WebastoConnectNumber
+from custom_components.webastoconnect.switch import WebastoConnectSwitch
+
+
+async def _passthrough_device_call(device_id, func, *args):
+    """Execute device-scoped cloud calls directly."""
+    return await func(*args)
+
+
+def _build_switch(command_fn: AsyncMock) -> WebastoConnectSwitch:
+    """Create an AUX1 switch bound to a stub coordinator."""
+    device = SimpleNamespace(output_aux1=False, is_connected=True)
+    switch = object.__new__(WebastoConnectSwitch)
+    switch.entity_id = "switch.test_aux1"
+    switch.entity_description = SimpleNamespace(
+        key="aux1_output",
+        name_fn=None,
+        value_fn=lambda webasto: webasto.output_aux1,
+        command_fn=command_fn,
+    )
+    switch._cloud = SimpleNamespace(devices={1: device})
+    switch._device_id = 1
+    switch._attr_name = "AUX1"
+    switch.coordinator = SimpleNamespace(
+        async_update_listeners=Mock(),
+        async_request_confirmation_refresh=Mock(),
+        async_execute_device_call=AsyncMock(side_effect=_passthrough_device_call),
+    )
+    switch.async_write_ha_state = Mock()
+    return switch
+
+
+@pytest.mark.asyncio
+async def test_switch_shows_commanded_state_as_pending() -> None:
+    """The commanded state should be shown until the device confirms it."""
+    switch = _build_switch(AsyncMock())
+
+    await switch.async_turn_on()
+    switch._handle_coordinator_update()
+
+    assert switch.is_on is True
+    assert switch.extra_state_attributes == {"pending": True}
+    reconcile = switch.coordinator.async_request_confirmation_refresh.call_args.args[0]
+    assert reconcile == switch._async_reconcile_optimistic_value
+
+
+@pytest.mark.asyncio
+async def test_switch_rolls_back_when_device_reports_otherwise() -> None:
+    """Reconciliation should show the device state when the command did not stick."""
+    switch = _build_switch(AsyncMock())
+    switch.hass = Mock()
+
+    await switch.async_turn_on()
+    switch._async_reconcile_optimistic_value()
+
+    assert switch.is_on is False
+    assert switch.extra_state_attributes is None
+    switch.async_write_ha_state.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_switch_confirms_when_device_reports_commanded_state() -> None:
+    """Reconciliation should keep a state the device has confirmed."""
+
+    async def _turn_on(webasto, device, state) -> None:
+        device.output_aux1 = state
+
+    switch = _build_switch(AsyncMock(side_effect=_turn_on))
+    switch.hass = Mock()
+
+    await switch.async_turn_on()
+    switch._async_reconcile_optimistic_value()
+
+    assert switch.is_on is True
+    assert switch.extra_state_attributes is None
+
+
+@pytest.mark.asyncio
+async def test_failed_command_drops_optimistic_state() -> None:
+    """A failed command should not leave a pending optimistic value behind."""
+    switch = _build_switch(AsyncMock(side_effect=RuntimeError("boom")))
+
+    with pytest.raises(RuntimeError):
+        await switch.async_turn_on()
+
+    assert switch._optimistic_value is None
+    switch.coordinator.async_request_confirmation_refresh.assert_not_called()
+
+
+def test_number_native_value_prefers_optimistic_value() -> None:
+    """Numbers should report the commanded value while it is pending."""
+    number = object.__new__(WebastoConnectNumber)
+    number.entity_description = SimpleNamespace(value_fn=lambda webasto: 11.5)
+    number._cloud = SimpleNamespace(devices={1: object()})
+    number._device_id = 1
+
+    assert number.native_value == 11.5
+    number._optimistic_value = 12.0
+    assert number.native_value == 12.0
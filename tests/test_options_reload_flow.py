@@ -1,5 +1,6 @@
 """Tests for deterministic options reload behavior."""
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
@@ -37,6 +38,10 @@ async def test_async_setup_entry_registers_update_listener(monkeypatch) -> None:
         data={},
         config_entries=SimpleNamespace(async_forward_entry_setups=AsyncMock()),
         services=services,
+        loop=asyncio.get_running_loop(),
+        async_add_import_executor_job=AsyncMock(
+            side_effect=lambda func, *args: func(*args)
+        ),
     )
     remove_listener = Mock()
     entry = SimpleNamespace(entry_id="entry-1", add_update_listener=Mock())
@@ -70,10 +75,11 @@ async def test_async_unload_entry_calls_remove_listener_on_success() -> None:
         entry_id="entry-1",
         runtime_data=SimpleNamespace(
             update_listener=remove_listener,
-            coordinator=SimpleNamespace(cloud=SimpleNamespace(close=close_mock)),
+            coordinator=SimpleNamespace(async_close_cloud=close_mock),
         ),
     )
     hass = SimpleNamespace(
+        data={},
         config_entries=SimpleNamespace(
             async_unload_platforms=AsyncMock(return_value=True),
             async_entries=Mock(return_value=[]),
@@ -118,7 +124,8 @@ async def test_options_flow_creates_entry_after_successful_auth(monkeypatch) ->
     flow = object.__new__(WebastoConnectOptionsFlow)
     config_entry = SimpleNamespace(entry_id="entry-1", data={}, options={})
     flow.hass = SimpleNamespace(
-        config=SimpleNamespace(path=lambda *parts: "/".join(parts)),
+        config=SimpleNamespace(path=lambda *parts: "/".join(parts), config_dir="/tmp"),
+        data={},
         config_entries=SimpleNamespace(
             async_get_known_entry=Mock(return_value=config_entry)
         ),
@@ -171,7 +178,8 @@ async def test_options_flow_returns_error_on_invalid_auth(monkeypatch) -> None:
     flow = object.__new__(WebastoConnectOptionsFlow)
     config_entry = SimpleNamespace(entry_id="entry-1", data={}, options={})
     flow.hass = SimpleNamespace(
-        config=SimpleNamespace(path=lambda *parts: "/".join(parts)),
+        config=SimpleNamespace(path=lambda *parts: "/".join(parts), config_dir="/tmp"),
+        data={},
         config_entries=SimpleNamespace(
             async_get_known_entry=Mock(return_value=config_entry)
         ),
@@ -216,7 +224,8 @@ async def test_options_flow_returns_error_on_connection_validation_failure(
     flow = object.__new__(WebastoConnectOptionsFlow)
     config_entry = SimpleNamespace(entry_id="entry-1", data={}, options={})
     flow.hass = SimpleNamespace(
-        config=SimpleNamespace(path=lambda *parts: "/".join(parts)),
+        config=SimpleNamespace(path=lambda *parts: "/".join(parts), config_dir="/tmp"),
+        data={},
         config_entries=SimpleNamespace(
             async_get_known_entry=Mock(return_value=config_entry)
         ),
@@ -259,7 +268,8 @@ async def test_options_flow_returns_error_on_rate_limit(monkeypatch) -> None:
     flow = object.__new__(WebastoConnectOptionsFlow)
     config_entry = SimpleNamespace(entry_id="entry-1", data={}, options={})
     flow.hass = SimpleNamespace(
-        config=SimpleNamespace(path=lambda *parts: "/".join(parts)),
+        config=SimpleNamespace(path=lambda *parts: "/".join(parts), config_dir="/tmp"),
+        data={},
         config_entries=SimpleNamespace(
             async_get_known_entry=Mock(return_value=config_entry)
         ),
@@ -273,3 +283,34 @@ async def test_options_flow_returns_error_on_rate_limit(monkeypatch) -> None:
     close_mock.assert_awaited_once()
     assert flow.async_show_form.call_args.kwargs["errors"] == {"base": "ratelimit"}
     assert result == {"type": "form"}
+
+
+@pytest.mark.asyncio
+async def test_options_flow_shows_sensor_filter_defaults() -> None:
+    """The options form should offer the sensor filter with its defaults."""
+    flow = object.__new__(WebastoConnectOptionsFlow)
+    config_entry = SimpleNamespace(
+        entry_id="entry-1",
+        data={"email": "user@test"},
+        options={"voltage_deadband": 0.3},
+    )
+    flow.hass = SimpleNamespace(
+        config_entries=SimpleNamespace(
+            async_get_known_entry=Mock(return_value=config_entry)
+        ),
+    )
+    flow.handler = "entry-1"
+    flow.async_show_form = Mock(return_value={"type": "form"})
+
+    await flow.async_step_init()
+
+    schema = flow.async_show_form.call_args.kwargs["data_schema"].schema
+    defaults = {str(key): key.default() for key in schema if str(key) != "password"}
+    assert defaults == {
+        "email": "user@test",
+        "temperature_deadband": 1.0,
+        "voltage_deadband": 0.3,
+        "measurement_interval": 15,
+        "min_movement": 25.0,
+        "trail_length": 48,
+    }
@@ -0,0 +1,168 @@
+"""Tests for the shared cloud request budget."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from custom_components.webastoconnect.api import (
+    WebastoBudgetListenerContext,
+)
+from custom_components.webastoconnect.budget import (
+    RequestBudget,
+    async_get_request_budget,
+)
+from custom_components.webastoconnect.sensor import (
+    REQUEST_BUDGET_SENSORS,
+    WebastoRequestBudgetSensor,
+)
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _budget(clock: _Clock) -> RequestBudget:
+    """Create a small budget refilling one token every 10 seconds."""
+    return RequestBudget(
+        capacity=10,
+        refill_interval=timedelta(seconds=10),
+        command_reserve=4,
+        clock=clock,
+    )
+
+
+def test_polls_leave_command_reserve_untouched() -> None:
+    """Polls should be refused before they eat into the command reserve."""
+    budget = _budget(_Clock())
+
+    assert all(budget.consume("entry", 1, command=False) for _ in range(6))
+    assert budget.consume("entry", 1, command=False) is False
+    assert budget.consume("entry", 2, command=True) is True
+    assert budget.entry_requests == {"entry": 8}
+    assert budget.entry_throttled_polls == {"entry": 1}
+
+
+def test_commands_are_never_refused() -> None:
+    """User commands should go through even with an empty bucket."""
+    budget = _budget(_Clock())
+
+    assert all(budget.consume("entry", 2, command=True) for _ in range(10))
+    assert budget.tokens == -10
+
+
+def test_bucket_refills_over_time() -> None:
+    """Tokens should come back at the refill rate up to the capacity."""
+    clock = _Clock()
+    budget = _budget(clock)
+    budget.consume("entry", 6, command=True)
+
+    clock.now = 30
+    assert budget.tokens == 7
+
+    clock.now = 1000
+    assert budget.tokens == 10
+
+
+def test_poll_interval_floor_stretches_polling_before_exhaustion() -> None:
+    """Polling should slow down while the bucket drains, not after."""
+    budget = RequestBudget(
+        capacity=10,
+        refill_interval=timedelta(seconds=10),
+        command_reserve=2,
+        clock=_Clock(),
+    )
+
+    assert budget.poll_interval_floor() == timedelta(0)
+
+    budget.consume("a", 3, command=True)
+    budget.consume("b", 3, command=True)
+    assert budget.poll_interval_floor() == timedelta(seconds=20)
+
+    budget.consume("a", 4, command=True)
+    assert budget.poll_interval_floor() == timedelta(seconds=30)
+
+
+def test_budget_is_shared_per_account() -> None:
+    """Entries logging in with the same account should share one budget."""
+    hass = SimpleNamespace(data={})
+
+    first = async_get_request_budget(hass, "User@Example.com")
+    second = async_get_request_budget(hass, "user@example.com ")
+    other = async_get_request_budget(hass, "other@example.com")
+
+    assert first is second
+    assert first is not other
+
+
+def test_request_budget_sensor_writes_only_on_change() -> None:
+    """The budget sensor should follow the coordinator budget without redundant writes."""
+    budget = _budget(_Clock())
+    sensor = object.__new__(WebastoRequestBudgetSensor)
+    sensor.entity_description = REQUEST_BUDGET_SENSORS[1]
+    sensor.coordinator = SimpleNamespace(
+        request_budget=budget,
+        config_entry=SimpleNamespace(entry_id="entry"),
+    )
+    sensor._attr_native_value = 0
+    sensor.async_write_ha_state = Mock()
+
+    sensor._handle_coordinator_update()
+    sensor.async_write_ha_state.assert_not_called()
+
+    budget.consume("entry", 2, command=True)
+    sensor._handle_coordinator_update()
+
+    assert sensor.native_value == 2
+    sensor.async_write_ha_state.assert_called_once()
+
+
+def test_budget_listeners_are_notified_only_on_budget_changes(
+    coordinator_factory,
+) -> None:
+    """Budget sensors should not be woken by polls that leave the budget alone."""
+    clock = _Clock()
+    coordinator = coordinator_factory(entry_id="entry")
+    coordinator.request_budget = _budget(clock)
+    coordinator._last_notified_success = True
+    budget_listener = Mock()
+    coordinator._listeners = {1: (budget_listener, WebastoBudgetListenerContext())}
+
+    coordinator.async_update_listeners()
+    coordinator.async_update_listeners()
+    assert budget_listener.call_count == 1
+
+    coordinator.request_budget.consume("entry", 1, command=False)
+    coordinator.async_update_listeners()
+    assert budget_listener.call_count == 2
+
+
+def test_budget_sensors_belong_to_the_account_device() -> None:
+    """Every entry should get one set of budget sensors on its account device."""
+    coordinator = SimpleNamespace(
+        request_budget=_budget(_Clock()),
+        config_entry=SimpleNamespace(entry_id="entry"),
+    )
+
+    sensors = [
+        WebastoRequestBudgetSensor(description, coordinator)
+        for description in REQUEST_BUDGET_SENSORS
+    ]
+
+    assert [sensor.unique_id for sensor in sensors] == [
+        "entry_request_budget_remaining",
+        "entry_request_budget_requests",
+    ]
+    assert all(
+        sensor.device_info["identifiers"] == {("webastoconnect", "entry_account")}
+        for sensor in sensors
+    )
+    assert all(
+        isinstance(sensor.coordinator_context, WebastoBudgetListenerContext)
+        for sensor in sensors
+    )
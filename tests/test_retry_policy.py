@@ -0,0 +1,83 @@
+"""Tests for update failure classification and backoff."""
+
+import random
+
+import aiohttp
+import pytest
+from pywebasto.exceptions import (
+    ForbiddenException,
+    InvalidRequestException,
+    InvalidResponseException,
+    TooManyRequestsException,
+)
+
+from custom_components.webastoconnect.retry import (
+    BACKOFF_SECONDS,
+    FailureClass,
+    RetryPolicy,
+    classify_failure,
+)
+
+
+@pytest.mark.parametrize(
+    ("err", "failure_class"),
+    [
+        (TooManyRequestsException("slow down"), FailureClass.RATE_LIMITED),
+        (ForbiddenException("forbidden"), FailureClass.TEMPORARY),
+        (InvalidResponseException("garbage"), FailureClass.TEMPORARY),
+        (InvalidRequestException("bad"), FailureClass.REQUEST),
+        (TimeoutError(), FailureClass.NETWORK),
+        (aiohttp.ClientConnectionError(), FailureClass.NETWORK),
+        (RuntimeError("boom"), FailureClass.UNEXPECTED),
+    ],
+)
+def test_classify_failure(err: Exception, failure_class: FailureClass) -> None:
+    """Update exceptions should map to their failure class."""
+    assert classify_failure(err) is failure_class
+
+
+def test_backoff_grows_exponentially_up_to_cap() -> None:
+    """Consecutive failures should double the delay until the class cap."""
+    policy = RetryPolicy(random.Random(1))
+    base, cap = BACKOFF_SECONDS[FailureClass.NETWORK]
+
+    delays = [
+        policy.record_failure(FailureClass.NETWORK, TimeoutError()) for _ in range(8)
+    ]
+
+    for attempt, delay in enumerate(delays):
+        ceiling = min(cap, base * 2**attempt)
+        assert ceiling <= delay <= 2 * ceiling
+    assert delays[-1] <= 2 * cap
+
+
+def test_jitter_spreads_retries() -> None:
+    """Policies failing at the same moment should not retry in lockstep."""
+    delays = {
+        RetryPolicy(random.Random(seed)).record_failure(
+            FailureClass.RATE_LIMITED, TooManyRequestsException("slow down")
+        )
+        for seed in range(10)
+    }
+
+    assert len(delays) > 1
+
+
+def test_success_resets_backoff_and_keeps_statistics() -> None:
+    """Success should reset the backoff while failure statistics remain."""
+    policy = RetryPolicy(random.Random(1))
+    policy.record_failure(FailureClass.TEMPORARY, ForbiddenException("forbidden"))
+    policy.record_failure(FailureClass.TEMPORARY, ForbiddenException("forbidden"))
+
+    policy.record_success()
+    delay = policy.record_failure(FailureClass.NETWORK, TimeoutError())
+
+    base = BACKOFF_SECONDS[FailureClass.NETWORK][0]
+    assert base <= delay <= 2 * base
+    diagnostics = policy.as_dict()
+    assert diagnostics["consecutive_failures"] == 1
+    assert diagnostics["failures"]["temporary"]["count"] == 2
+    assert diagnostics["failures"]["temporary"]["last_error"] == (
+        "ForbiddenException: forbidden"
+    )
+    assert diagnostics["failures"]["network"]["count"] == 1
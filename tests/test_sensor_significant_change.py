@@ -0,0 +1,207 @@
+"""Tests for the deadband and minimum interval of measurement sensors."""
+
+from dataclasses import replace
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.webastoconnect import sensor
+from custom_components.webastoconnect.base import WebastoConnectSensorEntityDescription
+from custom_components.webastoconnect.const import (
+    CONF_MEASUREMENT_INTERVAL,
+    CONF_VOLTAGE_DEADBAND,
+)
+from custom_components.webastoconnect.sensor import SENSORS, WebastoConnectSensor
+
+
+def _sensor(value: float, written: float, monotonic: float, monkeypatch):
+    """Return a voltage sensor showing a value written at a given time."""
+    monkeypatch.setattr(sensor.time, "monotonic", lambda: monotonic)
+    entity = object.__new__(WebastoConnectSensor)
+    entity._device_id = 1
+    entity._cloud = SimpleNamespace(devices={1: SimpleNamespace(value=value)})
+    entity.coordinator = SimpleNamespace(async_request_refresh=AsyncMock())
+    entity.entity_description = WebastoConnectSensorEntityDescription(
+        key="battery_voltage",
+        name="Battery",
+        value_fn=lambda dev: dev.value,
+        deadband=0.2,
+        min_interval=timedelta(minutes=15),
+    )
+    entity._attr_name = "Battery"
+    entity._attr_native_value = 12.4
+    entity._value_written_at = written
+    entity.async_write_ha_state = Mock()
+    return entity
+
+
+def test_measurement_sensors_are_filtered() -> None:
+    """Temperature and voltage should declare a deadband and interval."""
+    filtered = {
+        description.key
+        for description in SENSORS
+        if description.deadband is not None and description.min_interval is not None
+    }
+
+    assert filtered == {"temperature", "battery_voltage"}
+
+
+def test_jitter_inside_deadband_is_held_back(monkeypatch) -> None:
+    """Small changes within the minimum interval should not write state."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_not_called()
+    assert entity._attr_native_value == 12.4
+    assert entity._value_written_at == 1000.0
+
+
+def test_change_beyond_deadband_is_written(monkeypatch) -> None:
+    """Changes of at least the deadband should write at once."""
+    entity = _sensor(12.1, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._attr_native_value == 12.1
+    assert entity._value_written_at == 1060.0
+
+
+def test_small_change_is_written_after_min_interval(monkeypatch) -> None:
+    """Held back changes should be written once the interval has passed."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1900.0, monkeypatch=monkeypatch)
+
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._attr_native_value == 12.3
+
+
+def test_held_back_value_is_written_when_interval_ends(monkeypatch) -> None:
+    """A held back value should be written once the interval has passed."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+    entity.hass = Mock()
+
+    with patch.object(sensor, "async_call_later") as call_later:
+        entity._handle_coordinator_update()
+        entity._handle_coordinator_update()
+
+    call_later.assert_called_once()
+    _, delay, action = call_later.call_args.args
+    assert delay == 840.0
+    entity.async_write_ha_state.assert_not_called()
+
+    monkeypatch.setattr(sensor.time, "monotonic", lambda: 1900.0)
+    action(None)
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._attr_native_value == 12.3
+    assert entity._unsub_held_back_write is None
+
+
+def test_significant_change_cancels_held_back_write(monkeypatch) -> None:
+    """Writing a new value should drop the pending write of a held back one."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+    entity.hass = Mock()
+
+    with patch.object(sensor, "async_call_later") as call_later:
+        entity._handle_coordinator_update()
+        entity._cloud.devices[1].value = 12.1
+        entity._handle_coordinator_update()
+
+    call_later.return_value.assert_called_once()
+    assert entity._unsub_held_back_write is None
+    assert entity._attr_native_value == 12.1
+
+
+@pytest.mark.asyncio
+async def test_removal_cancels_held_back_write(monkeypatch) -> None:
+    """Removing the entity should cancel the pending write."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+    entity.hass = Mock()
+
+    with patch.object(sensor, "async_call_later") as call_later:
+        entity._handle_coordinator_update()
+    await entity.async_will_remove_from_hass()
+
+    call_later.return_value.assert_called_once()
+    assert entity._unsub_held_back_write is None
+
+
+def test_unavailable_value_is_written(monkeypatch) -> None:
+    """A value going missing should bypass the filter."""
+    entity = _sensor(None, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._attr_native_value is None
+
+
+@pytest.mark.asyncio
+async def test_update_entity_shows_latest_value(monkeypatch) -> None:
+    """An update request should expose the value held back by the filter."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+
+    await entity.async_update()
+
+    entity.coordinator.async_request_refresh.assert_awaited_once()
+    assert entity._attr_native_value == 12.3
+    assert entity._value_written_at == 1060.0
+
+
+def test_crossing_low_voltage_cutoff_is_written(monkeypatch) -> None:
+    """Small changes crossing the low voltage cutoff should write at once."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+    entity._cloud.devices[1].low_voltage_cutoff = 12.35
+    entity.entity_description = replace(
+        entity.entity_description,
+        threshold_fn=lambda dev: dev.low_voltage_cutoff,
+    )
+
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._attr_native_value == 12.3
+
+
+def test_small_change_beside_cutoff_is_held_back(monkeypatch) -> None:
+    """The cutoff should only bypass the filter when it is crossed."""
+    entity = _sensor(12.3, written=1000.0, monotonic=1060.0, monkeypatch=monkeypatch)
+    entity._cloud.devices[1].low_voltage_cutoff = 11.5
+    entity.entity_description = replace(
+        entity.entity_description,
+        threshold_fn=lambda dev: dev.low_voltage_cutoff,
+    )
+
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_not_called()
+
+
+def test_filter_options_override_descriptions() -> None:
+    """Entry options should replace the default deadband and interval."""
+    options = {
+        CONF_VOLTAGE_DEADBAND: 0.5,
+        CONF_MEASUREMENT_INTERVAL: 5,
+    }
+
+    descriptions = {
+        description.key: sensor._configured_description(description, options)
+        for description in SENSORS
+    }
+
+    assert descriptions["battery_voltage"].deadband == 0.5
+    assert descriptions["battery_voltage"].min_interval == timedelta(minutes=5)
+    assert descriptions["temperature"].deadband == 1.0
+    assert descriptions["temperature"].min_interval == timedelta(minutes=5)
+    assert descriptions["subscription_expiration"].min_interval is None
+
+
+def test_filter_defaults_without_options() -> None:
+    """Without options the descriptions should keep their defaults."""
+    for description in SENSORS:
+        assert sensor._configured_description(description, {}) is description
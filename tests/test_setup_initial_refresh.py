@@ -1,5 +1,6 @@
 """Tests for setup bootstrap refresh behavior."""
 
+import asyncio
 from types import SimpleNamespace
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
@@ -17,6 +18,9 @@ from pywebasto.exceptions import (
 )
 
 import custom_components.webastoconnect as integration
+from custom_components.webastoconnect.session import (
+    DATA_CLOUD_SESSIONS,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -32,19 +36,43 @@ def _mock_hass_for_setup() -> SimpleNamespace:
     """Build a minimal hass mock compatible with integration._async_setup."""
 
     async def async_add_executor_job(func, *args):
-        if getattr(func, "__name__", "") == "ensure_card_installed":
-            return (False, None, None)
+        if getattr(func, "__name__", "") == "read_card_info":
+            return (None, None)
         return func(*args)
 
     return SimpleNamespace(
         async_add_executor_job=async_add_executor_job,
+        async_add_import_executor_job=async_add_executor_job,
+        loop=asyncio.get_running_loop(),
         config=SimpleNamespace(
-            path=lambda *parts, **_kwargs: str(Path("/tmp", *parts))
+            path=lambda *parts, **_kwargs: str(Path("/tmp", *parts)),
+            config_dir="/tmp",
         ),
         data={},
     )
 
 
+def _coordinator_stub(cloud: SimpleNamespace, **kwargs) -> SimpleNamespace:
+    """Build a coordinator stub whose session calls go to the fake cloud."""
+
+    async def async_connect_cloud() -> None:
+        await cloud.connect()
+
+    async def async_close_cloud() -> None:
+        await cloud.close()
+
+    kwargs.setdefault(
+        "snapshot_store", SimpleNamespace(async_restore=AsyncMock(return_value=None))
+    )
+    return SimpleNamespace(
+        cloud=cloud,
+        cloud_session=SimpleNamespace(connected=False),
+        async_connect_cloud=async_connect_cloud,
+        async_close_cloud=async_close_cloud,
+        **kwargs,
+    )
+
+
 @pytest.mark.asyncio
 async def test_setup_skips_first_refresh_when_connect_hydrates_devices(
     monkeypatch,
@@ -54,7 +82,7 @@ async def test_setup_skips_first_refresh_when_connect_hydrates_devices(
     device = SimpleNamespace(name="Heater", device_id=1)
 
     def coordinator_factory(*_args, **_kwargs):
-        coordinator = SimpleNamespace(
+        coordinator = _coordinator_stub(
             cloud=SimpleNamespace(connect=AsyncMock(), devices={1: device}),
             async_config_entry_first_refresh=AsyncMock(),
             async_set_updated_data=Mock(),
@@ -99,7 +127,7 @@ async def test_setup_runs_first_refresh_when_connect_has_no_devices(
     created: list[SimpleNamespace] = []
 
     def coordinator_factory(*_args, **_kwargs):
-        coordinator = SimpleNamespace(
+        coordinator = _coordinator_stub(
             cloud=SimpleNamespace(connect=AsyncMock(), devices={}),
             async_config_entry_first_refresh=AsyncMock(),
             async_set_updated_data=Mock(),
@@ -134,7 +162,7 @@ async def test_setup_closes_client_when_connect_auth_fails(monkeypatch) -> None:
     created: list[SimpleNamespace] = []
 
     def coordinator_factory(*_args, **_kwargs):
-        coordinator = SimpleNamespace(
+        coordinator = _coordinator_stub(
             cloud=SimpleNamespace(
                 connect=AsyncMock(side_effect=UnauthorizedException("bad auth")),
                 close=AsyncMock(),
@@ -170,7 +198,7 @@ async def test_setup_closes_client_when_connect_temporarily_fails(monkeypatch) -
     created: list[SimpleNamespace] = []
 
     def coordinator_factory(*_args, **_kwargs):
-        coordinator = SimpleNamespace(
+        coordinator = _coordinator_stub(
             cloud=SimpleNamespace(
                 connect=AsyncMock(side_effect=InvalidRequestException("retry later")),
                 close=AsyncMock(),
@@ -206,7 +234,7 @@ async def test_setup_closes_client_when_connect_is_rate_limited(monkeypatch) ->
     created: list[SimpleNamespace] = []
 
     def coordinator_factory(*_args, **_kwargs):
-        coordinator = SimpleNamespace(
+        coordinator = _coordinator_stub(
             cloud=SimpleNamespace(
                 connect=AsyncMock(side_effect=TooManyRequestsException("too many")),
                 close=AsyncMock(),
@@ -246,7 +274,7 @@ async def test_setup_stops_when_device_is_pending_approval(monkeypatch) -> None:
     device = SimpleNamespace(name="Heater", device_id=1, pending_approval=True)
 
     def coordinator_factory(*_args, **_kwargs):
-        coordinator = SimpleNamespace(
+        coordinator = _coordinator_stub(
             cloud=SimpleNamespace(
                 connect=AsyncMock(),
                 close=AsyncMock(),
@@ -304,3 +332,155 @@ def test_device_names_from_webapi_data() -> None:
         "123": "Car",
         "456": "Van",
     }
+
+
+def _background_entry(tasks: list) -> SimpleNamespace:
+    """Build a config entry stub collecting background tasks and unload callbacks."""
+
+    def async_create_background_task(_hass, target, _name):
+        tasks.append(target)
+
+    return SimpleNamespace(
+        entry_id="entry-1",
+        data={CONF_EMAIL: "a@b.c"},
+        options={},
+        async_create_background_task=async_create_background_task,
+        async_on_unload=Mock(),
+        async_start_reauth=Mock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_setup_with_snapshot_connects_in_background(monkeypatch) -> None:
+    """A stored snapshot should let setup finish before the cloud login."""
+    device = SimpleNamespace(name="Heater", device_id=1)
+    coordinator = _coordinator_stub(
+        cloud=SimpleNamespace(connect=AsyncMock(), devices={1: device}),
+        snapshot_store=SimpleNamespace(
+            async_restore=AsyncMock(return_value={"1": "Car"})
+        ),
+        async_config_entry_first_refresh=AsyncMock(),
+        async_set_updated_data=Mock(),
+        retry_policy=SimpleNamespace(record_success=Mock()),
+    )
+    monkeypatch.setattr(
+        integration, "WebastoConnectUpdateCoordinator", lambda *_a, **_k: coordinator
+    )
+    monkeypatch.setattr(
+        integration,
+        "async_get_integration",
+        AsyncMock(return_value=SimpleNamespace(version="test", file_path="/tmp")),
+    )
+    monkeypatch.setattr(integration, "_async_migrate_unique_ids", AsyncMock())
+    monkeypatch.setattr(integration, "_async_update_device_registry_name", AsyncMock())
+    tasks: list = []
+    entry = _background_entry(tasks)
+
+    result = await integration._async_setup(_mock_hass_for_setup(), entry)
+
+    assert result is coordinator
+    assert coordinator.device_names == {"1": "Car"}
+    coordinator.cloud.connect.assert_not_awaited()
+    coordinator.async_set_updated_data.assert_not_called()
+
+    await tasks[0]
+
+    coordinator.cloud.connect.assert_awaited_once()
+    coordinator.async_set_updated_data.assert_called_once_with(None)
+    coordinator.retry_policy.record_success.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_background_connect_failure_schedules_retry(monkeypatch) -> None:
+    """Failed background logins should mark entities unavailable and retry."""
+    coordinator = _coordinator_stub(
+        cloud=SimpleNamespace(
+            connect=AsyncMock(side_effect=TooManyRequestsException("too many")),
+            close=AsyncMock(),
+            devices={},
+        ),
+        async_set_update_error=Mock(),
+        retry_policy=SimpleNamespace(record_failure=Mock(return_value=300.0)),
+    )
+    cancel_first, cancel_second = Mock(), Mock()
+    call_later = Mock(side_effect=[cancel_first, cancel_second])
+    monkeypatch.setattr(integration, "async_call_later", call_later)
+    tasks: list = []
+    entry = _background_entry(tasks)
+    hass = _mock_hass_for_setup()
+
+    integration._async_connect_in_background(hass, entry, coordinator)
+    await tasks[0]
+
+    coordinator.async_set_update_error.assert_called_once()
+    assert coordinator.retry_policy.record_failure.call_args.args[0] == "rate_limited"
+    assert call_later.call_args.args[:2] == (hass, 300.0)
+    entry.async_start_reauth.assert_not_called()
+
+    call_later.call_args.args[2](None)
+    await tasks[1]
+    entry.async_on_unload.assert_called_once()
+    entry.async_on_unload.call_args.args[0]()
+
+    cancel_first.assert_not_called()
+    cancel_second.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_background_connect_auth_failure_starts_reauth() -> None:
+    """Rejected credentials found in the background should start reauth."""
+    coordinator = _coordinator_stub(
+        cloud=SimpleNamespace(
+            connect=AsyncMock(side_effect=UnauthorizedException("bad auth")),
+            close=AsyncMock(),
+            devices={},
+        ),
+        async_set_update_error=Mock(),
+    )
+    tasks: list = []
+    entry = _background_entry(tasks)
+    hass = _mock_hass_for_setup()
+
+    integration._async_connect_in_background(hass, entry, coordinator)
+    await tasks[0]
+
+    coordinator.async_set_update_error.assert_called_once()
+    entry.async_start_reauth.assert_called_once_with(hass)
+
+
+@pytest.mark.asyncio
+async def test_background_connect_retry_reopens_closed_session(
+    monkeypatch, coordinator_factory
+) -> None:
+    """A retry after a failed login should reconnect through a registered session."""
+    hass = _mock_hass_for_setup()
+    cloud = SimpleNamespace(
+        connect=AsyncMock(side_effect=[TooManyRequestsException("too many"), None]),
+        close=AsyncMock(),
+        devices={},
+    )
+    coordinator = coordinator_factory(cloud, hass=hass, username="a@b.c")
+    session = coordinator.cloud_session
+    coordinator.update_interval = None
+    coordinator.async_set_update_error = Mock()
+    coordinator.async_refresh = AsyncMock()
+    call_later = Mock(return_value="unsub")
+    monkeypatch.setattr(integration, "async_call_later", call_later)
+    tasks: list = []
+    entry = _background_entry(tasks)
+
+    integration._async_connect_in_background(hass, entry, coordinator)
+    await tasks[0]
+
+    assert hass.data[DATA_CLOUD_SESSIONS] == {}
+    assert session.coordinators == []
+
+    retry = call_later.call_args.args[2]
+    retry(None)
+    await tasks[1]
+
+    assert cloud.connect.await_count == 2
+    assert hass.data[DATA_CLOUD_SESSIONS] == {"a@b.c": session}
+    assert session.coordinators == [coordinator]
+    assert session.connected is True
+    coordinator.async_refresh.assert_awaited_once()
@@ -0,0 +1,76 @@
+"""Tests for the per-device timer cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.webastoconnect import timers
+from custom_components.webastoconnect.timers import TimerCache
+
+
+def _payload(start: int) -> dict:
+    return {
+        "outputs": [
+            {
+                "line": "OUTH",
+                "timers": [
+                    {"type": "simple", "start": start, "duration": 600, "repeat": 0}
+                ],
+            }
+        ]
+    }
+
+
+def test_cache_serves_fresh_payloads_only() -> None:
+    """Timers should expire with the payload they were read from."""
+    cache = TimerCache(max_age=30)
+    with patch.object(timers.time, "monotonic", return_value=100.0):
+        cache.feed("dev1", _payload(600))
+
+    with patch.object(timers.time, "monotonic", return_value=120.0):
+        assert [timer["start"] for timer in cache.get("dev1", "OUTH")] == [600]
+        assert cache.get("dev1", "OUTV") == []
+        assert cache.get("dev2", "OUTH") is None
+
+    with patch.object(timers.time, "monotonic", return_value=131.0):
+        assert cache.get("dev1", "OUTH") is None
+
+
+def test_known_payload_keeps_its_age_and_invalidation() -> None:
+    """Feeding the same payload again should not make it look fresh."""
+    cache = TimerCache()
+    payload = _payload(600)
+    cache.feed("dev1", payload)
+    cache.invalidate("dev1", "OUTH")
+
+    cache.feed("dev1", payload)
+    assert cache.get("dev1", "OUTH") is None
+    assert cache.get("dev1", "OUTV") == []
+
+    cache.feed("dev1", _payload(700))
+    assert [timer["start"] for timer in cache.get("dev1", "OUTH")] == [700]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readers_share_one_fetch() -> None:
+    """Readers of a stale line should wait for the same fetch."""
+    cache = TimerCache()
+    release = asyncio.Event()
+
+    async def _fetch() -> list[dict]:
+        await release.wait()
+        return [{"type": "simple", "start": 600, "duration": 600, "repeat": 0}]
+
+    fetch = AsyncMock(side_effect=_fetch)
+    readers = [
+        asyncio.create_task(cache.async_get("dev1", "OUTH", fetch)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*readers)
+
+    fetch.assert_awaited_once()
+    assert all(result[0]["start"] == 600 for result in results)
+    results[0][0]["start"] = 1
+    assert results[1][0]["start"] == 600
@@ -2,8 +2,13 @@
 
 from datetime import UTC, datetime
 from types import SimpleNamespace
+from unittest.mock import patch
 
-from custom_components.webastoconnect.sensor import _next_timer_sensor_payload
+from custom_components.webastoconnect.sensor import (
+    WebastoConnectSensor,
+    _next_timer_sensor_payload,
+    _NextTimerPayloadCache,
+)
 
 
 def test_next_timer_sensor_payload_selects_soonest_enabled_timer() -> None:
@@ -136,3 +141,68 @@ def test_next_timer_sensor_payload_includes_ventilation_line() -> None:
         "Heater",
         "Ventilation",
     }
+
+
+def _single_timer_device(start: int) -> SimpleNamespace:
+    """Create a device with one daily heater timer."""
+    return SimpleNamespace(
+        last_data={
+            "outputs": [
+                {
+                    "line": "OUTH",
+                    "timers": [
+                        {
+                            "type": "simple",
+                            "start": start,
+                            "duration": 1800,
+                            "repeat": 0,
+                            "enabled": True,
+                        }
+                    ],
+                }
+            ],
+            "disabled_outputs": [],
+        }
+    )
+
+
+def test_next_timer_cache_reuses_payload_until_timers_change() -> None:
+    """Unchanged timers should not be re-derived on every poll."""
+    cache = _NextTimerPayloadCache()
+    webasto = _single_timer_device(600)
+    now = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+
+    with patch(
+        "custom_components.webastoconnect.sensor._next_timer_sensor_payload",
+        wraps=_next_timer_sensor_payload,
+    ) as compute:
+        first = cache.payload(webasto, now_utc=now)
+        second = cache.payload(webasto, now_utc=now.replace(minute=30))
+        assert second is first
+        assert compute.call_count == 1
+
+        webasto.last_data = _single_timer_device(660).last_data
+        state, _ = cache.payload(webasto, now_utc=now.replace(minute=30))
+
+    assert compute.call_count == 2
+    assert state == datetime(2026, 3, 2, 11, 0, tzinfo=UTC)
+
+
+def test_next_timer_cache_recomputes_after_next_run_passed() -> None:
+    """The cached next run should roll over once it is reached."""
+    cache = _NextTimerPayloadCache()
+    webasto = _single_timer_device(600)
+
+    state, _ = cache.payload(webasto, now_utc=datetime(2026, 3, 2, 9, 0, tzinfo=UTC))
+    assert state == datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+
+    state, _ = cache.payload(webasto, now_utc=datetime(2026, 3, 2, 10, 0, tzinfo=UTC))
+    assert state == datetime(2026, 3, 3, 10, 0, tzinfo=UTC)
+
+
+def test_timer_list_is_not_recorded() -> None:
+    """The bulky timer attributes should stay out of the recorder."""
+    unrecorded = WebastoConnectSensor._Entity__combined_unrecorded_attributes
+
+    assert {"timers", "next_timer"} <= unrecorded
+    assert "next_timer_index" not in unrecorded
@@ -4,16 +4,21 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+import voluptuous as vol
 from homeassistant.exceptions import HomeAssistantError
 
+from custom_components.webastoconnect import services
 from custom_components.webastoconnect.services import (
+    _APPLY_TIMERS_SCHEMA,
     LINE_VENTILATION,
     SimpleTimer,
     _coerce_timer,
+    async_apply_timers,
     async_create_timer,
     async_delete_timer,
     async_update_timer,
 )
+from custom_components.webastoconnect.timers import TimerCache
 
 
 class _CoordinatorStub:
@@ -21,14 +26,19 @@ class _CoordinatorStub:
 
     def __init__(self, timers: list[SimpleTimer]) -> None:
         self.cloud = SimpleNamespace(
+            devices={},
             get_timers=AsyncMock(return_value=list(timers)),
             save_timers=AsyncMock(),
         )
+        self.timer_cache = TimerCache()
         self.async_update_listeners = Mock()
+        self.async_mark_device_edited = Mock()
         self.execute_calls = 0
+        self.execute_device_ids: list[str] = []
 
-    async def async_execute_cloud_call(self, cloud_call, *args, **kwargs):
+    async def async_execute_device_call(self, device_id, cloud_call, *args, **kwargs):
         self.execute_calls += 1
+        self.execute_device_ids.append(device_id)
         return await cloud_call(*args, **kwargs)
 
 
@@ -55,6 +65,7 @@ async def test_async_create_timer_appends_and_saves_full_list() -> None:
     assert len(saved) == 2
     assert saved[1].start == 700
     assert coordinator.execute_calls == 1
+    assert coordinator.execute_device_ids == ["dev1"]
     coordinator.async_update_listeners.assert_called_once()
 
 
@@ -379,3 +390,267 @@ def test_coerce_timer_allows_empty_repeat_days_for_one_time_timer() -> None:
     )
 
     assert timer.repeat == 0
+
+
+def _payload(heater: list[dict], ventilation: list[dict]) -> dict:
+    """Build an app payload with simple timers on both lines."""
+    return {
+        "outputs": [{"line": "OUTH", "timers": heater}],
+        "disabled_outputs": [{"line": "OUTV", "timers": ventilation}],
+    }
+
+
+def _api_timer(start: int) -> dict:
+    return {"type": "simple", "start": start, "duration": 1800, "repeat": 1, "enabled": True}
+
+
+@pytest.mark.asyncio
+async def test_async_create_timer_uses_fresh_coordinator_payload() -> None:
+    """A fresh poll payload should replace the get_timers round-trip."""
+    coordinator = _CoordinatorStub([])
+    device = SimpleNamespace(
+        device_id="dev1", is_ventilation=False, last_data=_payload([_api_timer(600)], [])
+    )
+    coordinator.cloud.devices = {"dev1": device}
+    coordinator.timer_cache.feed_devices(coordinator.cloud.devices)
+
+    await async_create_timer(
+        coordinator, device, SimpleTimer(start=700, duration=1200, repeat=1)
+    )
+
+    coordinator.cloud.get_timers.assert_not_awaited()
+    saved = coordinator.cloud.save_timers.await_args.kwargs["timers"]
+    assert [timer.start for timer in saved] == [600, 700]
+
+
+@pytest.mark.asyncio
+async def test_async_update_timer_without_line_fetches_once() -> None:
+    """One fetch refreshes both lines, ventilation should not need another."""
+    coordinator = _CoordinatorStub([])
+    device = SimpleNamespace(device_id="dev1", last_data=None)
+    coordinator.cloud.devices = {"dev1": device}
+
+    async def get_timers(device, line):
+        device.last_data = _payload([_api_timer(600)], [_api_timer(900)])
+        return [SimpleTimer(start=600, duration=1800, repeat=1)]
+
+    coordinator.cloud.get_timers = AsyncMock(side_effect=get_timers)
+
+    await async_update_timer(
+        coordinator, device, timer_index=1, timer_data={"enabled": False}
+    )
+
+    coordinator.cloud.get_timers.assert_awaited_once()
+    assert _line_value(coordinator.cloud.save_timers.await_args.kwargs["line"]) == "OUTV"
+    saved = coordinator.cloud.save_timers.await_args.kwargs["timers"]
+    assert [(timer.start, timer.enabled) for timer in saved] == [(900, False)]
+
+
+@pytest.mark.asyncio
+async def test_saved_line_is_fetched_again_until_a_new_payload_arrives() -> None:
+    """Saving should invalidate exactly the saved line."""
+    coordinator = _CoordinatorStub([SimpleTimer(start=600, duration=1800, repeat=1)])
+    device = SimpleNamespace(
+        device_id="dev1",
+        is_ventilation=False,
+        last_data=_payload([_api_timer(600)], [_api_timer(900)]),
+    )
+    coordinator.cloud.devices = {"dev1": device}
+    coordinator.timer_cache.feed_devices(coordinator.cloud.devices)
+
+    await async_delete_timer(coordinator, device, timer_index=0)
+    await async_update_timer(
+        coordinator,
+        device,
+        timer_index=0,
+        timer_data={"enabled": False},
+        line=LINE_VENTILATION,
+    )
+    coordinator.cloud.get_timers.assert_not_awaited()
+
+    await async_delete_timer(coordinator, device, timer_index=0)
+    coordinator.cloud.get_timers.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_apply_timers_saves_each_line_once() -> None:
+    """Ordered operations should be applied in memory and saved per line."""
+    coordinator = _CoordinatorStub([])
+    coordinator.cloud.get_timers = AsyncMock(
+        side_effect=[
+            [
+                SimpleTimer(start=600, duration=1800, repeat=1),
+                SimpleTimer(start=900, duration=1800, repeat=2),
+            ],
+            [SimpleTimer(start=300, duration=600, repeat=0)],
+        ]
+    )
+    device = SimpleNamespace(device_id="dev1", is_ventilation=False)
+
+    await async_apply_timers(
+        coordinator,
+        device,
+        operations=[
+            {"operation": "delete", "timer_index": 0},
+            {"operation": "update", "timer_index": 0, "duration_minutes": 60},
+            {"operation": "create", "start": 1000, "duration": 600, "repeat": 4},
+            {"operation": "delete", "timer_index": 0, "line": "ventilation"},
+        ],
+    )
+
+    assert coordinator.execute_calls == 1
+    assert coordinator.cloud.save_timers.await_count == 2
+    saved = {
+        _line_value(call.kwargs["line"]): call.kwargs["timers"]
+        for call in coordinator.cloud.save_timers.await_args_list
+    }
+    assert [(timer.start, timer.duration) for timer in saved["OUTH"]] == [
+        (900, 3600),
+        (1000, 600),
+    ]
+    assert saved["OUTV"] == []
+    coordinator.async_update_listeners.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_apply_timers_skips_unchanged_desired_list() -> None:
+    """A desired list equal to the current timers should not be written."""
+    coordinator = _CoordinatorStub(
+        [SimpleTimer(start=600, duration=1800, repeat=1, enabled=True)]
+    )
+    device = SimpleNamespace(device_id="dev1", is_ventilation=False)
+
+    await async_apply_timers(
+        coordinator,
+        device,
+        timers=[{"start": 600, "duration": 1800, "repeat": 1, "enabled": True}],
+    )
+
+    coordinator.cloud.get_timers.assert_awaited_once()
+    coordinator.cloud.save_timers.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_async_apply_timers_validates_before_saving() -> None:
+    """An invalid later operation should leave every line untouched."""
+    coordinator = _CoordinatorStub([SimpleTimer(start=600, duration=1800, repeat=1)])
+    device = SimpleNamespace(device_id="dev1", is_ventilation=False)
+
+    with pytest.raises(HomeAssistantError, match="delete operation 1"):
+        await async_apply_timers(
+            coordinator,
+            device,
+            operations=[
+                {"operation": "create", "start": 1000, "duration": 600, "repeat": 4},
+                {"operation": "delete", "timer_index": 5, "line": "ventilation"},
+            ],
+        )
+
+    coordinator.cloud.save_timers.assert_not_awaited()
+
+
+def test_apply_timers_schema_requires_operations_or_timers() -> None:
+    """The schema should take either operations or a desired list."""
+    with pytest.raises(vol.Invalid):
+        _APPLY_TIMERS_SCHEMA({"device_id": "dev1"})
+    with pytest.raises(vol.Invalid):
+        _APPLY_TIMERS_SCHEMA({"device_id": "dev1", "operations": [], "timers": []})
+    with pytest.raises(vol.Invalid):
+        _APPLY_TIMERS_SCHEMA(
+            {"device_id": "dev1", "operations": [{"operation": "move"}]}
+        )
+
+    data = _APPLY_TIMERS_SCHEMA(
+        {
+            "device_id": "dev1",
+            "operations": [
+                {"operation": "create", "start_time": "06:30", "duration_minutes": 30},
+                {"operation": "delete", "timer_index": "1"},
+            ],
+        }
+    )
+    assert data["operations"][0]["repeat_days"] == []
+    assert data["operations"][1]["timer_index"] == 1
+
+
+def _payload_device(timers: list[dict]) -> SimpleNamespace:
+    """Return a device whose payload holds heater timers."""
+    return SimpleNamespace(
+        device_id="dev1",
+        is_ventilation=False,
+        last_data={
+            "outputs": [
+                {
+                    "line": "OUTH",
+                    "timers": [{"type": "simple", **timer} for timer in timers]
+                    + [{"type": "smart", "start": 0}],
+                }
+            ],
+            "disabled_outputs": [],
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_updates_stale_device_payload_in_place() -> None:
+    """A payload still holding the old list should get the saved timers."""
+    device = _payload_device([{"start": 600, "duration": 1800, "repeat": 1}])
+    coordinator = _CoordinatorStub([SimpleTimer(start=600, duration=1800, repeat=1)])
+    coordinator.cloud.devices = {"dev1": device}
+
+    await async_delete_timer(coordinator, device, 0)
+
+    assert device.last_data["outputs"][0]["timers"] == [{"type": "smart", "start": 0}]
+    coordinator.async_mark_device_edited.assert_called_once_with("dev1")
+
+
+@pytest.mark.asyncio
+async def test_handler_returns_timers_with_next_runs(monkeypatch) -> None:
+    """Services should answer with the persisted timers when asked for."""
+    device = _payload_device([{"start": 600, "duration": 1800, "repeat": 127}])
+    coordinator = _CoordinatorStub([SimpleTimer(start=600, duration=1800, repeat=127)])
+    coordinator.cloud.devices = {"dev1": device}
+    monkeypatch.setattr(
+        services,
+        "_coordinator_and_device",
+        lambda hass, device_id: (coordinator, device),
+    )
+    new_timer = {"start": 420, "duration": 1200, "repeat": 0, "enabled": True}
+
+    response = await services._async_handle_create_timer(
+        SimpleNamespace(),
+        SimpleNamespace(data={"device_id": "dev1", **new_timer}, return_response=True),
+    )
+
+    assert [timer["start"] for timer in response["timers"]] == [600, 420]
+    assert response["timers"][1]["next_run_utc"] is not None
+    assert response["next_timer"] is not None
+    assert (
+        await services._async_handle_delete_timer(
+            SimpleNamespace(),
+            SimpleNamespace(
+                data={"device_id": "dev1", "timer_index": 0}, return_response=False
+            ),
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_timers_returns_timer_list(monkeypatch) -> None:
+    """get_timers should serve the timer list from the device payload."""
+    device = _payload_device([{"start": 600, "duration": 1800, "repeat": 127, "enabled": True}])
+    coordinator = _CoordinatorStub([])
+    monkeypatch.setattr(
+        services,
+        "_coordinator_and_device",
+        lambda hass, device_id: (coordinator, device),
+    )
+
+    response = await services._async_handle_get_timers(
+        SimpleNamespace(), SimpleNamespace(data={"device_id": "dev1"})
+    )
+
+    assert [timer["start"] for timer in response["timers"]] == [600]
+    assert response["next_timer_index"] == 0
+    coordinator.cloud.get_timers.assert_not_awaited()
@@ -14,6 +14,11 @@ async def _passthrough_cloud_call(func, *args):
     return await func(*args)
 
 
+async def _passthrough_device_call(device_id, func, *args):
+    """Execute device-scoped cloud calls directly for write-path unit tests."""
+    return await func(*args)
+
+
 @pytest.mark.asyncio
 async def test_switch_turn_on_updates_listeners_without_refresh() -> None:
     """Switch turn_on should notify listeners and skip extra refresh."""
@@ -21,7 +26,8 @@ async def test_switch_turn_on_updates_listeners_without_refresh() -> None:
     coordinator = SimpleNamespace(
         async_update_listeners=Mock(),
         async_refresh=AsyncMock(),
-        async_execute_cloud_call=AsyncMock(side_effect=_passthrough_cloud_call),
+        async_request_confirmation_refresh=Mock(),
+        async_execute_device_call=AsyncMock(side_effect=_passthrough_device_call),
     )
     switch = object.__new__(WebastoConnectSwitch)
     switch.entity_id = "switch.test"
@@ -33,9 +39,10 @@ async def test_switch_turn_on_updates_listeners_without_refresh() -> None:
     await switch.async_turn_on()
 
     command_fn.assert_awaited_once_with(switch._cloud, switch._cloud.devices[1], True)
-    coordinator.async_execute_cloud_call.assert_awaited_once()
+    coordinator.async_execute_device_call.assert_awaited_once()
     coordinator.async_update_listeners.assert_called_once()
     coordinator.async_refresh.assert_not_called()
+    coordinator.async_request_confirmation_refresh.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -45,7 +52,8 @@ async def test_switch_turn_off_updates_listeners_without_refresh() -> None:
     coordinator = SimpleNamespace(
         async_update_listeners=Mock(),
         async_refresh=AsyncMock(),
-        async_execute_cloud_call=AsyncMock(side_effect=_passthrough_cloud_call),
+        async_request_confirmation_refresh=Mock(),
+        async_execute_device_call=AsyncMock(side_effect=_passthrough_device_call),
     )
     switch = object.__new__(WebastoConnectSwitch)
     switch.entity_id = "switch.test"
@@ -57,9 +65,10 @@ async def test_switch_turn_off_updates_listeners_without_refresh() -> None:
     await switch.async_turn_off()
 
     command_fn.assert_awaited_once_with(switch._cloud, switch._cloud.devices[1], False)
-    coordinator.async_execute_cloud_call.assert_awaited_once()
+    coordinator.async_execute_device_call.assert_awaited_once()
     coordinator.async_update_listeners.assert_called_once()
     coordinator.async_refresh.assert_not_called()
+    coordinator.async_request_confirmation_refresh.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -69,6 +78,7 @@ async def test_number_set_value_updates_listeners_without_refresh() -> None:
     coordinator = SimpleNamespace(
         async_update_listeners=Mock(),
         async_refresh=AsyncMock(),
+        async_request_confirmation_refresh=Mock(),
         async_execute_cloud_call=AsyncMock(side_effect=_passthrough_cloud_call),
     )
     number = object.__new__(WebastoConnectNumber)
@@ -84,3 +94,4 @@ async def test_number_set_value_updates_listeners_without_refresh() -> None:
     coordinator.async_execute_cloud_call.assert_awaited_once()
     coordinator.async_update_listeners.assert_called_once()
     coordinator.async_refresh.assert_not_called()
+    coordinator.async_request_confirmation_refresh.assert_called_once()